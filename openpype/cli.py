@@ -196,6 +196,28 @@ def publish(paths, targets, gui):
     PypeCommands.publish(list(paths), targets, gui)
 
 
+@main.command(
+    name="profile-startup",
+    context_settings={"ignore_unknown_options": True}
+)
+@click.argument("command_args", nargs=-1, type=click.UNPROCESSED)
+@click.option("-o", "--output-dir", default=".",
+              help="Directory where report is stored.")
+@click.option("-b", "--budget", default=None,
+              type=click.Path(exists=True),
+              help="Json file with startup budget. Fails when exceeded.")
+def profile_startup(command_args, output_dir, budget):
+    """Profile imports and startup of OpenPype command.
+
+    Stores json report with import times and time of startup phases and
+    flamegraph file in folded format.
+
+    Example: openpype_console profile-startup -o ./out -- module --help
+    """
+
+    PypeCommands.profile_startup(list(command_args), output_dir, budget)
+
+
 @main.command(context_settings={"ignore_unknown_options": True})
 def projectmanager():
     if AYON_SERVER_ENABLED:
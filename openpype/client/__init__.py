@@ -48,6 +48,12 @@ from .entities import (
     get_asset_name_identifier,
 )
 
+from .mongo.entity_cache import (
+    EntityCache,
+    entity_cache,
+    use_entity_cache,
+)
+
 from .entity_links import (
     get_linked_asset_ids,
     get_linked_assets,
@@ -105,6 +111,10 @@ __all__ = (
 
     "get_workfile_info",
 
+    "EntityCache",
+    "entity_cache",
+    "use_entity_cache",
+
     "get_linked_asset_ids",
     "get_linked_assets",
     "get_linked_representation_id",
@@ -13,6 +13,10 @@ import six
 from bson.objectid import ObjectId
 
 from .mongo import get_project_database, get_project_connection
+from .entity_cache import (
+    get_active_entity_cache,
+    apply_fields_projection,
+)
 
 PatternType = type(re.compile(""))
 
@@ -34,6 +38,82 @@ def _prepare_fields(fields, required_fields=None):
     return output
 
 
+def _get_filter_types(query_filter):
+    entity_type = query_filter["type"]
+    if isinstance(entity_type, dict):
+        return set(entity_type["$in"])
+    return {entity_type}
+
+
+def _find_one(
+    project_name, query_filter, fields, entity_id=None, natural_key=None
+):
+    """Find one document using active entity cache if there is any.
+
+    Args:
+        project_name (str): Name of project where to look for queried entity.
+        query_filter (dict[str, Any]): Query filter.
+        fields (Optional[Iterable[str]]): Fields that should be returned.
+        entity_id (Optional[ObjectId]): Id of entity if query is by id.
+        natural_key (Optional[tuple]): Natural key of entity if query is
+            by other keys than id.
+
+    Returns:
+        Union[dict[str, Any], None]: Found document.
+    """
+
+    conn = get_project_connection(project_name)
+    cache = get_active_entity_cache()
+    if cache is None:
+        return conn.find_one(query_filter, _prepare_fields(fields))
+
+    entity_types = _get_filter_types(query_filter)
+
+    def query_func():
+        return conn.find_one(query_filter)
+
+    if natural_key is not None:
+        return cache.find_one_by_key(
+            project_name, natural_key, entity_types, fields, query_func
+        )
+    return cache.find_one_by_id(
+        project_name, entity_id, entity_types, fields, query_func
+    )
+
+
+def _find(project_name, query_filter, fields):
+    """Find documents using active entity cache if there is any.
+
+    Cache is used only if documents are filtered by ids and type.
+
+    Args:
+        project_name (str): Name of project where to look for queried entity.
+        query_filter (dict[str, Any]): Query filter.
+        fields (Optional[Iterable[str]]): Fields that should be returned.
+
+    Returns:
+        Union[Cursor, list[dict[str, Any]]]: Found documents.
+    """
+
+    conn = get_project_connection(project_name)
+    cache = get_active_entity_cache()
+    if cache is None or set(query_filter.keys()) != {"type", "_id"}:
+        return conn.find(query_filter, _prepare_fields(fields))
+
+    def query_func(missing_ids):
+        _query_filter = dict(query_filter)
+        _query_filter["_id"] = {"$in": missing_ids}
+        return conn.find(_query_filter)
+
+    return cache.find_by_ids(
+        project_name,
+        query_filter["_id"]["$in"],
+        _get_filter_types(query_filter),
+        fields,
+        query_func
+    )
+
+
 def convert_id(in_id):
     """Helper function for conversion of id from string to ObjectId.
 
@@ -112,6 +192,31 @@ def get_project(project_name, active=True, inactive=True, fields=None):
     if not active and not inactive:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        conn = get_project_connection(project_name)
+        project_doc = cache.find_one_by_key(
+            project_name,
+            ("project", ),
+            {"project"},
+            None,
+            lambda: conn.find_one({"type": "project"})
+        )
+        if project_doc is None:
+            return None
+
+        # Apply active filter on cached document
+        is_active = project_doc.get("data", {}).get("active")
+        if (
+            (is_active is True and not active)
+            or (is_active is False and not inactive)
+        ):
+            return None
+
+        if fields:
+            return apply_fields_projection(project_doc, fields)
+        return project_doc
+
     query_filter = {"type": "project"}
     # Keep query untouched if both should be available
     if active and inactive:
@@ -170,8 +275,7 @@ def get_asset_by_id(project_name, asset_id, fields=None):
         return None
 
     query_filter = {"type": "asset", "_id": asset_id}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(project_name, query_filter, fields, entity_id=asset_id)
 
 
 def get_asset_by_name(project_name, asset_name, fields=None):
@@ -193,8 +297,12 @@ def get_asset_by_name(project_name, asset_name, fields=None):
         return None
 
     query_filter = {"type": "asset", "name": asset_name}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        natural_key=("asset", asset_name)
+    )
 
 
 # NOTE this could be just public function?
@@ -263,9 +371,7 @@ def _get_assets(
             return []
         query_filter["data.visualParent"] = {"$in": parent_ids}
 
-    conn = get_project_connection(project_name)
-
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find(project_name, query_filter, fields)
 
 
 def get_assets(
@@ -404,8 +510,7 @@ def get_subset_by_id(project_name, subset_id, fields=None):
         return None
 
     query_filters = {"type": "subset", "_id": subset_id}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filters, _prepare_fields(fields))
+    return _find_one(project_name, query_filters, fields, entity_id=subset_id)
 
 
 def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
@@ -435,8 +540,12 @@ def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
         "name": subset_name,
         "parent": asset_id
     }
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filters, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filters,
+        fields,
+        natural_key=("subset", asset_id, subset_name)
+    )
 
 
 def get_subsets(
@@ -508,8 +617,7 @@ def get_subsets(
             return []
         query_filter["$or"] = or_query
 
-    conn = get_project_connection(project_name)
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find(project_name, query_filter, fields)
 
 
 def get_subset_families(project_name, subset_ids=None):
@@ -571,8 +679,7 @@ def get_version_by_id(project_name, version_id, fields=None):
         "type": {"$in": ["version", "hero_version"]},
         "_id": version_id
     }
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(project_name, query_filter, fields, entity_id=version_id)
 
 
 def get_version_by_name(project_name, version, subset_id, fields=None):
@@ -595,13 +702,17 @@ def get_version_by_name(project_name, version, subset_id, fields=None):
     if not subset_id:
         return None
 
-    conn = get_project_connection(project_name)
     query_filter = {
         "type": "version",
         "parent": subset_id,
         "name": version
     }
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        natural_key=("version", subset_id, version)
+    )
 
 
 def version_is_latest(project_name, version_id):
@@ -685,9 +796,7 @@ def _get_versions(
         else:
             query_filter["name"] = {"$in": versions}
 
-    conn = get_project_connection(project_name)
-
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find(project_name, query_filter, fields)
 
 
 def get_versions(
@@ -969,6 +1078,18 @@ def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     if not subset_id:
         return None
 
+    cache = get_active_entity_cache()
+    if cache is not None:
+        return cache.find_one_by_key(
+            project_name,
+            ("last_version", subset_id),
+            {"version"},
+            fields,
+            lambda: get_last_versions(
+                project_name, subset_ids=[subset_id]
+            ).get(subset_id)
+        )
+
     last_versions = get_last_versions(
         project_name, subset_ids=[subset_id], fields=fields
     )
@@ -1039,11 +1160,12 @@ def get_representation_by_id(project_name, representation_id, fields=None):
         "type": {"$in": repre_types}
     }
     if representation_id is not None:
-        query_filter["_id"] = convert_id(representation_id)
-
-    conn = get_project_connection(project_name)
+        representation_id = convert_id(representation_id)
+        query_filter["_id"] = representation_id
 
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name, query_filter, fields, entity_id=representation_id
+    )
 
 
 def get_representation_by_name(
@@ -1074,8 +1196,12 @@ def get_representation_by_name(
         "parent": version_id
     }
 
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        natural_key=("representation", version_id, representation_name)
+    )
 
 
 def _flatten_dict(data):
@@ -1214,9 +1340,7 @@ def _get_representations(
             and_query.append(or_query)
         query_filter["$and"] = and_query
 
-    conn = get_project_connection(project_name)
-
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find(project_name, query_filter, fields)
 
 
 def get_representations(
@@ -0,0 +1,362 @@
+"""Opt-in cache of entity documents queried from database.
+
+Cache works as identity map of documents by their id and by natural keys
+(e.g. subset by asset id and name). Cache is not used unless is activated
+using context manager.
+
+```python
+with EntityCache() as cache:
+    asset_doc = get_asset_by_name(project_name, "sh010")
+    # Document is not queried again
+    asset_doc = get_asset_by_id(project_name, asset_doc["_id"])
+
+print(cache.hits, cache.misses)
+```
+
+Documents are returned as copies so they can be modified. Cached documents
+of a project are invalidated when 'OperationsSession' commits changes
+to the project.
+
+Cache is active only in the thread which activated it, other threads
+(e.g. of webserver or sync server) don't use it.
+"""
+
+import copy
+import functools
+import threading
+import contextlib
+
+# Active caches of all threads used for invalidation
+_ACTIVE_CACHES = []
+_ACTIVE_LOCK = threading.Lock()
+# Stack of caches activated in current thread
+_THREAD_STATE = threading.local()
+_NOT_SET = object()
+
+
+def _get_thread_caches():
+    caches = getattr(_THREAD_STATE, "caches", None)
+    if caches is None:
+        caches = []
+        _THREAD_STATE.caches = caches
+    return caches
+
+
+def _remove_last(caches, cache):
+    for idx in reversed(range(len(caches))):
+        if caches[idx] is cache:
+            caches.pop(idx)
+            break
+
+
+def get_active_entity_cache():
+    """Entity cache active in current thread.
+
+    Returns:
+        Union[EntityCache, None]: Active cache or None.
+    """
+
+    caches = _get_thread_caches()
+    if caches:
+        return caches[-1]
+    return None
+
+
+def invalidate_entity_cache(project_name):
+    """Invalidate documents of project in active caches of all threads.
+
+    Args:
+        project_name (str): Name of project which was changed.
+    """
+
+    with _ACTIVE_LOCK:
+        caches = list(_ACTIVE_CACHES)
+    for cache in caches:
+        cache.clear_project(project_name)
+
+
+@contextlib.contextmanager
+def entity_cache():
+    """Make sure entity cache is active.
+
+    Already active cache is used, new cache is created otherwise.
+
+    Yields:
+        EntityCache: Active entity cache.
+    """
+
+    cache = get_active_entity_cache()
+    if cache is not None:
+        yield cache
+        return
+
+    with EntityCache() as cache:
+        yield cache
+
+
+def use_entity_cache(func):
+    """Decorator making sure entity cache is active during function call."""
+
+    @functools.wraps(func)
+    def decorated(*args, **kwargs):
+        with entity_cache():
+            return func(*args, **kwargs)
+    return decorated
+
+
+def _project_document(doc, fields):
+    output = {"_id": doc["_id"]}
+    for field in fields:
+        src = doc
+        dst = output
+        keys = field.split(".")
+        last_key = keys.pop(-1)
+        for key in keys:
+            if not isinstance(src, dict):
+                return None
+            src = src.get(key, _NOT_SET)
+            if src is _NOT_SET:
+                break
+            if isinstance(src, list):
+                # Projection through arrays is not supported
+                return None
+            dst = dst.setdefault(key, {})
+        else:
+            if not isinstance(src, dict):
+                return None
+            value = src.get(last_key, _NOT_SET)
+            if value is not _NOT_SET:
+                dst[last_key] = copy.deepcopy(value)
+    return output
+
+
+def apply_fields_projection(doc, fields):
+    """Apply projection of 'fields' to document.
+
+    Full copy of document is returned if projection goes through arrays.
+
+    Args:
+        doc (dict[str, Any]): Full document.
+        fields (Iterable[str]): Fields that should be returned.
+
+    Returns:
+        dict[str, Any]: Projected copy of document.
+    """
+
+    output = _project_document(doc, fields)
+    if output is None:
+        output = copy.deepcopy(doc)
+    return output
+
+
+def _get_natural_key(doc):
+    entity_type = doc.get("type")
+    if entity_type in ("project", ):
+        return (entity_type, )
+
+    if entity_type == "asset":
+        return (entity_type, doc.get("name"))
+
+    if entity_type in ("subset", "version", "representation"):
+        return (entity_type, doc.get("parent"), doc.get("name"))
+    return None
+
+
+class EntityCache(object):
+    """Identity map of entity documents.
+
+    Documents are stored by project name and their id. Natural keys point
+    to document ids, or to None if document does not exist.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._docs_by_id = {}
+        self._ids_by_key = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        _get_thread_caches().append(self)
+        with _ACTIVE_LOCK:
+            _ACTIVE_CACHES.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        # Remove last occurrence of the cache
+        _remove_last(_get_thread_caches(), self)
+        with _ACTIVE_LOCK:
+            _remove_last(_ACTIVE_CACHES, self)
+
+    def get_stats(self):
+        """Statistics of cache usage.
+
+        Returns:
+            dict[str, int]: Hits and misses count.
+        """
+
+        return {"hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        with self._lock:
+            self._docs_by_id.clear()
+            self._ids_by_key.clear()
+
+    def clear_project(self, project_name):
+        """Remove all documents of project from cache."""
+        with self._lock:
+            for cache in (self._docs_by_id, self._ids_by_key):
+                for key in tuple(cache.keys()):
+                    if key[0] == project_name:
+                        cache.pop(key)
+
+    def add_documents(self, project_name, docs):
+        """Store full documents queried from database.
+
+        Args:
+            project_name (str): Name of project.
+            docs (Iterable[dict[str, Any]]): Documents with all fields.
+        """
+
+        with self._lock:
+            for doc in docs:
+                self._add_document(project_name, doc)
+
+    def _add_document(self, project_name, doc):
+        doc = copy.deepcopy(doc)
+        self._docs_by_id[(project_name, doc["_id"])] = doc
+        natural_key = _get_natural_key(doc)
+        if natural_key is not None:
+            self._ids_by_key[(project_name, natural_key)] = doc["_id"]
+
+    def _output_document(self, doc, entity_types, fields):
+        """Prepare copy of cached document for output.
+
+        Full document is returned if projection goes through arrays.
+        """
+
+        if doc is None:
+            return None
+
+        if entity_types and doc.get("type") not in entity_types:
+            return None
+
+        if fields:
+            return apply_fields_projection(doc, fields)
+        return copy.deepcopy(doc)
+
+    def find_one_by_id(
+        self, project_name, entity_id, entity_types, fields, query_func
+    ):
+        """Document by id from cache or from database.
+
+        Args:
+            project_name (str): Name of project.
+            entity_id (ObjectId): Id of document.
+            entity_types (Iterable[str]): Allowed types of document.
+            fields (Optional[Iterable[str]]): Fields that should be returned.
+            query_func (Callable[[], Union[dict, None]]): Query of full
+                document from database.
+
+        Returns:
+            Union[dict[str, Any], None]: Found document.
+        """
+
+        with self._lock:
+            doc = self._docs_by_id.get((project_name, entity_id))
+
+        if doc is not None:
+            self.hits += 1
+            return self._output_document(doc, entity_types, fields)
+
+        self.misses += 1
+        doc = query_func()
+        if doc is None:
+            return None
+
+        with self._lock:
+            self._add_document(project_name, doc)
+        return self._output_document(doc, entity_types, fields)
+
+    def find_one_by_key(
+        self, project_name, natural_key, entity_types, fields, query_func
+    ):
+        """Document by natural key from cache or from database.
+
+        Args:
+            project_name (str): Name of project.
+            natural_key (tuple): Natural key of document.
+            entity_types (Iterable[str]): Allowed types of document.
+            fields (Optional[Iterable[str]]): Fields that should be returned.
+            query_func (Callable[[], Union[dict, None]]): Query of full
+                document from database.
+
+        Returns:
+            Union[dict[str, Any], None]: Found document.
+        """
+
+        cache_key = (project_name, natural_key)
+        with self._lock:
+            entity_id = self._ids_by_key.get(cache_key, _NOT_SET)
+            doc = None
+            if entity_id is not None and entity_id is not _NOT_SET:
+                doc = self._docs_by_id.get((project_name, entity_id))
+                if doc is None:
+                    entity_id = _NOT_SET
+
+        if entity_id is not _NOT_SET:
+            self.hits += 1
+            return self._output_document(doc, entity_types, fields)
+
+        self.misses += 1
+        doc = query_func()
+        with self._lock:
+            if doc is None:
+                self._ids_by_key[cache_key] = None
+            else:
+                self._add_document(project_name, doc)
+                self._ids_by_key[cache_key] = doc["_id"]
+        return self._output_document(doc, entity_types, fields)
+
+    def find_by_ids(
+        self, project_name, entity_ids, entity_types, fields, query_func
+    ):
+        """Documents by ids from cache, missing are queried from database.
+
+        Args:
+            project_name (str): Name of project.
+            entity_ids (Iterable[ObjectId]): Ids of documents.
+            entity_types (Iterable[str]): Allowed types of documents.
+            fields (Optional[Iterable[str]]): Fields that should be returned.
+            query_func (Callable[[list[ObjectId]], Iterable[dict]]): Query
+                of full documents from database by ids.
+
+        Returns:
+            list[dict[str, Any]]: Found documents.
+        """
+
+        output = []
+        missing_ids = []
+        with self._lock:
+            for entity_id in entity_ids:
+                doc = self._docs_by_id.get((project_name, entity_id))
+                if doc is None:
+                    missing_ids.append(entity_id)
+                    continue
+
+                self.hits += 1
+                doc = self._output_document(doc, entity_types, fields)
+                if doc is not None:
+                    output.append(doc)
+
+        if not missing_ids:
+            return output
+
+        self.misses += len(missing_ids)
+        docs = list(query_func(missing_ids))
+        self.add_documents(project_name, docs)
+        for doc in docs:
+            doc = self._output_document(doc, entity_types, fields)
+            if doc is not None:
+                output.append(doc)
+        return output
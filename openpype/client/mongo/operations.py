@@ -14,6 +14,7 @@ from openpype.client.operations_base import (
 )
 from .mongo import get_project_connection
 from .entities import get_project
+from .entity_cache import invalidate_entity_cache
 
 
 PROJECT_NAME_ALLOWED_SYMBOLS = "a-zA-Z0-9_"
@@ -505,6 +506,7 @@ class MongoOperationsSession(BaseOperationsSession):
             if bulk_writes:
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
+                invalidate_entity_cache(project_name)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
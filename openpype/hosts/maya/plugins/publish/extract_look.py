@@ -7,6 +7,7 @@ import contextlib
 import json
 import logging
 import os
+import platform
 import tempfile
 import six
 import attr
@@ -23,9 +24,12 @@ from openpype.lib import (
     ToolNotFoundError,
 )
 
-from openpype.pipeline import legacy_io, publish, KnownPublishError
+from openpype.pipeline import publish, KnownPublishError
+from openpype.pipeline.publish import (
+    find_source_hash_items,
+    get_files_content_hashes,
+)
 from openpype.hosts.maya.api import lib
-from openpype import AYON_SERVER_ENABLED
 
 # Modes for transfer
 COPY = 1
@@ -46,28 +50,6 @@ class TextureResult(object):
     transfer_mode = attr.ib()
 
 
-def find_paths_by_hash(texture_hash):
-    """Find the texture hash key in the dictionary.
-
-    All paths that originate from it.
-
-    Args:
-        texture_hash (str): Hash of the texture.
-
-    Return:
-        str: path to texture if found.
-
-    """
-    if AYON_SERVER_ENABLED:
-        raise KnownPublishError(
-            "This is a bug. \"find_paths_by_hash\" is not compatible with "
-            "AYON."
-        )
-
-    key = "data.sourceHashes.{0}".format(texture_hash)
-    return legacy_io.distinct(key, {"type": "version"})
-
-
 @contextlib.contextmanager
 def no_workspace_dir():
     """Force maya to a fake temporary workspace directory.
@@ -109,6 +91,44 @@ class TextureProcessor:
         if log is None:
             log = logging.getLogger(self.__class__.__name__)
         self.log = log
+        # Content digests of source files by path
+        self.content_hashes = {}
+
+    def get_source_hash(self, source, *args):
+        """Hash of source file and processing arguments.
+
+        Content digest is used if was calculated for the source otherwise
+        'openpype.lib.source_hash' is used.
+
+        Args:
+            source (str): Path to source file.
+            *args (str): Processing arguments.
+
+        Returns:
+            str: Hash of source.
+        """
+        content_hash = self.content_hashes.get(source)
+        if content_hash:
+            return "|".join([content_hash] + list(args))
+        return source_hash(source, *args)
+
+    def get_texture_hash(self, source, colorspace, color_management):
+        """Hash of texture which would be processed from source.
+
+        Hash is used to find already published result of the processing,
+        so processing can be skipped.
+
+        Args:
+            source (str): Path to source file.
+            colorspace (str): Colorspace of the source file.
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            Union[str, None]: Hash or None if processor can't reuse
+                published textures.
+        """
+        return None
 
     def apply_settings(self, system_settings, project_settings):
         """Apply OpenPype system/project settings to the TextureProcessor
@@ -160,6 +180,9 @@ class MakeRSTexBin(TextureProcessor):
 
     extension = ".rstexbin"
 
+    def get_texture_hash(self, source, colorspace, color_management):
+        return self.get_source_hash(source, "rstex")
+
     def process(self,
                 source,
                 colorspace,
@@ -195,8 +218,9 @@ class MakeRSTexBin(TextureProcessor):
                            "colorspace".format(colorspace))
             subprocess_args.extend(["-cs", colorspace])
 
-        hash_args = ["rstex"]
-        texture_hash = source_hash(source, *hash_args)
+        texture_hash = self.get_texture_hash(
+            source, colorspace, color_management
+        )
 
         # Redshift stores the output texture next to the input but with
         # the extension replaced to `.rstexbin`
@@ -276,6 +300,56 @@ class MakeTX(TextureProcessor):
 
         self.extra_args = extra_args
 
+    def get_texture_hash(self, source, colorspace, color_management):
+        if os.path.splitext(source)[1] == ".tx":
+            return None
+        args, _ = self._get_conversion_args(
+            source, colorspace, color_management
+        )
+        # Note: The texture hash is only reliable if we include any potential
+        # conversion arguments provide to e.g. `maketx`
+        hash_args = ["maketx"] + args + self.extra_args
+        return self.get_source_hash(source, *hash_args)
+
+    def _get_conversion_args(self, source, colorspace, color_management):
+        """Conversion arguments of maketx and resulting colorspace.
+
+        Returns:
+            tuple[list[str], str]: Arguments and render colorspace.
+        """
+
+        # Hardcoded default arguments for maketx conversion based on Arnold's
+        # txManager in Maya
+        args = [
+            # unpremultiply before conversion (recommended when alpha present)
+            "--unpremult",
+            # use oiio-optimized settings for tile-size, planarconfig, metadata
+            "--oiio",
+            "--filter", "lanczos3",
+        ]
+        if color_management["enabled"]:
+            config_path = color_management["config"]
+            if not os.path.exists(config_path):
+                raise RuntimeError("OCIO config not found at: "
+                                   "{}".format(config_path))
+
+            render_colorspace = color_management["rendering_space"]
+
+            self.log.debug("tx: converting colorspace {0} "
+                          "-> {1}".format(colorspace,
+                                          render_colorspace))
+            args.extend(["--colorconvert", colorspace, render_colorspace])
+            args.extend(["--colorconfig", config_path])
+
+        else:
+            # Maya Color management is disabled. We cannot rely on an OCIO
+            self.log.debug("tx: Maya color management is disabled. No color "
+                           "conversion will be applied to .tx conversion for: "
+                           "{}".format(source))
+            # Assume linear
+            render_colorspace = "linear"
+        return args, render_colorspace
+
     def process(self,
                 source,
                 colorspace,
@@ -310,46 +384,17 @@ class MakeTX(TextureProcessor):
             # Do nothing if the source file is already a .tx file.
             return TextureResult(
                 path=source,
-                file_hash=source_hash(source),
+                file_hash=self.get_source_hash(source),
                 colorspace=colorspace,
                 transfer_mode=COPY
             )
 
-        # Hardcoded default arguments for maketx conversion based on Arnold's
-        # txManager in Maya
-        args = [
-            # unpremultiply before conversion (recommended when alpha present)
-            "--unpremult",
-            # use oiio-optimized settings for tile-size, planarconfig, metadata
-            "--oiio",
-            "--filter", "lanczos3",
-        ]
-        if color_management["enabled"]:
-            config_path = color_management["config"]
-            if not os.path.exists(config_path):
-                raise RuntimeError("OCIO config not found at: "
-                                   "{}".format(config_path))
-
-            render_colorspace = color_management["rendering_space"]
-
-            self.log.debug("tx: converting colorspace {0} "
-                          "-> {1}".format(colorspace,
-                                          render_colorspace))
-            args.extend(["--colorconvert", colorspace, render_colorspace])
-            args.extend(["--colorconfig", config_path])
-
-        else:
-            # Maya Color management is disabled. We cannot rely on an OCIO
-            self.log.debug("tx: Maya color management is disabled. No color "
-                           "conversion will be applied to .tx conversion for: "
-                           "{}".format(source))
-            # Assume linear
-            render_colorspace = "linear"
-
-        # Note: The texture hash is only reliable if we include any potential
-        # conversion arguments provide to e.g. `maketx`
-        hash_args = ["maketx"] + args + self.extra_args
-        texture_hash = source_hash(source, *hash_args)
+        args, render_colorspace = self._get_conversion_args(
+            source, colorspace, color_management
+        )
+        texture_hash = self.get_texture_hash(
+            source, colorspace, color_management
+        )
 
         # Ensure folder exists
         resources_dir = os.path.join(staging_dir, "resources")
@@ -428,6 +473,10 @@ class ExtractLook(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.2
     scene_type = "ma"
     look_data_type = "json"
+    # Reuse textures published before found in source hashes index
+    use_source_hash_index = False
+    # Use digest of file content for source hashes
+    content_hash = False
 
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
@@ -507,6 +556,7 @@ class ExtractLook(publish.Extractor):
         transfers = results["fileTransfers"]
         hardlinks = results["fileHardlinks"]
         hashes = results["fileHashes"]
+        hash_items = results["fileHashItems"]
         remap = results["attrRemap"]
 
         # Extract in correct render layer
@@ -581,6 +631,7 @@ class ExtractLook(publish.Extractor):
 
         # Source hash for the textures
         instance.data["sourceHashes"] = hashes
+        instance.data["sourceHashItems"] = hash_items
 
         self.log.debug("Extracted instance '%s' to: %s" % (instance.name,
                                                            maya_path))
@@ -613,13 +664,13 @@ class ExtractLook(publish.Extractor):
 
         resources = instance.data["resources"]
         color_management = lib.get_color_management_preferences()
+        project_name = instance.context.data["projectName"]
 
-        # TODO: Temporary disable all hardlinking, due to the feature not being
-        # used or properly working.
-        self.log.info(
-            "Forcing copy instead of hardlink."
-        )
-        force_copy = True
+        force_copy = not self.use_source_hash_index
+        if force_copy:
+            self.log.info(
+                "Forcing copy instead of hardlink."
+            )
 
         if not force_copy and platform.system().lower() == "windows":
             # Temporary fix to NOT create hardlinks on windows machines
@@ -628,6 +679,27 @@ class ExtractLook(publish.Extractor):
             )
             force_copy = True
 
+        content_hashes = {}
+        if self.content_hash:
+            content_hashes = get_files_content_hashes(
+                os.path.normpath(filepath)
+                for resource in resources
+                for filepath in resource["files"]
+            )
+            for processor in processors:
+                processor.content_hashes = content_hashes
+
+        # Query already published textures of all resources at once
+        existing_textures = {}
+        if not force_copy:
+            existing_textures = self._get_existing_hashed_textures(
+                resources,
+                processors,
+                color_management,
+                project_name,
+                content_hashes
+            )
+
         destinations_cache = {}
 
         def get_resource_destination_cached(path):
@@ -643,6 +715,7 @@ class ExtractLook(publish.Extractor):
         transfers = []
         hardlinks = []
         hashes = {}
+        hash_items = {}
         remap = OrderedDict()
         for resource in resources:
             colorspace = resource["color_space"]
@@ -684,7 +757,9 @@ class ExtractLook(publish.Extractor):
                     staging_dir=staging_dir,
                     force_copy=force_copy,
                     color_management=color_management,
-                    colorspace=colorspace
+                    colorspace=colorspace,
+                    existing_textures=existing_textures,
+                    content_hashes=content_hashes
                 )
 
                 # Set the resulting color space on the resource
@@ -711,6 +786,10 @@ class ExtractLook(publish.Extractor):
                 # Store the hashes from hash to destination to include in the
                 # database
                 hashes[texture_result.file_hash] = destination
+                hash_items[texture_result.file_hash] = {
+                    "path": destination,
+                    "colorspace": texture_result.colorspace,
+                }
 
             # Set up remapping attributes for the node during the publish
             # The order of these can be important if one attribute directly
@@ -743,6 +822,7 @@ class ExtractLook(publish.Extractor):
             "fileTransfers": transfers,
             "fileHardlinks": hardlinks,
             "fileHashes": hashes,
+            "fileHashItems": hash_items,
             "attrRemap": remap,
         }
 
@@ -779,21 +859,51 @@ class ExtractLook(publish.Extractor):
             resources_dir, basename + ext
         )
 
-    def _get_existing_hashed_texture(self, texture_hash):
-        """Return the first found filepath from a texture hash"""
-
-        # If source has been published before with the same settings,
-        # then don't reprocess but hardlink from the original
-        existing = find_paths_by_hash(texture_hash)
-        if existing:
-            source = next((p for p in existing if os.path.exists(p)), None)
-            if source:
-                return source
-            else:
-                self.log.warning(
-                    "Paths not found on disk, "
-                    "skipping hardlink: {}".format(existing)
-                )
+    def _get_texture_hash(
+        self, filepath, processors, colorspace, color_management,
+        content_hashes=None
+    ):
+        if processors:
+            return processors[0].get_texture_hash(
+                filepath, colorspace, color_management
+            )
+        content_hash = (content_hashes or {}).get(filepath)
+        return content_hash or source_hash(filepath)
+
+    def _get_existing_hashed_textures(
+        self, resources, processors, color_management, project_name,
+        content_hashes=None
+    ):
+        """Find already published textures of resources by their hashes.
+
+        All hashes are queried from the source hashes index at once.
+
+        Returns:
+            dict[str, dict[str, Any]]: Published texture data with 'path'
+                and 'colorspace' keys by texture hash.
+        """
+
+        if not project_name:
+            return {}
+
+        texture_hashes = set()
+        for resource in resources:
+            for filepath in resource["files"]:
+                texture_hashes.add(self._get_texture_hash(
+                    os.path.normpath(filepath),
+                    processors,
+                    resource["color_space"],
+                    color_management,
+                    content_hashes
+                ))
+
+        return {
+            texture_hash: item
+            for texture_hash, item in find_source_hash_items(
+                project_name, texture_hashes
+            ).items()
+            if os.path.exists(item["path"])
+        }
 
     def _process_texture(self,
                          filepath,
@@ -801,7 +911,9 @@ class ExtractLook(publish.Extractor):
                          staging_dir,
                          force_copy,
                          color_management,
-                         colorspace):
+                         colorspace,
+                         existing_textures=None,
+                         content_hashes=None):
         """Process a single texture file on disk for publishing.
 
         This will:
@@ -822,6 +934,10 @@ class ExtractLook(publish.Extractor):
                 `lib.get_color_management_preferences`
             colorspace (str): The source colorspace of the resources this
                 texture belongs to.
+            existing_textures (Optional[dict[str, dict[str, Any]]]): Already
+                published textures by texture hash.
+            content_hashes (Optional[dict[str, str]]): Content digests of
+                source files by path.
 
         Returns:
             TextureResult: The texture result information.
@@ -833,6 +949,31 @@ class ExtractLook(publish.Extractor):
                 "Current processors enabled: {}".format(processors)
             )
 
+        content_hash = (content_hashes or {}).get(filepath)
+        texture_hash = content_hash or source_hash(filepath)
+        if not force_copy:
+            texture_hash = self._get_texture_hash(
+                filepath,
+                processors,
+                colorspace,
+                color_management,
+                content_hashes
+            )
+            # If source has been published before with the same settings,
+            # then don't reprocess but hardlink from the original
+            existing = (existing_textures or {}).get(texture_hash)
+            if existing:
+                self.log.debug(
+                    "Found hash in database, preparing hardlink of "
+                    "published texture: {}".format(existing["path"])
+                )
+                return TextureResult(
+                    path=existing["path"],
+                    file_hash=texture_hash,
+                    colorspace=existing.get("colorspace") or colorspace,
+                    transfer_mode=HARDLINK
+                )
+
         for processor in processors:
             self.log.debug("Processing texture {} with processor {}".format(
                 filepath, processor
@@ -848,23 +989,9 @@ class ExtractLook(publish.Extractor):
             self.log.debug("Generated processed "
                            "texture: {}".format(processed_result.path))
 
-            # TODO: Currently all processors force copy instead of allowing
-            #       hardlinks using source hashes. This should be refactored
             return processed_result
 
         # No texture processing for this file
-        texture_hash = source_hash(filepath)
-        if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
-            if existing:
-                self.log.debug("Found hash in database, preparing hardlink..")
-                return TextureResult(
-                    path=filepath,
-                    file_hash=texture_hash,
-                    colorspace=colorspace,
-                    transfer_mode=HARDLINK
-                )
-
         return TextureResult(
             path=filepath,
             file_hash=texture_hash,
@@ -60,6 +60,7 @@ from .execute import (
     get_linux_launcher_args,
     execute,
     run_subprocess,
+    run_subprocesses,
     run_detached_process,
     run_ayon_launcher_process,
     run_openpype_process,
@@ -76,6 +77,7 @@ from .path_templates import (
     TemplateMissingKey,
     TemplateUnsolved,
     StringTemplate,
+    SequenceTemplateFormatter,
     TemplatesDict,
     FormatObject,
 )
@@ -97,7 +99,9 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    ProfilesIndex,
+    get_profiles_index,
 )
 
 from .transcoding import (
@@ -150,11 +154,18 @@ from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    create_file_link,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
 )
 
+from .sequence_index import (
+    DirectorySequenceIndex,
+    parse_sequence_filename,
+    get_directory_sequence_index,
+)
+
 from .openpype_version import (
     op_version_control_available,
     get_openpype_version,
@@ -183,6 +194,7 @@ __all__ = [
     "get_linux_launcher_args",
     "execute",
     "run_subprocess",
+    "run_subprocesses",
     "run_detached_process",
     "run_ayon_launcher_process",
     "run_openpype_process",
@@ -259,6 +271,8 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "ProfilesIndex",
+    "get_profiles_index",
 
     "prepare_template_data",
     "source_hash",
@@ -266,14 +280,20 @@ __all__ = [
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "create_file_link",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
 
+    "DirectorySequenceIndex",
+    "parse_sequence_filename",
+    "get_directory_sequence_index",
+
     "merge_dict",
     "TemplateMissingKey",
     "TemplateUnsolved",
     "StringTemplate",
+    "SequenceTemplateFormatter",
     "TemplatesDict",
     "FormatObject",
 
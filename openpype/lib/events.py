@@ -172,6 +172,8 @@ class EventCallback(object):
         self._topic = topic
         self._order = order
         self._enabled = True
+        # Weak reference to function called when order changes
+        self._order_changed_ref = None
         # Replace '*' with any character regex and escape rest of text
         #   - when callback is registered for '*' topic it will receive all
         #       events
@@ -221,6 +223,16 @@ class EventCallback(object):
             self.__class__.__name__, self._name, self._path
         )
 
+    @property
+    def topic(self):
+        """Topic to which callback listens.
+
+        Returns:
+            str: Topic which may contain '*'.
+        """
+
+        return self._topic
+
     @property
     def log(self):
         if self._log is None:
@@ -293,6 +305,10 @@ class EventCallback(object):
 
         self._validate_order(order)
         self._order = order
+        if self._order_changed_ref is not None:
+            on_order_changed = self._order_changed_ref()
+            if on_order_changed is not None:
+                on_order_changed()
 
     order = property(get_order, set_order)
 
@@ -315,6 +331,16 @@ class EventCallback(object):
             event(Event): Event that was triggered.
         """
 
+        if self.topic_matches(event.topic):
+            self._process_matched_event(event)
+
+    def _process_matched_event(self, event):
+        """Process event which has topic matching the callback's topic.
+
+        Args:
+            event(Event): Event that was triggered.
+        """
+
         # Skip if callback is not enabled
         if not self._enabled:
             return
@@ -324,9 +350,6 @@ class EventCallback(object):
         if callback is None:
             return
 
-        if not self.topic_matches(event.topic):
-            return
-
         # Try to execute callback
         try:
             if self._expect_args:
@@ -488,6 +511,16 @@ class Event(object):
         return obj
 
 
+class _TopicPrefixNode(object):
+    """Node of prefix tree of callbacks with wildcard topics."""
+
+    __slots__ = ("children", "callbacks")
+
+    def __init__(self):
+        self.children = {}
+        self.callbacks = []
+
+
 class EventSystem(object):
     """Encapsulate event handling into an object.
 
@@ -498,12 +531,22 @@ class EventSystem(object):
     Callbacks are stored by order of their registration, but it is possible to
     manually define order of callbacks using 'order' argument within
     'add_callback'.
+
+    Callbacks are indexed by exact topic, callbacks with wildcard topics
+    are indexed in prefix tree by part of topic before first '*'. Ordered
+    callbacks matching a topic are cached until callbacks change.
     """
 
     default_order = 100
+    # Maximum number of topics with cached callbacks
+    topic_cache_limit = 1000
 
     def __init__(self):
         self._registered_callbacks = []
+        self._callbacks_by_topic = collections.defaultdict(list)
+        self._wildcard_root = _TopicPrefixNode()
+        self._sorted_callbacks = None
+        self._callbacks_by_topic_cache = {}
 
     def add_callback(self, topic, callback, order=None):
         """Register callback in event system.
@@ -524,7 +567,10 @@ class EventSystem(object):
             order = self.default_order
 
         callback = EventCallback(topic, callback, order)
+        callback._order_changed_ref = _get_func_ref(self._on_order_change)
         self._registered_callbacks.append(callback)
+        self._index_callback(callback)
+        self._invalidate_callbacks_cache()
         return callback
 
     def create_event(self, topic, data, source):
@@ -559,6 +605,27 @@ class EventSystem(object):
         event.emit()
         return event
 
+    def emit_many(self, items):
+        """Create events based on passed data and emit them.
+
+        Events are emitted in passed order. Result is same as calling 'emit'
+        for each item, but invalid callbacks are removed only once.
+
+        Args:
+            items (Iterable[tuple[str, dict, str]]): Topic, data and source
+                of each event.
+
+        Returns:
+            list[Event]: Created and emitted events.
+        """
+
+        events = [
+            self.create_event(topic, data, source)
+            for topic, data, source in items
+        ]
+        self.emit_events(events)
+        return events
+
     def emit_event(self, event):
         """Emit event object.
 
@@ -568,6 +635,93 @@ class EventSystem(object):
 
         self._process_event(event)
 
+    def emit_events(self, events):
+        """Emit multiple event objects.
+
+        Args:
+            events (Iterable[Event]): Prepared events with topic and data.
+        """
+
+        self._process_events(events)
+
+    def _index_callback(self, callback):
+        topic = callback.topic
+        if "*" not in topic:
+            self._callbacks_by_topic[topic].append(callback)
+            return
+
+        node = self._wildcard_root
+        for char in topic.split("*")[0]:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TopicPrefixNode()
+            node = child
+        node.callbacks.append(callback)
+
+    def _on_order_change(self):
+        self._invalidate_callbacks_cache()
+
+    def _invalidate_callbacks_cache(self):
+        self._sorted_callbacks = None
+        self._callbacks_by_topic_cache = {}
+
+    def _get_sorted_callbacks(self):
+        if self._sorted_callbacks is None:
+            self._sorted_callbacks = tuple(sorted(
+                self._registered_callbacks, key=lambda x: x.order
+            ))
+        return self._sorted_callbacks
+
+    def _get_topic_callbacks(self, topic):
+        """Callbacks matching topic sorted by order.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            tuple[EventCallback]: Callbacks matching topic.
+        """
+
+        callbacks = self._callbacks_by_topic_cache.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        matching = set(self._callbacks_by_topic.get(topic, []))
+        node = self._wildcard_root
+        idx = 0
+        while node is not None:
+            for callback in node.callbacks:
+                if callback.topic_matches(topic):
+                    matching.add(callback)
+            if idx >= len(topic):
+                break
+            node = node.children.get(topic[idx])
+            idx += 1
+
+        callbacks = tuple(
+            callback
+            for callback in self._get_sorted_callbacks()
+            if callback in matching
+        )
+        if len(self._callbacks_by_topic_cache) >= self.topic_cache_limit:
+            self._callbacks_by_topic_cache = {}
+        self._callbacks_by_topic_cache[topic] = callbacks
+        return callbacks
+
+    def _remove_invalid_callbacks(self):
+        """Remove callbacks which are not valid anymore."""
+
+        self._registered_callbacks = [
+            callback
+            for callback in self._registered_callbacks
+            if callback.is_ref_valid
+        ]
+        self._callbacks_by_topic = collections.defaultdict(list)
+        self._wildcard_root = _TopicPrefixNode()
+        for callback in self._registered_callbacks:
+            self._index_callback(callback)
+        self._invalidate_callbacks_cache()
+
     def _process_event(self, event):
         """Process event topic and trigger callbacks.
 
@@ -575,13 +729,24 @@ class EventSystem(object):
             event (Event): Prepared event with topic and data.
         """
 
-        callbacks = tuple(sorted(
-            self._registered_callbacks, key=lambda x: x.order
-        ))
-        for callback in callbacks:
-            callback.process_event(event)
-            if not callback.is_ref_valid:
-                self._registered_callbacks.remove(callback)
+        self._process_events((event, ))
+
+    def _process_events(self, events):
+        """Process events and trigger callbacks.
+
+        Args:
+            events (Iterable[Event]): Prepared events with topic and data.
+        """
+
+        has_invalid = False
+        for event in events:
+            for callback in self._get_topic_callbacks(event.topic):
+                callback._process_matched_event(event)
+                if not callback.is_ref_valid:
+                    has_invalid = True
+
+        if has_invalid:
+            self._remove_invalid_callbacks()
 
 
 class QueuedEventSystem(EventSystem):
@@ -653,6 +818,20 @@ class QueuedEventSystem(EventSystem):
             return
 
         self._event_queue.append(event)
+        self._process_queue()
+
+    def emit_events(self, events):
+        """Emit multiple event objects.
+
+        Args:
+           events (Iterable[Event]): Prepared events with topic and data.
+        """
+
+        self._event_queue.extend(events)
+        if self._auto_execute and self._current_event is None:
+            self._process_queue()
+
+    def _process_queue(self):
         while self._event_queue:
             event = self._event_queue.popleft()
             self._current_event = event
@@ -1,13 +1,18 @@
 import os
 import sys
+import time
 import subprocess
 import platform
 import json
 import tempfile
+import threading
+import collections
+import multiprocessing
 
 from openpype import AYON_SERVER_ENABLED
 
 from .log import Logger
+from .profiling import record_subprocess_time
 from .vendor_bin_utils import find_executable
 
 from .openpype_version import is_running_from_build
@@ -78,28 +83,12 @@ def execute(args,
     return popen.returncode
 
 
-def run_subprocess(*args, **kwargs):
-    """Convenience method for getting output errors for subprocess.
-
-    Output logged when process finish.
-
-    Entered arguments and keyword arguments are passed to subprocess Popen.
-
-    On windows are 'creationflags' filled with flags that should cause ignore
-    creation of new window.
-
-    Args:
-        *args: Variable length argument list passed to Popen.
-        **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
-            pass `logging.Logger` object under "logger" to use custom logger
-            for output.
+def _prepare_subprocess_kwargs(kwargs):
+    """Prepare keyword arguments for Popen used by 'run_subprocess'.
 
     Returns:
-        str: Full output of subprocess concatenated stdout and stderr.
-
-    Raises:
-        RuntimeError: Exception is raised if process finished with nonzero
-            return code.
+        tuple[dict[str, Any], logging.Logger]: Popen keyword arguments
+            and logger.
     """
 
     # Modify creation flags on windows to hide console window if in UI mode
@@ -133,11 +122,21 @@ def run_subprocess(*args, **kwargs):
     kwargs["stderr"] = kwargs.get("stderr", subprocess.PIPE)
     kwargs["stdin"] = kwargs.get("stdin", subprocess.PIPE)
     kwargs["env"] = filtered_env
+    return kwargs, logger
 
-    proc = subprocess.Popen(*args, **kwargs)
+
+def _process_subprocess_output(args, proc, _stdout, _stderr, logger):
+    """Log output of finished process and validate return code.
+
+    Returns:
+        str: Full output of subprocess concatenated stdout and stderr.
+
+    Raises:
+        RuntimeError: Exception is raised if process finished with nonzero
+            return code.
+    """
 
     full_output = ""
-    _stdout, _stderr = proc.communicate()
     if _stdout:
         _stdout = _stdout.decode("utf-8", errors="backslashreplace")
         full_output += _stdout
@@ -164,6 +163,151 @@ def run_subprocess(*args, **kwargs):
     return full_output
 
 
+def run_subprocess(*args, **kwargs):
+    """Convenience method for getting output errors for subprocess.
+
+    Output logged when process finish.
+
+    Entered arguments and keyword arguments are passed to subprocess Popen.
+
+    On windows are 'creationflags' filled with flags that should cause ignore
+    creation of new window.
+
+    Args:
+        *args: Variable length argument list passed to Popen.
+        **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
+            pass `logging.Logger` object under "logger" to use custom logger
+            for output.
+
+    Returns:
+        str: Full output of subprocess concatenated stdout and stderr.
+
+    Raises:
+        RuntimeError: Exception is raised if process finished with nonzero
+            return code.
+    """
+
+    kwargs, logger = _prepare_subprocess_kwargs(kwargs)
+
+    start_time = time.time()
+    proc = subprocess.Popen(*args, **kwargs)
+
+    _stdout, _stderr = proc.communicate()
+    if args:
+        record_subprocess_time(args[0], time.time() - start_time)
+
+    return _process_subprocess_output(args, proc, _stdout, _stderr, logger)
+
+
+def _terminate_process(proc):
+    """Terminate process with its child processes.
+
+    Child processes (e.g. of shell) can be terminated only if 'psutil' is
+    available.
+    """
+
+    try:
+        import psutil
+
+        for child in psutil.Process(proc.pid).children(recursive=True):
+            child.terminate()
+
+    except Exception:
+        pass
+
+    try:
+        proc.terminate()
+    except OSError:
+        pass
+
+
+def run_subprocesses(commands, max_workers=None, **kwargs):
+    """Run multiple subprocesses concurrently.
+
+    At most 'max_workers' processes are running at once. Output of each
+    process is captured and logged separately when the process finishes.
+    When any process fails, running processes are terminated and processes
+    which did not start yet are skipped.
+
+    Args:
+        commands (list[Union[str, list[str]]]): Arguments of processes.
+        max_workers (Optional[int]): Maximum number of running processes.
+            Count of CPU cores is used if not passed.
+        **kwargs: Keyword arguments passed to Popen of each process, same
+            as for 'run_subprocess'.
+
+    Returns:
+        list[str]: Full output of each process in order of commands.
+
+    Raises:
+        RuntimeError: Error of first failed process.
+    """
+
+    kwargs, logger = _prepare_subprocess_kwargs(kwargs)
+    if not max_workers or max_workers < 1:
+        max_workers = multiprocessing.cpu_count()
+
+    outputs = [None] * len(commands)
+    errors = {}
+    running = {}
+    queue = collections.deque(enumerate(commands))
+    lock = threading.Lock()
+    cancel_event = threading.Event()
+
+    def _cancel(idx, exc):
+        # Must be called with acquired lock
+        errors[idx] = exc
+        cancel_event.set()
+        for running_proc in running.values():
+            _terminate_process(running_proc)
+
+    def _worker():
+        while True:
+            with lock:
+                if cancel_event.is_set() or not queue:
+                    return
+                idx, command = queue.popleft()
+                start_time = time.time()
+                try:
+                    proc = subprocess.Popen(command, **kwargs)
+                except Exception as exc:
+                    _cancel(idx, exc)
+                    return
+                running[idx] = proc
+
+            _stdout, _stderr = proc.communicate()
+            record_subprocess_time(command, time.time() - start_time)
+            with lock:
+                running.pop(idx)
+                cancelled = cancel_event.is_set()
+
+            try:
+                outputs[idx] = _process_subprocess_output(
+                    command, proc, _stdout, _stderr, logger
+                )
+            except RuntimeError as exc:
+                # Processes terminated because of other error are ignored
+                if cancelled:
+                    continue
+                with lock:
+                    _cancel(idx, exc)
+                return
+
+    threads = [
+        threading.Thread(target=_worker)
+        for _ in range(min(max_workers, len(commands)))
+    ]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[min(errors)]
+    return outputs
+
+
 def clean_envs_for_ayon_process(env=None):
     """Modify environments that may affect ayon-launcher process.
 
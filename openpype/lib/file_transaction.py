@@ -2,7 +2,11 @@ import os
 import logging
 import sys
 import errno
+import threading
+import collections
+
 import six
+from six.moves import queue
 
 from openpype.lib import create_hard_link
 
@@ -13,6 +17,22 @@ else:
     from shutil import copyfile
 
 
+def _get_default_max_workers():
+    """Number of transfer threads defined by environment variable.
+
+    Returns:
+        int: Number of workers, value lower than 2 means serial processing.
+    """
+
+    value = os.environ.get("OPENPYPE_FILE_TRANSACTION_WORKERS")
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
 
@@ -47,19 +67,44 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Transfers can be processed in parallel by passing 'max_workers' higher
+    than 1. Default value is taken from environment variable
+    'OPENPYPE_FILE_TRANSACTION_WORKERS' so parallel transfers can be enabled
+    without changing the code which uses the transaction. Transfers are
+    grouped by destination directory and distributed to workers in batches.
+    When any transfer fails, remaining batches are not processed and the
+    error is re-raised from `process()` so `rollback()` can remove all files
+    that were already transferred.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for messages.
+        allow_queue_replacements (Optional[bool]): Allow replacing of source
+            for already queued destination.
+        max_workers (Optional[int]): Number of threads used to transfer
+            files. Value lower than 2 means serial processing.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
+    # Number of files of one destination directory processed by a worker
+    #   at once
+    batch_size = 32
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self, log=None, allow_queue_replacements=False, max_workers=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if max_workers is None:
+            max_workers = _get_default_max_workers()
+        self._max_workers = max_workers
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -125,6 +170,10 @@ class FileTransaction(object):
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
 
+        if self._max_workers > 1:
+            self._process_transfers_parallel()
+            return
+
         # Copy the files to transfer
         for dst, (src, opts) in self._transfers.items():
             path_same = self._same_paths(src, dst)
@@ -135,16 +184,84 @@ class FileTransaction(object):
                 continue
 
             self._create_folder_for_file(dst)
+            self._transfer_file(src, dst, opts)
+            self._transferred.append(dst)
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
+    def _process_transfers_parallel(self):
+        # Group transfers by destination directory so each directory is
+        #   created only once
+        transfers_by_dir = collections.OrderedDict()
+        for dst, (src, opts) in self._transfers.items():
+            if self._same_paths(src, dst):
+                self.log.debug(
+                    "Source and destination are same files {} -> {}".format(
+                        src, dst))
+                continue
+            dirname = os.path.dirname(dst)
+            transfers_by_dir.setdefault(dirname, []).append((src, dst, opts))
+
+        batches = queue.Queue()
+        for transfers in transfers_by_dir.values():
+            self._create_folder_for_file(transfers[0][1])
+            for idx in range(0, len(transfers), self.batch_size):
+                batches.put(transfers[idx:idx + self.batch_size])
+
+        workers_count = min(self._max_workers, batches.qsize())
+        self.log.debug(
+            "Transferring {} files in {} threads".format(
+                sum(len(items) for items in transfers_by_dir.values()),
+                workers_count
+            )
+        )
+
+        lock = threading.Lock()
+        stop_event = threading.Event()
+        errors = []
+
+        def _worker():
+            while not stop_event.is_set():
+                try:
+                    batch = batches.get_nowait()
+                except queue.Empty:
+                    return
+
+                for src, dst, opts in batch:
+                    if stop_event.is_set():
+                        return
+                    try:
+                        self._transfer_file(src, dst, opts)
+                    except Exception:
+                        with lock:
+                            errors.append(sys.exc_info())
+                        stop_event.set()
+                        return
+
+                    with lock:
+                        self._transferred.append(dst)
+
+        threads = [
+            threading.Thread(target=_worker)
+            for _ in range(workers_count)
+        ]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
 
-            self._transferred.append(dst)
+        if errors:
+            self.log.error(
+                "{} errors occurred during transfer.".format(len(errors)))
+            six.reraise(*errors[0])
+
+    def _transfer_file(self, src, dst, opts):
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
 
     def finalize(self):
         # Delete any backed up files
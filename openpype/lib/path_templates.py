@@ -2,6 +2,7 @@ import os
 import re
 import copy
 import numbers
+import threading
 import collections
 
 import six
@@ -10,6 +11,8 @@ KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+OPTIONAL_CHARS_PATTERN = re.compile(r"([<>])")
+ZERO_PADDING_PATTERN = re.compile(r"^0?[>=]?(\d+)$")
 
 
 def merge_dict(main_dict, enhance_dict):
@@ -38,6 +41,24 @@ def merge_dict(main_dict, enhance_dict):
     return main_dict
 
 
+# Markers of missing key and invalid parent value used in format cache keys
+_MissingKeyValue = object()
+_InvalidKeyValue = object()
+
+
+def _copy_nested_dict(data):
+    """Copy dictionary and all its subdictionaries.
+
+    Faster alternative of 'copy.deepcopy' for dictionaries created by
+    template formatting where values are immutable.
+    """
+
+    return {
+        key: _copy_nested_dict(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+    }
+
+
 class TemplateMissingKey(Exception):
     """Exception for cases when key does not exist in template."""
 
@@ -81,7 +102,20 @@ class TemplateUnsolved(Exception):
 
 
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Parsed parts of templates are cached by template string for whole
+    process so creating of the same template multiple times is cheap.
+    The parts are not modified after parsing so they can be shared.
+    """
+
+    # Process-wide cache of parsed template parts by template string
+    _parts_cache = collections.OrderedDict()
+    _parts_cache_lock = threading.Lock()
+    parts_cache_size = 2048
+    # Number of format results cached per template object
+    results_cache_size = 64
+
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -89,6 +123,69 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        self._parts, self._key_paths = self._get_parsed_template(template)
+        self._results_cache = collections.OrderedDict()
+
+    @classmethod
+    def _get_parsed_template(cls, template):
+        cache = StringTemplate._parts_cache
+        with StringTemplate._parts_cache_lock:
+            parsed = cache.pop(template, None)
+            if parsed is not None:
+                cache[template] = parsed
+                return parsed
+
+        parts = cls.parse_template(template)
+        key_paths = []
+        parts_queue = collections.deque(parts)
+        while parts_queue:
+            part = parts_queue.popleft()
+            if isinstance(part, OptionalPart):
+                parts_queue.extend(part.parts)
+            elif isinstance(part, FormattingPart):
+                key_path = part.key_path
+                if key_path not in key_paths:
+                    key_paths.append(key_path)
+        parsed = (parts, tuple(key_paths))
+
+        with StringTemplate._parts_cache_lock:
+            cache[template] = parsed
+            while len(cache) > StringTemplate.parts_cache_size:
+                cache.popitem(last=False)
+        return parsed
+
+    @classmethod
+    def get_template_parts(cls, template):
+        """Parsed parts of template string.
+
+        Parts are cached by template string. The cache has limited size
+        and the least recently used templates are removed first.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Parsed parts.
+        """
+
+        return cls._get_parsed_template(template)[0]
+
+    @classmethod
+    def clear_parts_cache(cls):
+        with StringTemplate._parts_cache_lock:
+            StringTemplate._parts_cache.clear()
+
+    @classmethod
+    def parse_template(cls, template):
+        """Parse template string to formatting and optional parts.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Parsed parts.
+        """
+
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -107,19 +204,12 @@ class StringTemplate(object):
                 new_parts.append(part)
                 continue
 
-            substr = ""
-            for char in part:
-                if char not in ("<", ">"):
-                    substr += char
-                else:
-                    if substr:
-                        new_parts.append(substr)
-                    new_parts.append(char)
-                    substr = ""
-            if substr:
-                new_parts.append(substr)
+            # Split string by optional part characters
+            for substr in OPTIONAL_CHARS_PATTERN.split(part):
+                if substr:
+                    new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -132,6 +222,7 @@ class StringTemplate(object):
 
     def replace(self, *args, **kwargs):
         self._template = self.template.replace(*args, **kwargs)
+        self._results_cache.clear()
         return self
 
     @property
@@ -151,6 +242,24 @@ class StringTemplate(object):
             TemplateResult: Filled or partially filled template containing all
                 data needed or missing for filling template.
         """
+        # Results are cached by values of keys used in template
+        cache_key = self._get_results_cache_key(data)
+        cached_result = self._results_cache.pop(cache_key, None)
+        if cached_result is not None:
+            # Move result to the end of cache (least recently used first)
+            self._results_cache[cache_key] = cached_result
+            output, solved, used_values, missing_keys, invalid_types = (
+                cached_result
+            )
+            return TemplateResult(
+                output,
+                self.template,
+                solved,
+                _copy_nested_dict(used_values),
+                set(missing_keys),
+                _copy_nested_dict(invalid_types)
+            )
+
         result = TemplatePartResult()
         for part in self._parts:
             if isinstance(part, six.string_types):
@@ -168,6 +277,16 @@ class StringTemplate(object):
         solved = result.solved
         used_values = result.get_clean_used_values()
 
+        self._results_cache[cache_key] = (
+            result.output,
+            solved,
+            _copy_nested_dict(used_values),
+            set(missing_keys),
+            _copy_nested_dict(invalid_types)
+        )
+        while len(self._results_cache) > self.results_cache_size:
+            self._results_cache.popitem(last=False)
+
         return TemplateResult(
             result.output,
             self.template,
@@ -177,11 +296,76 @@ class StringTemplate(object):
             invalid_types
         )
 
+    def _get_results_cache_key(self, data):
+        """Values of keys used in template for result caching.
+
+        Values which can't be used for formatting are represented only by
+        their type as result is same for any value of the type.
+
+        Args:
+            data (dict): Data used for formatting.
+
+        Returns:
+            tuple: Hashable key of formatting data.
+        """
+
+        cache_key = []
+        for key_path in self._key_paths:
+            value = data
+            missing_item = None
+            for depth, sub_key in enumerate(key_path):
+                if (
+                    value is None
+                    or (hasattr(value, "items") and sub_key not in value)
+                ):
+                    missing_item = (_MissingKeyValue, depth)
+                    break
+
+                if not hasattr(value, "items"):
+                    missing_item = (_InvalidKeyValue, depth, type(value))
+                    break
+                value = value.get(sub_key)
+
+            value_type = type(value)
+            if missing_item is not None:
+                cache_key.append(missing_item)
+            elif isinstance(value, FormatObject):
+                cache_key.append((value_type, id(value), str(value)))
+            elif FormattingPart.validate_value_type(value):
+                cache_key.append((value_type, value))
+            else:
+                cache_key.append(value_type)
+        return tuple(cache_key)
+
     def format_strict(self, *args, **kwargs):
         result = self.format(*args, **kwargs)
         result.validate()
         return result
 
+    def format_sequence(self, data, key="frame", strict=True):
+        """Prepare formatter which fills only single key of template.
+
+        Template is formatted only once with passed data and then only the
+        value of 'key' is changed. That is useful to build destination paths
+        of sequences where only frame or udim is different for each file.
+
+        Data must contain value for the key which is used to validate the
+        template (e.g. first frame of the sequence).
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+            key (str): Key which is different for each output.
+            strict (bool): Validate the formatted template.
+
+        Returns:
+            SequenceTemplateFormatter: Formatter filling only the key.
+        """
+
+        result = self.format(data)
+        if strict:
+            result.validate()
+        return SequenceTemplateFormatter(self, data, key, result)
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -355,7 +539,9 @@ class TemplatesDict(object):
                 will raise exceptions with explaned error.
         """
         # Create a copy of inserted data
-        data = copy.deepcopy(in_data)
+        #   - formatting does not modify passed data so shallow copy is
+        #       enough to add environment keys
+        data = copy.copy(in_data)
 
         # Add environment variable to data
         if only_keys is False:
@@ -445,6 +631,173 @@ class TemplateResult(str):
         )
 
 
+class SequenceTemplateFormatter(object):
+    """Formatter of template where only single key is changing.
+
+    Parts of template which are not using the key are formatted once so
+    filling of the key is only string concatenation. If the key is used
+    inside optional part of the template, the template is formatted fully
+    for each value.
+
+    Args:
+        template (StringTemplate): Template object.
+        data (dict): Data used for formatting of static parts.
+        key (str): Key which is filled on call.
+        result (TemplateResult): Result of template formatting with 'data'.
+    """
+
+    def __init__(self, template, data, key, result):
+        self._template = template
+        self._data = data
+        self._key = key
+        self._result = result
+        self._segments = None
+        self._head = None
+        self._tail = None
+        self._padding = None
+
+        if not self._key_in_optional_parts(template._parts):
+            self._prepare_segments(template._parts)
+
+    def __call__(self, value):
+        """Fill template with value of key.
+
+        Args:
+            value (Any): Value of the key e.g. frame number.
+
+        Returns:
+            str: Formatted template.
+        """
+
+        if self._segments is None:
+            data = copy.copy(self._data)
+            data[self._key] = value
+            return str(self._template.format_strict(data))
+
+        fill_data = {self._key: value}
+        return "".join([
+            segment
+            if isinstance(segment, six.string_types)
+            else segment.template.format(**fill_data)
+            for segment in self._segments
+        ])
+
+    def format_values(self, values):
+        """Fill template with each value.
+
+        Args:
+            values (Iterable[Any]): Values of the key e.g. frame numbers.
+
+        Returns:
+            list[str]: Formatted templates in order of values.
+        """
+
+        return [self(value) for value in values]
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def result(self):
+        """Result of template formatted with data used for preparation.
+
+        Returns:
+            TemplateResult: Result with used values.
+        """
+
+        return self._result
+
+    @property
+    def head(self):
+        """Part of formatted template before the key.
+
+        Available only when key is used exactly once in template.
+
+        Returns:
+            Union[str, None]: Head of formatted template.
+        """
+
+        return self._head
+
+    @property
+    def tail(self):
+        """Part of formatted template after the key.
+
+        Available only when key is used exactly once in template.
+
+        Returns:
+            Union[str, None]: Tail of formatted template.
+        """
+
+        return self._tail
+
+    @property
+    def padding(self):
+        """Zero padding of the key defined in template.
+
+        Returns:
+            Union[int, None]: Padding or None if padding can't be defined
+                from the template.
+        """
+
+        return self._padding
+
+    def _is_key_part(self, part):
+        return (
+            isinstance(part, FormattingPart)
+            and part.key_name == self._key
+        )
+
+    def _key_in_optional_parts(self, parts, in_optional=False):
+        for part in parts:
+            if isinstance(part, OptionalPart):
+                if self._key_in_optional_parts(part.parts, True):
+                    return True
+            elif in_optional and self._is_key_part(part):
+                return True
+        return False
+
+    def _prepare_segments(self, parts):
+        # Formatted static parts are stored as strings and parts with the
+        #   key are kept as 'FormattingPart' objects
+        segments = []
+        key_parts = []
+        result = TemplatePartResult()
+        for part in parts:
+            if isinstance(part, six.string_types):
+                output = part
+            elif self._is_key_part(part):
+                key_parts.append(part)
+                segments.append(part)
+                continue
+            else:
+                start_idx = len(result.output)
+                part.format(self._data, result)
+                output = result.output[start_idx:]
+
+            if segments and isinstance(segments[-1], six.string_types):
+                segments[-1] += output
+            else:
+                segments.append(output)
+
+        self._segments = segments
+        if len(key_parts) != 1:
+            return
+
+        key_part = key_parts[0]
+        key_idx = segments.index(key_part)
+        self._head = "".join(segments[:key_idx])
+        self._tail = "".join(segments[key_idx + 1:])
+        format_spec = key_part.format_spec
+        if not format_spec:
+            self._padding = 0
+        else:
+            match = ZERO_PADDING_PATTERN.match(format_spec)
+            if match:
+                self._padding = int(match.group(1))
+
+
 class TemplatesResultDict(dict):
     """Holds and wrap TemplateResults for easy bug report."""
 
@@ -630,14 +983,26 @@ class TemplatePartResult:
     def used_values(self):
         return self._used_values
 
-    @staticmethod
-    def split_keys_to_subdicts(values):
-        output = {}
-        for key, value in values.items():
+    # Cache of keys split to subdict keys
+    _key_subdicts_cache = {}
+
+    @classmethod
+    def _get_key_subdicts(cls, key):
+        key_subdict = cls._key_subdicts_cache.get(key)
+        if key_subdict is None:
+            existence_check = key
             key_padding = list(KEY_PADDING_PATTERN.findall(key))
             if key_padding:
-                key = key_padding[0]
-            key_subdict = list(SUB_DICT_PATTERN.findall(key))
+                existence_check = key_padding[0]
+            key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+            cls._key_subdicts_cache[key] = key_subdict
+        return key_subdict
+
+    @classmethod
+    def split_keys_to_subdicts(cls, values):
+        output = {}
+        for key, value in values.items():
+            key_subdict = list(cls._get_key_subdicts(key))
             data = output
             last_key = key_subdict.pop(-1)
             for subkey in key_subdict:
@@ -698,12 +1063,35 @@ class FormattingPart:
 
     Containt only single key to format e.g. "{project[name]}".
 
+    Key path, padding and format specification are resolved once on
+    initialization so formatting does only lookup of value in data.
+
     Args:
         template(str): String containing the formatting key.
     """
+
+    # Cache of value types that can be used for formatting
+    _valid_types_cache = {}
+
     def __init__(self, template):
         self._template = template
 
+        key = template[1:-1]
+        # check if key expects subdictionary keys (e.g. project[name])
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+        # Template used to format found value
+        #   - e.g. '{0:0>3}' for '{version:0>3}'
+        self._fill_template = None
+        if key.startswith(existence_check):
+            self._fill_template = "{0" + key[len(existence_check):] + "}"
+
     @property
     def template(self):
         return self._template
@@ -714,16 +1102,57 @@ class FormattingPart:
     def __str__(self):
         return self._template
 
-    @staticmethod
-    def validate_value_type(value):
+    @property
+    def key_path(self):
+        """Keys used to find value in formatting data.
+
+        Returns:
+            tuple[str, ...]: Keys e.g. ('project', 'name') for
+                '{project[name]}'.
+        """
+
+        return self._key_subdict
+
+    @property
+    def key_name(self):
+        """Name of key without format specification and subkeys.
+
+        Returns:
+            str: Key name e.g. 'frame' for '{frame:0>4}'.
+        """
+
+        return self._existence_check
+
+    @property
+    def format_spec(self):
+        """Format specification of key.
+
+        Returns:
+            str: Format specification e.g. '0>4' for '{frame:0>4}'.
+        """
+
+        if ":" not in self._key:
+            return ""
+        return self._key.split(":", 1)[1]
+
+    @classmethod
+    def validate_value_type(cls, value):
         """Check if value can be used for formatting of single key."""
-        if isinstance(value, (numbers.Number, FormatObject)):
-            return True
+        value_type = type(value)
+        is_valid = cls._valid_types_cache.get(value_type)
+        if is_valid is not None:
+            return is_valid
 
-        for inh_class in type(value).mro():
-            if inh_class in six.string_types:
-                return True
-        return False
+        is_valid = False
+        if isinstance(value, (numbers.Number, FormatObject)):
+            is_valid = True
+        else:
+            for inh_class in value_type.mro():
+                if inh_class in six.string_types:
+                    is_valid = True
+                    break
+        cls._valid_types_cache[value_type] = is_valid
+        return is_valid
 
     def format(self, data, result):
         """Format the formattings string.
@@ -732,18 +1161,12 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
-
+        key_subdict = self._key_subdict
         value = data
         missing_key = False
         invalid_type = False
@@ -784,19 +1207,22 @@ class FormattingPart:
             return result
 
         if self.validate_value_type(value):
-            fill_data = {}
-            first_value = True
-            for used_key in reversed(used_keys):
-                if first_value:
-                    first_value = False
-                    fill_data[used_key] = value
-                else:
-                    _fill_data = {used_key: fill_data}
-                    fill_data = _fill_data
-
-            formatted_value = self.template.format(**fill_data)
+            if self._fill_template is not None:
+                formatted_value = self._fill_template.format(value)
+            else:
+                fill_data = {}
+                first_value = True
+                for used_key in reversed(used_keys):
+                    if first_value:
+                        first_value = False
+                        fill_data[used_key] = value
+                    else:
+                        _fill_data = {used_key: fill_data}
+                        fill_data = _fill_data
+                formatted_value = self.template.format(**fill_data)
+
             result.add_realy_used_value(key, formatted_value)
-            result.add_used_value(existence_check, formatted_value)
+            result.add_used_value(self._existence_check, formatted_value)
             result.add_output(formatted_value)
             return result
 
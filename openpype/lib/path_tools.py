@@ -1,5 +1,7 @@
 import os
 import re
+import sys
+import errno
 import logging
 import platform
 
@@ -65,6 +67,57 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+def create_file_link(src_path, dst_path, allow_symlink=True):
+    """Create link of file or copy it if link can't be created.
+
+    Hardlink is created if possible, symlink is used when hardlink fails
+    (e.g. source is on different drive) and copy is the last fallback
+    (e.g. filesystem does not support links). Existing destination file
+    is replaced.
+
+    Args:
+        src_path (str): Full path to source file.
+        dst_path (str): Full path where link or copy is created.
+        allow_symlink (Optional[bool]): Symlink can be used when hardlink
+            fails.
+
+    Returns:
+        str: How the file was created 'hardlink', 'symlink' or 'copy'.
+    """
+
+    try:
+        os.remove(dst_path)
+    except OSError as exc:
+        if exc.errno != errno.ENOENT:
+            raise
+
+    try:
+        create_hard_link(src_path, dst_path)
+        return "hardlink"
+    except (OSError, NotImplementedError):
+        log.debug("Failed to create hardlink {} -> {}".format(
+            src_path, dst_path
+        ), exc_info=True)
+
+    if allow_symlink and hasattr(os, "symlink"):
+        try:
+            os.symlink(os.path.abspath(src_path), dst_path)
+            return "symlink"
+        except (OSError, NotImplementedError):
+            # Windows require privileges to create symlinks
+            log.debug("Failed to create symlink {} -> {}".format(
+                src_path, dst_path
+            ), exc_info=True)
+
+    # this is needed until speedcopy for linux is fixed
+    if sys.platform == "win32":
+        from speedcopy import copyfile
+    else:
+        from shutil import copyfile
+    copyfile(src_path, dst_path)
+    return "copy"
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
@@ -1,8 +1,26 @@
 import re
 import logging
+import threading
+import collections
+
+import six
 
 log = logging.getLogger(__name__)
 
+# Characters which mark filter value as regex and not as plain string
+REGEX_CHARS_PATTERN = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+# Compiled regexes by their pattern
+_compiled_regexes = {}
+
+
+def _compile_regex(pattern):
+    regex = _compiled_regexes.get(pattern)
+    if regex is None:
+        regex = re.compile(pattern)
+        _compiled_regexes[pattern] = regex
+    return regex
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -14,7 +32,7 @@ def compile_list_of_regexes(in_list):
         if not item:
             continue
         try:
-            regexes.append(re.compile(item))
+            regexes.append(_compile_regex(item))
         except TypeError:
             print((
                 "Invalid type \"{}\" value \"{}\"."
@@ -162,14 +180,18 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
                 _keys_order.append(key)
         keys_order = tuple(_keys_order)
 
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
+    # Prepare log message only when debug logs are enabled
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    log_parts = ""
+    if debug_enabled:
+        log_parts = " | ".join([
+            "{}: \"{}\"".format(*item)
+            for item in key_values.items()
+        ])
 
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
-    )
+        logger.debug(
+            "Looking for matching profile for: {}".format(log_parts)
+        )
 
     matching_profiles = None
     highest_profile_points = -1
@@ -184,11 +206,12 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             value = key_values[key]
             match = validate_value_by_regexes(value, profile.get(key))
             if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
+                if debug_enabled:
+                    profile_value = profile.get(key) or []
+                    logger.debug(
+                        "\"{}\" not found in \"{}\": {}".format(
+                            value, key, profile_value)
+                    )
                 profile_points = -1
                 break
 
@@ -209,19 +232,244 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             matching_profiles.append((profile, profile_scores))
 
     if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
+        if debug_enabled:
+            logger.debug(
+                "None of profiles match your setup. {}".format(log_parts)
+            )
         return None
 
-    if len(matching_profiles) > 1:
+    if debug_enabled and len(matching_profiles) > 1:
         logger.debug(
             "More than one profile match your setup. {}".format(log_parts)
         )
 
     profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
+    if profile and debug_enabled:
         logger.debug(
             "Profile selected: {}".format(profile)
         )
     return profile
+
+
+class _ProfileKeyFilter(object):
+    """Prepared filter of single key of a profile.
+
+    Args:
+        in_list (Any): Value of profile for the key.
+    """
+
+    def __init__(self, in_list):
+        if in_list and not isinstance(in_list, (list, tuple, set)):
+            in_list = [in_list]
+
+        # Profile does not filter by the key
+        self.is_wildcard = not in_list or "*" in in_list
+        self.literals = set()
+        self.regexes = []
+        if self.is_wildcard:
+            return
+
+        regex_items = []
+        for item in in_list:
+            if (
+                isinstance(item, six.string_types)
+                and not REGEX_CHARS_PATTERN.search(item)
+            ):
+                self.literals.add(item)
+            else:
+                regex_items.append(item)
+        self.regexes = compile_list_of_regexes(regex_items)
+
+    def match(self, value):
+        """Match value with the filter.
+
+        Returns:
+            int: Same output as 'validate_value_by_regexes'.
+        """
+
+        if self.is_wildcard:
+            return 0
+
+        if not value:
+            return -1
+
+        if value in self.literals:
+            return 1
+
+        for regex in self.regexes:
+            if hasattr(regex, "fullmatch"):
+                result = regex.fullmatch(value)
+            else:
+                result = fullmatch(regex, value)
+            if result:
+                return 1
+        return -1
+
+
+class ProfilesIndex(object):
+    """Prepared profiles for repeated filtering.
+
+    Result of 'filter' is the same as result of 'filter_profiles' with the
+    same arguments. Regexes of profiles are compiled only once, plain
+    string values are matched using sets and results are cached by
+    filtering values.
+
+    Index should be created once per profiles data (e.g. settings) and
+    profiles data should not be changed after that.
+
+    Args:
+        profiles_data (list[dict[str, Any]]): Profile definitions.
+    """
+
+    def __init__(self, profiles_data):
+        self._profiles_data = profiles_data
+        self._profiles = list(profiles_data or [])
+        # Prepared filters of profiles by key
+        self._filters_by_key = {}
+        self._results_cache = {}
+        self._lock = threading.Lock()
+
+    @property
+    def profiles_data(self):
+        """Profiles data used to create the index."""
+        return self._profiles_data
+
+    def _get_key_filters(self, key):
+        key_filters = self._filters_by_key.get(key)
+        if key_filters is None:
+            key_filters = [
+                _ProfileKeyFilter(profile.get(key))
+                for profile in self._profiles
+            ]
+            self._filters_by_key[key] = key_filters
+        return key_filters
+
+    def _get_cache_key(self, key_values, keys_order):
+        try:
+            cache_key = (
+                tuple(keys_order),
+                tuple(
+                    (key, key_values[key])
+                    for key in keys_order
+                )
+            )
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def filter(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for passed values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            Union[dict, None]: Most matching profile or None if none of
+                profiles match.
+        """
+
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        if not keys_order:
+            keys_order = tuple(key_values.keys())
+        else:
+            _keys_order = list(keys_order)
+            # Make all keys from `key_values` are passed
+            for key in key_values.keys():
+                if key not in _keys_order:
+                    _keys_order.append(key)
+            keys_order = tuple(_keys_order)
+
+        cache_key = self._get_cache_key(key_values, keys_order)
+        if cache_key is not None and cache_key in self._results_cache:
+            profile = self._results_cache[cache_key]
+        else:
+            with self._lock:
+                profile = self._filter(key_values, keys_order)
+
+            if cache_key is not None:
+                self._results_cache[cache_key] = profile
+
+        if logger.isEnabledFor(logging.DEBUG):
+            if profile is None:
+                logger.debug("None of profiles match your setup. {}".format(
+                    " | ".join([
+                        "{}: \"{}\"".format(*item)
+                        for item in key_values.items()
+                    ])
+                ))
+            else:
+                logger.debug("Profile selected: {}".format(profile))
+        return profile
+
+    def _filter(self, key_values, keys_order):
+        profiles_count = len(self._profiles)
+        points = [0] * profiles_count
+        scores = [[] for _ in range(profiles_count)]
+        valid = [True] * profiles_count
+        for key in keys_order:
+            value = key_values[key]
+            for idx, key_filter in enumerate(self._get_key_filters(key)):
+                if not valid[idx]:
+                    continue
+                match = key_filter.match(value)
+                if match == -1:
+                    valid[idx] = False
+                    continue
+                points[idx] += match
+                scores[idx].append(bool(match))
+
+        matching_profiles = collections.defaultdict(list)
+        for idx, profile in enumerate(self._profiles):
+            if valid[idx]:
+                matching_profiles[points[idx]].append((profile, scores[idx]))
+
+        if not matching_profiles:
+            return None
+
+        highest_points = max(matching_profiles.keys())
+        return _profile_exclusion(matching_profiles[highest_points], log)
+
+
+# Cached profile indexes by id of profiles data
+_profiles_indexes = collections.OrderedDict()
+_profiles_indexes_lock = threading.Lock()
+PROFILES_INDEXES_CACHE_SIZE = 128
+
+
+def get_profiles_index(profiles_data):
+    """Get cached 'ProfilesIndex' for profiles data.
+
+    Index is cached by the profiles data object so the index is created only
+    once for e.g. profiles stored on a publish plugin class by settings.
+    Cache keeps reference to the profiles data so the object can't be
+    replaced by another object with the same id.
+
+    Warning:
+        Profiles data must not be modified after the index was created.
+
+    Args:
+        profiles_data (list[dict[str, Any]]): Profile definitions.
+
+    Returns:
+        ProfilesIndex: Index of the profiles.
+    """
+
+    cache_key = id(profiles_data)
+    with _profiles_indexes_lock:
+        index = _profiles_indexes.pop(cache_key, None)
+        if index is None or index.profiles_data is not profiles_data:
+            index = ProfilesIndex(profiles_data)
+        _profiles_indexes[cache_key] = index
+        while len(_profiles_indexes) > PROFILES_INDEXES_CACHE_SIZE:
+            _profiles_indexes.popitem(last=False)
+    return index
@@ -1,7 +1,36 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and startup profiler.
+
+Startup profiler records imports as a tree with self and cumulative time
+of each imported module. Other startup phases (initialization of modules,
+settings resolution, plugin discovery) are recorded as spans using
+'startup_span'. Spans are no-op when profiler is not running.
+
+Module must not import anything from OpenPype so it can be used before
+'openpype.lib' is imported.
+"""
 import os
+import sys
+import json
+import time
+import atexit
 import cProfile
+import functools
+import threading
+import contextlib
+
+# Environment variable with output directory of startup profiler
+STARTUP_PROFILER_ENV_KEY = "OPENPYPE_PROFILE_STARTUP_OUTPUT"
+STARTUP_REPORT_FILENAME = "startup_report.json"
+STARTUP_FLAMEGRAPH_FILENAME = "startup.folded"
+
+_ACTIVE_PROFILER = None
+_SUBPROCESS_LISTENERS = []
+
+if sys.version_info[0] == 2:
+    import __builtin__ as builtins
+else:
+    import builtins
 
 
 def do_profile(fn, to_file=None):
@@ -27,3 +56,418 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+class _ProfileNode(object):
+    """Node of profiled tree.
+
+    Args:
+        name (str): Imported module name or label of span.
+        category (str): 'import' for imports or category of span.
+    """
+
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+        self.start = time.time()
+        self.duration = 0.0
+        self.children = []
+
+    def finish(self):
+        self.duration = time.time() - self.start
+
+    @property
+    def self_time(self):
+        return max(
+            0.0,
+            self.duration - sum(child.duration for child in self.children)
+        )
+
+    def to_data(self):
+        return {
+            "name": self.name,
+            "category": self.category,
+            "cumulative": self.duration,
+            "self": self.self_time,
+            "children": [child.to_data() for child in self.children]
+        }
+
+
+class StartupProfiler(object):
+    """Record imports and startup spans of a process.
+
+    Imports are recorded only in the thread which started the profiler.
+
+    ```python
+    with StartupProfiler() as profiler:
+        from openpype.modules import ModulesManager
+        ModulesManager()
+    profiler.save(output_dir)
+    ```
+    """
+
+    def __init__(self):
+        self.root = _ProfileNode("startup", "root")
+        self._stack = [self.root]
+        self._thread_id = None
+        self._original_import = None
+        self._finished = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+    def start(self):
+        global _ACTIVE_PROFILER
+
+        self._thread_id = threading.current_thread().ident
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+        _ACTIVE_PROFILER = self
+        self.root.start = time.time()
+
+    def stop(self):
+        global _ACTIVE_PROFILER
+
+        if self._finished:
+            return
+        self._finished = True
+        if builtins.__import__ == self._import:
+            builtins.__import__ = self._original_import
+        if _ACTIVE_PROFILER is self:
+            _ACTIVE_PROFILER = None
+        self.root.finish()
+
+    def _is_profiled_thread(self):
+        return (
+            not self._finished
+            and threading.current_thread().ident == self._thread_id
+        )
+
+    def _push(self, name, category):
+        node = _ProfileNode(name, category)
+        self._stack[-1].children.append(node)
+        self._stack.append(node)
+        return node
+
+    def _pop(self, node):
+        node.finish()
+        # Pop node and nodes left on stack by exceptions
+        while len(self._stack) > 1:
+            if self._stack.pop() is node:
+                break
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if not self._is_profiled_thread():
+            return self._original_import(
+                name, globals, locals, fromlist, level
+            )
+
+        full_name = name
+        if level and globals:
+            package = globals.get("__package__") or ""
+            if not package:
+                package = globals.get("__name__") or ""
+                if "__path__" not in globals:
+                    package = package.rpartition(".")[0]
+            parts = package.split(".")
+            if level > 1:
+                parts = parts[:-(level - 1)]
+            full_name = ".".join(part for part in parts + [name] if part)
+
+        if full_name in sys.modules:
+            return self._original_import(
+                name, globals, locals, fromlist, level
+            )
+
+        node = self._push(full_name, "import")
+        try:
+            return self._original_import(
+                name, globals, locals, fromlist, level
+            )
+        finally:
+            self._pop(node)
+
+    @contextlib.contextmanager
+    def span(self, category, name=None):
+        """Record time spent in the context.
+
+        Args:
+            category (str): Category of span e.g. 'settings'.
+            name (Optional[str]): Label of span, category is used if not
+                passed.
+        """
+
+        if not self._is_profiled_thread():
+            yield
+            return
+
+        node = self._push(name or category, category)
+        try:
+            yield
+        finally:
+            self._pop(node)
+
+    def _iter_nodes(self, node=None, parents=None):
+        if node is None:
+            node = self.root
+        if parents is None:
+            parents = []
+        path = parents + [node]
+        yield node, path
+        for child in node.children:
+            for item in self._iter_nodes(child, path):
+                yield item
+
+    def get_report_data(self):
+        """Report data which can be stored to json.
+
+        Returns:
+            dict[str, Any]: Total time, times of modules imports, times
+                by span categories and tree of all recorded nodes.
+        """
+
+        imports = {}
+        categories = {}
+        for node, path in self._iter_nodes():
+            if node is self.root:
+                continue
+
+            if node.category == "import":
+                item = imports.setdefault(
+                    node.name, {"self": 0.0, "cumulative": 0.0}
+                )
+                item["self"] += node.self_time
+                item["cumulative"] += node.duration
+                continue
+
+            # Nested spans of same category are not counted twice
+            if any(parent.category == node.category for parent in path[:-1]):
+                continue
+            categories[node.category] = (
+                categories.get(node.category, 0.0) + node.duration
+            )
+
+        return {
+            "total": self.root.duration,
+            "categories": categories,
+            "imports": imports,
+            "tree": self.root.to_data(),
+        }
+
+    def get_folded_stacks(self):
+        """Stacks in folded format used by flamegraph tools.
+
+        Each line contains stack separated by ';' and self time of last
+        node in microseconds.
+
+        Returns:
+            list[str]: Lines of folded stacks.
+        """
+
+        lines = []
+        for node, path in self._iter_nodes():
+            value = int(node.self_time * 1000000)
+            if not value:
+                continue
+            lines.append("{} {}".format(
+                ";".join(
+                    item.name.replace(";", ":").replace(" ", "_")
+                    for item in path
+                ),
+                value
+            ))
+        return lines
+
+    def save(self, output_dir):
+        """Store json report and flamegraph file to directory.
+
+        Args:
+            output_dir (str): Output directory.
+
+        Returns:
+            tuple[str, str]: Paths to json report and flamegraph file.
+        """
+
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        report_path = os.path.join(output_dir, STARTUP_REPORT_FILENAME)
+        with open(report_path, "w") as stream:
+            json.dump(self.get_report_data(), stream, indent=4)
+
+        folded_path = os.path.join(output_dir, STARTUP_FLAMEGRAPH_FILENAME)
+        with open(folded_path, "w") as stream:
+            stream.write("\n".join(self.get_folded_stacks()))
+        return report_path, folded_path
+
+
+def get_active_startup_profiler():
+    """Running startup profiler.
+
+    Returns:
+        Union[StartupProfiler, None]: Profiler or None.
+    """
+
+    return _ACTIVE_PROFILER
+
+
+@contextlib.contextmanager
+def startup_span(category, name=None):
+    """Record time spent in context if startup profiler is running.
+
+    Args:
+        category (str): Category of span e.g. 'settings'.
+        name (Optional[str]): Label of span.
+    """
+
+    profiler = _ACTIVE_PROFILER
+    if profiler is None:
+        yield
+        return
+
+    with profiler.span(category, name):
+        yield
+
+
+def profile_startup_span(category, name=None):
+    """Decorator recording function call as startup span.
+
+    Args:
+        category (str): Category of span.
+        name (Optional[str]): Label of span, function name is used if not
+            passed.
+    """
+
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def decorated(*args, **kwargs):
+            if _ACTIVE_PROFILER is None:
+                return func(*args, **kwargs)
+            with _ACTIVE_PROFILER.span(category, label):
+                return func(*args, **kwargs)
+        return decorated
+    return decorator
+
+
+def start_startup_profiling(output_dir=None):
+    """Start startup profiler which saves report on process exit.
+
+    Args:
+        output_dir (Optional[str]): Output directory, value of
+            'OPENPYPE_PROFILE_STARTUP_OUTPUT' is used if not passed.
+
+    Returns:
+        Union[StartupProfiler, None]: Started profiler or None if output
+            directory is not set or profiler is already running.
+    """
+
+    if output_dir is None:
+        output_dir = os.environ.get(STARTUP_PROFILER_ENV_KEY)
+
+    if not output_dir or _ACTIVE_PROFILER is not None:
+        return None
+
+    profiler = StartupProfiler()
+    profiler.start()
+
+    def _on_exit():
+        profiler.stop()
+        profiler.save(output_dir)
+
+    atexit.register(_on_exit)
+    return profiler
+
+
+def add_subprocess_listener(listener):
+    """Register function called when subprocess finished.
+
+    Listener is called with name of executable and duration of subprocess
+    in seconds.
+
+    Args:
+        listener (Callable[[str, float], None]): Listener function.
+    """
+
+    if listener not in _SUBPROCESS_LISTENERS:
+        _SUBPROCESS_LISTENERS.append(listener)
+
+
+def remove_subprocess_listener(listener):
+    if listener in _SUBPROCESS_LISTENERS:
+        _SUBPROCESS_LISTENERS.remove(listener)
+
+
+def record_subprocess_time(args, duration):
+    """Pass duration of finished subprocess to listeners.
+
+    Args:
+        args (Union[str, list[str]]): Arguments of subprocess.
+        duration (float): Duration of subprocess in seconds.
+    """
+
+    if not _SUBPROCESS_LISTENERS:
+        return
+
+    if isinstance(args, (list, tuple)):
+        executable = args[0] if args else ""
+    else:
+        executable = (args or "").strip().split(" ")[0]
+    name = os.path.splitext(os.path.basename(str(executable).strip('"')))[0]
+
+    for listener in tuple(_SUBPROCESS_LISTENERS):
+        listener(name, duration)
+
+
+def check_startup_budget(report_data, budget):
+    """Compare startup report with budget.
+
+    Budget can define maximum time in seconds of whole startup, of span
+    categories and of cumulative time of imported modules.
+
+    ```json
+    {
+        "total": 5.0,
+        "categories": {"modules": 1.0, "settings": 0.5},
+        "imports": {"openpype.lib": 1.5}
+    }
+    ```
+
+    Args:
+        report_data (dict[str, Any]): Data of startup report.
+        budget (dict[str, Any]): Budget data.
+
+    Returns:
+        list[str]: Messages about exceeded budget.
+    """
+
+    messages = []
+    max_total = budget.get("total")
+    if max_total is not None and report_data["total"] > max_total:
+        messages.append("Startup took {:.3f}s (budget {:.3f}s)".format(
+            report_data["total"], max_total
+        ))
+
+    categories = report_data.get("categories") or {}
+    for category, max_time in (budget.get("categories") or {}).items():
+        duration = categories.get(category, 0.0)
+        if duration > max_time:
+            messages.append("'{}' took {:.3f}s (budget {:.3f}s)".format(
+                category, duration, max_time
+            ))
+
+    imports = report_data.get("imports") or {}
+    for module_name, max_time in (budget.get("imports") or {}).items():
+        import_data = imports.get(module_name)
+        if import_data and import_data["cumulative"] > max_time:
+            messages.append(
+                "Import of '{}' took {:.3f}s (budget {:.3f}s)".format(
+                    module_name, import_data["cumulative"], max_time
+                )
+            )
+    return messages
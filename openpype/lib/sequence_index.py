@@ -0,0 +1,288 @@
+"""Index of files in directory grouped to frame sequences.
+
+Directory is listed only once using 'os.scandir' and file names are parsed
+with single regex to sequences (head, padding, tail) and their frames.
+That is much cheaper than repeated 'os.listdir' and 'clique.assemble' calls
+which try to match every group of digits in every file name.
+
+Index reflects content of directory at the time of first listing. It
+should be used only for directories which are not changed during its
+lifetime (e.g. rendered files during publishing) or refreshed explicitly.
+
+```python
+index = DirectorySequenceIndex("/renders/sh010/beauty")
+missing = index.get_missing_frames("beauty.", ".exr", range(1001, 1101), 4)
+```
+"""
+import os
+import re
+import collections
+
+import clique
+
+# Frame is the last group of digits followed by non-digit suffix, e.g.
+#   'render.1001.exr', 'cache.1001.bgeo.sc' or 'render_1001_beauty.exr'
+_FRAME_REGEX = re.compile(r"^(?P<head>.*?)(?P<frame>\d+)(?P<tail>\D+)$")
+
+
+def _get_frame_padding(frame):
+    if len(frame) > 1 and frame.startswith("0"):
+        return len(frame)
+    return 0
+
+
+def parse_sequence_filename(filename):
+    """Parse frame from file name.
+
+    Args:
+        filename (str): File name e.g. 'beauty.1001.exr'.
+
+    Returns:
+        Union[tuple[str, int, int, str], None]: Head, frame, padding and
+            tail e.g. ('beauty.', 1001, 0, '.exr') or None if file name
+            does not contain frame.
+    """
+
+    match = _FRAME_REGEX.match(filename)
+    if match is None:
+        return None
+    frame = match.group("frame")
+    return (
+        match.group("head"),
+        int(frame),
+        _get_frame_padding(frame),
+        match.group("tail")
+    )
+
+
+class DirectorySequenceIndex(object):
+    """Files of a directory grouped to frame sequences.
+
+    Unpadded frames are merged into padded sequence with the same head and
+    tail if length of frame matches the padding (e.g. 'beauty.0999.exr' and
+    'beauty.1000.exr' are one sequence with padding 4) the same way as
+    'clique.assemble' does.
+
+    Args:
+        dirpath (str): Path to directory.
+    """
+
+    def __init__(self, dirpath):
+        self.dirpath = dirpath
+        self._entries = None
+        self._sequences = None
+        self._remainder = None
+
+    def refresh(self):
+        """Forget listed files so directory is listed again on next query."""
+        self._entries = None
+        self._sequences = None
+        self._remainder = None
+
+    def _list_directory(self):
+        entries = collections.OrderedDict()
+        if not os.path.isdir(self.dirpath):
+            return entries
+
+        # Python 2 hosts don't have 'os.scandir'
+        if not hasattr(os, "scandir"):
+            for filename in sorted(os.listdir(self.dirpath)):
+                entries[filename] = None
+            return entries
+
+        scanned = []
+        for entry in os.scandir(self.dirpath):
+            try:
+                if entry.is_file():
+                    scanned.append((entry.name, entry))
+            except OSError:
+                continue
+        scanned.sort(key=lambda item: item[0])
+        for filename, entry in scanned:
+            entries[filename] = entry
+        return entries
+
+    def _get_entries(self):
+        if self._entries is None:
+            self._entries = self._list_directory()
+        return self._entries
+
+    def _get_sequences(self):
+        if self._sequences is not None:
+            return self._sequences
+
+        groups = collections.defaultdict(dict)
+        remainder = []
+        for filename in self._get_entries():
+            parsed = parse_sequence_filename(filename)
+            if parsed is None:
+                remainder.append(filename)
+                continue
+            head, frame, padding, tail = parsed
+            groups[(head, padding, tail)][frame] = filename
+
+        # Move unpadded frames to padded sequence if length matches
+        for key in sorted(groups.keys()):
+            head, padding, tail = key
+            if not padding:
+                continue
+            unpadded = groups.get((head, 0, tail))
+            if not unpadded:
+                continue
+            for frame, filename in tuple(unpadded.items()):
+                if len(str(frame)) == padding:
+                    groups[key][frame] = unpadded.pop(frame)
+
+        sequences = collections.OrderedDict()
+        for key in sorted(groups.keys()):
+            frames = groups[key]
+            # Single file is not a sequence
+            if len(frames) < 2:
+                remainder.extend(frames.values())
+                continue
+            sequences[key] = frames
+
+        self._sequences = sequences
+        self._remainder = sorted(remainder)
+        return sequences
+
+    @property
+    def filenames(self):
+        """Names of files in directory.
+
+        Returns:
+            list[str]: Sorted file names.
+        """
+
+        return list(self._get_entries().keys())
+
+    @property
+    def remainder(self):
+        """Names of files which are not part of any sequence.
+
+        Returns:
+            list[str]: Sorted file names.
+        """
+
+        self._get_sequences()
+        return list(self._remainder)
+
+    def exists(self, filename):
+        return filename in self._get_entries()
+
+    def get_stat(self, filename):
+        """Stat result of file from directory listing.
+
+        Args:
+            filename (str): Name of file in directory.
+
+        Returns:
+            Union[os.stat_result, None]: Stat result or None if file
+                does not exist.
+        """
+
+        entries = self._get_entries()
+        if filename not in entries:
+            return None
+        entry = entries[filename]
+        if entry is None:
+            return os.stat(os.path.join(self.dirpath, filename))
+        # 'DirEntry' caches the stat result
+        return entry.stat()
+
+    def get_missing_files(self, filenames):
+        """Files which do not exist in directory.
+
+        Args:
+            filenames (Iterable[str]): Expected file names.
+
+        Returns:
+            set[str]: Names of missing files.
+        """
+
+        entries = self._get_entries()
+        return {
+            filename
+            for filename in filenames
+            if filename not in entries
+        }
+
+    def get_sequence_frames(self, head, tail, padding=None):
+        """Frames of sequence with head and tail.
+
+        Args:
+            head (str): Part of file name before frame.
+            tail (str): Part of file name after frame.
+            padding (Optional[int]): Padding of frames, all paddings are
+                used if not passed.
+
+        Returns:
+            dict[int, str]: File names by frame.
+        """
+
+        output = {}
+        for key, frames in self._get_sequences().items():
+            if key[0] != head or key[2] != tail:
+                continue
+            if padding is None or key[1] == padding:
+                output.update(frames)
+        return output
+
+    def get_missing_frames(self, head, tail, frames, padding=0):
+        """Expected frames of sequence which do not exist in directory.
+
+        Args:
+            head (str): Part of file name before frame.
+            tail (str): Part of file name after frame.
+            frames (Iterable[int]): Expected frames.
+            padding (int): Padding of frame in file name.
+
+        Returns:
+            list[int]: Missing frames.
+        """
+
+        entries = self._get_entries()
+        template = "{}{{:0{}d}}{}".format(head, padding or 1, tail)
+        return [
+            frame
+            for frame in frames
+            if template.format(frame) not in entries
+        ]
+
+    def get_collections(self):
+        """Sequences as clique collections.
+
+        Returns:
+            list[clique.Collection]: Collections ordered by head.
+        """
+
+        return [
+            clique.Collection(head, tail, padding, indexes=set(frames))
+            for (head, padding, tail), frames in (
+                self._get_sequences().items()
+            )
+        ]
+
+
+def get_directory_sequence_index(dirpath, cache=None):
+    """Get index of directory from cache or create new one.
+
+    Args:
+        dirpath (str): Path to directory.
+        cache (Optional[dict[str, DirectorySequenceIndex]]): Cache where
+            index is stored, new index is created on each call if not
+            passed.
+
+    Returns:
+        DirectorySequenceIndex: Index of directory.
+    """
+
+    if cache is None:
+        return DirectorySequenceIndex(dirpath)
+
+    key = os.path.normcase(os.path.abspath(dirpath))
+    index = cache.get(key)
+    if index is None:
+        index = DirectorySequenceIndex(dirpath)
+        cache[key] = index
+    return index
@@ -1,9 +1,11 @@
 import os
 import re
+import copy
 import logging
 import json
 import collections
 import tempfile
+import threading
 import subprocess
 import platform
 
@@ -65,6 +67,73 @@ VIDEO_EXTENSIONS = {
     ".roq", ".svi", ".vob", ".webm", ".wmv", ".yuv"
 }
 
+# Max count of cached results of oiiotool and ffprobe probing
+MAX_PROBE_CACHE_SIZE = 512
+# Max count of files probed by one oiiotool process
+MAX_OIIO_BATCH_SIZE = 50
+
+
+class _ProbeCache(object):
+    """Least recently used cache of probed file information.
+
+    Key is created from file path, modification time and size so result
+    is not used if file changed. Copy of value is returned so callers can
+    modify it.
+    """
+
+    def __init__(self, max_size=MAX_PROBE_CACHE_SIZE):
+        self._max_size = max_size
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(filepath, *args):
+        """Cache key of file.
+
+        Returns:
+            Union[tuple, None]: Key or None if file is not available.
+        """
+        try:
+            stat = os.stat(filepath)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (os.path.normpath(os.path.abspath(filepath)),
+                stat.st_mtime, stat.st_size) + args
+
+    def get(self, key):
+        if key is None:
+            return None
+        with self._lock:
+            value = self._items.pop(key, None)
+            if value is None:
+                return None
+            self._items[key] = value
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        if key is None:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_oiio_info_cache = _ProbeCache()
+_ffprobe_cache = _ProbeCache()
+
+
+def clear_probe_cache():
+    """Clear cached results of oiiotool and ffprobe probing."""
+    _oiio_info_cache.clear()
+    _ffprobe_cache.clear()
+
 
 def get_transcode_temp_directory():
     """Creates temporary folder for transcoding.
@@ -81,8 +150,14 @@ def get_transcode_temp_directory():
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Result is cached until file
+    changes.
     """
+    cache_key = _oiio_info_cache.get_key(filepath, bool(subimages))
+    cached_output = _oiio_info_cache.get(cache_key)
+    if cached_output is not None:
+        return cached_output
+
     args = get_oiio_tool_args(
         "oiiotool",
         "--info",
@@ -94,6 +169,81 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     args.extend(["-i:infoformat=xml", filepath])
 
     output = run_subprocess(args, logger=logger)
+    output = _parse_oiio_info_output(output, filepath, logger)
+
+    if not subimages:
+        output = output[0]
+    _oiio_info_cache.set(cache_key, output)
+    return output
+
+
+def get_oiio_info_for_inputs(filepaths, logger=None):
+    """Information about first subimage of multiple inputs.
+
+    Inputs which are not cached are probed by one oiiotool process (per
+    'MAX_OIIO_BATCH_SIZE' files). Useful when header metadata of whole
+    sequence are needed.
+
+    Args:
+        filepaths (Iterable[str]): Paths to image files.
+        logger (Optional[logging.Logger]): Logger used for logging.
+
+    Returns:
+        list[dict[str, Any]]: Information about each input in order of
+            passed filepaths.
+    """
+
+    filepaths = list(filepaths)
+    output = [None] * len(filepaths)
+    cache_keys = {}
+    missing_indexes_by_path = collections.OrderedDict()
+    for idx, filepath in enumerate(filepaths):
+        cache_key = _oiio_info_cache.get_key(filepath, False)
+        cached_output = _oiio_info_cache.get(cache_key)
+        if cached_output is not None:
+            output[idx] = cached_output
+            continue
+        cache_keys[filepath] = cache_key
+        missing_indexes_by_path.setdefault(filepath, []).append(idx)
+
+    missing_paths = list(missing_indexes_by_path.keys())
+    for start in range(0, len(missing_paths), MAX_OIIO_BATCH_SIZE):
+        batch_paths = missing_paths[start:start + MAX_OIIO_BATCH_SIZE]
+        args = get_oiio_tool_args("oiiotool", "--info", "-v")
+        for filepath in batch_paths:
+            args.extend(["-i:infoformat=xml", filepath])
+
+        infos = _parse_oiio_info_output(
+            run_subprocess(args, logger=logger),
+            ", ".join(batch_paths),
+            logger
+        )
+        if len(infos) != len(batch_paths):
+            # Fallback to probe files one by one
+            infos = [
+                get_oiio_info_for_input(filepath, logger=logger)
+                for filepath in batch_paths
+            ]
+
+        for filepath, info in zip(batch_paths, infos):
+            _oiio_info_cache.set(cache_keys[filepath], info)
+            for idx in missing_indexes_by_path[filepath]:
+                output[idx] = copy.deepcopy(info)
+    return output
+
+
+def _parse_oiio_info_output(output, filepath, logger=None):
+    """Parse information of all subimages from oiiotool output.
+
+    Args:
+        output (str): Output of oiiotool with xml info format.
+        filepath (str): Probed path used in error message.
+        logger (Optional[logging.Logger]): Logger used for logging.
+
+    Returns:
+        list[dict[str, Any]]: Information of each subimage.
+    """
+
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -123,10 +273,7 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     for subimage_lines in subimages_lines:
         xml_text = "\n".join(subimage_lines)
         output.append(parse_oiio_xml_output(xml_text, logger=logger))
-
-    if subimages:
-        return output
-    return output[0]
+    return output
 
 
 class RationalToInt:
@@ -771,12 +918,25 @@ def convert_input_paths_for_ffmpeg(
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Result is cached until file changes.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
     """
     if not logger:
         logger = logging.getLogger(__name__)
+
+    cache_key = _ffprobe_cache.get_key(path_to_file)
+    cached_output = _ffprobe_cache.get(cache_key)
+    if cached_output is not None:
+        logger.debug(
+            "Using cached information about input \"{}\".".format(
+                path_to_file
+            )
+        )
+        return cached_output
+
     logger.debug(
         "Getting information about input \"{}\".".format(path_to_file)
     )
@@ -821,7 +981,11 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    output = json.loads(popen_stdout)
+    # Don't cache failed probing
+    if popen.returncode == 0 and "error" not in output:
+        _ffprobe_cache.set(cache_key, output)
+    return output
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
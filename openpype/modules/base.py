@@ -5,7 +5,9 @@ import os
 import sys
 import json
 import time
+import hashlib
 import inspect
+import functools
 import logging
 import platform
 import threading
@@ -42,6 +44,7 @@ from openpype.lib import (
     import_filepath,
     import_module_from_dirpath,
 )
+from openpype.lib.profiling import profile_startup_span
 
 from .interfaces import (
     OpenPypeInterface,
@@ -77,6 +80,19 @@ IGNORED_HOSTS_IN_AYON = {
     "harmony",
 }
 
+# Version of modules manifest format
+MODULES_MANIFEST_VERSION = 1
+MODULES_MANIFEST_FILENAME = "modules_manifest.json"
+
+_ModuleItem = collections.namedtuple(
+    "_ModuleItem", ["basename", "dirpath", "filename", "kind"]
+)
+# Kinds of module items
+_DEFAULT_MODULE = "default"
+_HOST_MODULE = "host"
+_DIR_MODULE = "directory"
+_FILE_MODULE = "file"
+
 
 # Inherit from `object` for Python 2 hosts
 class _ModuleClass(object):
@@ -99,7 +115,7 @@ class _ModuleClass(object):
 
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
                 self.name, attr_name
@@ -107,11 +123,18 @@ class _ModuleClass(object):
         return self.__attributes__[attr_name]
 
     def __iter__(self):
-        for module in self.values():
+        # Lazy modules replace themselves in attributes when are loaded
+        for module in tuple(self.values()):
             yield module
 
     def __setattr__(self, attr_name, value):
-        if attr_name in self.__attributes__:
+        current_value = self.__attributes__.get(attr_name)
+        # Import system sets loaded lazy module to parent module again
+        if (
+            attr_name in self.__attributes__
+            and current_value is not value
+            and not isinstance(current_value, _LazyModule)
+        ):
             self.log.warning(
                 "Duplicated name \"{}\" in {}. Overriding.".format(
                     attr_name, self.name
@@ -156,7 +179,7 @@ class _InterfacesClass(_ModuleClass):
 
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
 
             raise AttributeError((
@@ -178,10 +201,382 @@ class _InterfacesClass(_ModuleClass):
 class _LoadCache:
     interfaces_lock = threading.Lock()
     modules_lock = threading.Lock()
+    # Lazy module can import other lazy module in the same thread
+    lazy_modules_lock = threading.RLock()
     interfaces_loaded = False
     modules_loaded = False
 
 
+class _LazyModule(object):
+    """Python module of addon which is imported on first use.
+
+    Placeholder is stored to 'openpype_modules' instead of imported python
+    module when modules manifest is available. Module is imported on first
+    attribute access and replaces the placeholder.
+
+    Args:
+        name (str): Name of module in 'openpype_modules'.
+        import_func (Callable[[], Union[ModuleType, None]]): Function
+            importing the python module.
+        manifest_data (dict[str, Any]): Data of module from manifest.
+    """
+
+    def __init__(self, name, import_func, manifest_data):
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_import_func", import_func)
+        object.__setattr__(self, "_lazy_module", None)
+        object.__setattr__(self, "manifest_data", manifest_data)
+
+    def __repr__(self):
+        return "<LazyModule {}>".format(self._lazy_name)
+
+    def __getattr__(self, attr_name):
+        return getattr(self.load(), attr_name)
+
+    def __dir__(self):
+        return dir(self.load())
+
+    def load(self):
+        """Import python module if was not imported yet.
+
+        Returns:
+            ModuleType: Imported python module.
+
+        Raises:
+            ImportError: When module import failed.
+        """
+
+        if self._lazy_module is not None:
+            return self._lazy_module
+
+        with _LoadCache.lazy_modules_lock:
+            if self._lazy_module is None:
+                openpype_modules = sys.modules["openpype_modules"]
+                # Remove placeholder so import can store the module
+                attributes = openpype_modules.__attributes__
+                if attributes.get(self._lazy_name) is self:
+                    attributes.pop(self._lazy_name)
+
+                module = self._lazy_import_func()
+                if module is None:
+                    attributes[self._lazy_name] = self
+                    raise ImportError(
+                        "Failed to import module '{}'".format(self._lazy_name)
+                    )
+                attributes[self._lazy_name] = module
+                object.__setattr__(self, "_lazy_module", module)
+        return self._lazy_module
+
+    def get_addons_data(self):
+        """Addons defined in the module based on manifest.
+
+        Returns:
+            list[dict[str, Any]]: Addon class name, name and interfaces.
+        """
+
+        return self.manifest_data.get("addons") or []
+
+    def is_disabled(self, modules_settings):
+        """All addons of the module are disabled in settings.
+
+        Only OpenPype modules with 'enabled' key in their settings can be
+        considered disabled without import.
+
+        Args:
+            modules_settings (dict[str, Any]): Modules system settings.
+
+        Returns:
+            bool: Module does not have to be imported.
+        """
+
+        addons_data = self.get_addons_data()
+        if not addons_data:
+            return False
+
+        for addon_data in addons_data:
+            addon_name = addon_data.get("name")
+            if not addon_data.get("openpype_module") or not addon_name:
+                return False
+            addon_settings = modules_settings.get(addon_name)
+            if (
+                not isinstance(addon_settings, dict)
+                or addon_settings.get("enabled") is not False
+            ):
+                return False
+        return True
+
+
+class _LazyModuleLoader(object):
+    """Loader of lazy module imported using full name.
+
+    Loader is used for imports like 'import openpype_modules.ftrack'.
+    """
+
+    def __init__(self, lazy_module):
+        self._lazy_module = lazy_module
+        self._original_spec = None
+
+    def create_module(self, spec):
+        module = self._lazy_module.load()
+        self._original_spec = getattr(module, "__spec__", None)
+        return module
+
+    def exec_module(self, module):
+        # Module is already executed, keep its original spec
+        if self._original_spec is not None:
+            module.__spec__ = self._original_spec
+
+
+class _LazyModulesFinder(object):
+    """Import hook which imports lazy modules from 'openpype_modules'."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        parts = fullname.split(".")
+        if len(parts) != 2 or parts[0] != "openpype_modules":
+            return None
+
+        openpype_modules = sys.modules.get("openpype_modules")
+        if not isinstance(openpype_modules, _ModuleClass):
+            return None
+
+        lazy_module = openpype_modules.get(parts[1])
+        if not isinstance(lazy_module, _LazyModule):
+            return None
+
+        import importlib.machinery
+
+        return importlib.machinery.ModuleSpec(
+            fullname, _LazyModuleLoader(lazy_module)
+        )
+
+
+class _LazyDisabledAddon(object):
+    """Disabled addon which was not imported.
+
+    Addon is imported and initialized on first access to an attribute
+    which is not available on the placeholder.
+
+    Args:
+        manager (ModulesManager): Manager which created the placeholder.
+        settings (dict[str, Any]): Modules settings.
+        lazy_module (_LazyModule): Module where addon is defined.
+        addon_data (dict[str, Any]): Data of addon from manifest.
+    """
+
+    enabled = False
+
+    def __init__(self, manager, settings, lazy_module, addon_data):
+        self.manager = manager
+        self.name = addon_data["name"]
+        self.class_name = addon_data["class"]
+        self._settings = settings
+        self._lazy_module = lazy_module
+        self._addon = None
+        self._id = None
+
+    def __repr__(self):
+        return "<LazyDisabledAddon {}>".format(self.name)
+
+    @property
+    def id(self):
+        if self._id is None:
+            self._id = uuid4()
+        return self._id
+
+    def get_addon(self):
+        """Import and initialize the addon.
+
+        Returns:
+            AYONAddon: Initialized addon.
+        """
+
+        if self._addon is None:
+            addon_class = getattr(self._lazy_module.load(), self.class_name)
+            self._addon = addon_class(self.manager, self._settings)
+        return self._addon
+
+    def cli(self, click_group):
+        # Disabled addons are not imported to add cli commands
+        pass
+
+    def __getattr__(self, attr_name):
+        if attr_name.startswith("__") or attr_name in (
+            "_addon", "_lazy_module", "_settings"
+        ):
+            raise AttributeError(attr_name)
+        return getattr(self.get_addon(), attr_name)
+
+
+def is_lazy_modules_loading_enabled():
+    """Modules can be imported lazily using modules manifest.
+
+    Lazy loading is not available in AYON mode and in Python 2. It can be
+    disabled with 'OPENPYPE_LAZY_MODULES' environment variable set to '0'.
+
+    Returns:
+        bool: Lazy loading is enabled.
+    """
+
+    if AYON_SERVER_ENABLED or six.PY2:
+        return False
+    return os.environ.get("OPENPYPE_LAZY_MODULES") != "0"
+
+
+def get_modules_manifest_path():
+    """Path to manifest of modules.
+
+    Manifest is stored next to cached default settings, directory can be
+    changed with 'OPENPYPE_SETTINGS_CACHE_DIR' environment variable.
+
+    Returns:
+        str: Path to manifest file.
+    """
+
+    cache_dir = os.environ.get("OPENPYPE_SETTINGS_CACHE_DIR")
+    if not cache_dir:
+        cache_dir = appdirs.user_data_dir("openpype", "pypeclub")
+    return os.path.join(cache_dir, MODULES_MANIFEST_FILENAME)
+
+
+def _get_modules_fingerprint(module_items):
+    """Fingerprint of modules used to validate manifest.
+
+    Fingerprint is based on modification time and size of module files.
+    For module directories are used python files in root of the directory.
+
+    Args:
+        module_items (list[_ModuleItem]): Modules to import.
+
+    Returns:
+        str: Fingerprint of modules.
+    """
+
+    from openpype.version import __version__
+
+    stats = [str(MODULES_MANIFEST_VERSION), __version__]
+    sorted_items = sorted(
+        module_items, key=lambda item: (item.dirpath, item.filename)
+    )
+    for item in sorted_items:
+        if item.kind == _HOST_MODULE:
+            continue
+        path = os.path.join(item.dirpath, item.filename)
+        paths = [path]
+        if os.path.isdir(path):
+            paths = [
+                os.path.join(path, filename)
+                for filename in sorted(os.listdir(path))
+                if filename.endswith(".py")
+            ]
+
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats.append("{}|{}|{}".format(path, stat.st_mtime, stat.st_size))
+
+    return hashlib.md5("\n".join(stats).encode("utf-8")).hexdigest()
+
+
+def _read_modules_manifest(fingerprint):
+    """Read modules manifest if is valid for the fingerprint.
+
+    Returns:
+        Union[dict[str, dict[str, Any]], None]: Manifest data by module
+            name or None if manifest is not available.
+    """
+
+    manifest_path = get_modules_manifest_path()
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, "r") as stream:
+            data = json.load(stream)
+    except Exception:
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != MODULES_MANIFEST_VERSION
+        or data.get("fingerprint") != fingerprint
+    ):
+        return None
+    return data.get("modules")
+
+
+def _get_module_addons_data(module):
+    addons_data = []
+    for name in dir(module):
+        modules_item = getattr(module, name, None)
+        if (
+            not inspect.isclass(modules_item)
+            or modules_item is AYONAddon
+            or modules_item is OpenPypeModule
+            or modules_item is OpenPypeAddOn
+            or not issubclass(modules_item, AYONAddon)
+            or inspect.isabstract(modules_item)
+        ):
+            continue
+
+        addon_name = getattr(modules_item, "name", None)
+        if not isinstance(addon_name, six.string_types):
+            addon_name = None
+
+        addons_data.append({
+            "class": name,
+            "name": addon_name,
+            "openpype_module": issubclass(modules_item, OpenPypeModule),
+            "interfaces": sorted(
+                cls.__name__
+                for cls in inspect.getmro(modules_item)
+                if (
+                    issubclass(cls, OpenPypeInterface)
+                    and cls is not OpenPypeInterface
+                )
+            ),
+        })
+    return addons_data
+
+
+def _write_modules_manifest(fingerprint, module_items, openpype_modules, log):
+    """Store information about imported modules to manifest.
+
+    Manifest is created only if all modules were imported successfully.
+    """
+
+    modules_data = {}
+    for item in module_items:
+        if item.kind == _HOST_MODULE:
+            continue
+        module = openpype_modules.get(item.basename)
+        if module is None:
+            return
+        modules_data[item.basename] = {
+            "addons": _get_module_addons_data(module)
+        }
+
+    manifest_path = get_modules_manifest_path()
+    tmp_path = "{}.{}.tmp".format(manifest_path, os.getpid())
+    try:
+        dirpath = os.path.dirname(manifest_path)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+        with open(tmp_path, "w") as stream:
+            json.dump({
+                "version": MODULES_MANIFEST_VERSION,
+                "fingerprint": fingerprint,
+                "modules": modules_data
+            }, stream, indent=4)
+        os.replace(tmp_path, manifest_path)
+
+    except Exception:
+        log.debug("Failed to write modules manifest.", exc_info=True)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def get_default_modules_dir():
     """Path to default OpenPype modules."""
 
@@ -550,6 +945,7 @@ def _load_modules():
     if AYON_SERVER_ENABLED:
         ignored_current_dir_filenames |= IGNORED_FILENAMES_IN_AYON
 
+    module_items = []
     processed_paths = set()
     for dirpath in frozenset(module_dirs):
         # Skip already processed paths
@@ -603,50 +999,117 @@ def _load_modules():
             elif ext not in (".py", ):
                 continue
 
-            # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
-            try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
+            if is_in_current_dir:
+                kind = _DEFAULT_MODULE
+            elif is_in_host_dir:
+                kind = _HOST_MODULE
+            elif os.path.isdir(fullpath):
+                kind = _DIR_MODULE
+            else:
+                kind = _FILE_MODULE
+            module_items.append(
+                _ModuleItem(basename, dirpath, filename, kind)
+            )
 
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
+    manifest = None
+    fingerprint = None
+    lazy_loading = is_lazy_modules_loading_enabled()
+    if lazy_loading:
+        fingerprint = _get_modules_fingerprint(module_items)
+        manifest = _read_modules_manifest(fingerprint)
+
+    if manifest is not None and not any(
+        isinstance(finder, _LazyModulesFinder)
+        for finder in sys.meta_path
+    ):
+        sys.meta_path.append(_LazyModulesFinder())
+
+    for item in module_items:
+        manifest_data = None
+        if manifest is not None and item.kind != _HOST_MODULE:
+            manifest_data = manifest.get(item.basename)
+
+        if manifest_data is None:
+            _import_module_item(item, openpype_modules, modules_key, log)
+            continue
 
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
+        setattr(openpype_modules, item.basename, _LazyModule(
+            item.basename,
+            functools.partial(
+                _import_module_item, item, openpype_modules, modules_key, log
+            ),
+            manifest_data
+        ))
 
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+    if lazy_loading and manifest is None:
+        _write_modules_manifest(
+            fingerprint, module_items, openpype_modules, log
+        )
+
+
+def _import_module_item(item, openpype_modules, modules_key, log):
+    """Import module and store it to 'openpype_modules'.
+
+    Args:
+        item (_ModuleItem): Module to import.
+        openpype_modules (_ModuleClass): Where module is stored.
+        modules_key (str): Name of 'openpype_modules' in 'sys.modules'.
+        log (logging.Logger): Logger.
+
+    Returns:
+        Union[ModuleType, None]: Imported module or None if import failed.
+    """
+
+    basename = item.basename
+    dirpath = item.dirpath
+    fullpath = os.path.join(dirpath, item.filename)
+    new_import_str = "{}.{}".format(modules_key, basename)
+    try:
+        # Don't import dynamically current directory modules
+        if item.kind == _DEFAULT_MODULE:
+            import_str = "openpype.modules.{}".format(basename)
+            default_module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = default_module
+            setattr(openpype_modules, basename, default_module)
+            return default_module
+
+        if item.kind == _HOST_MODULE:
+            import_str = "openpype.hosts.{}".format(basename)
+            # Until all hosts are converted to be able use them as
+            #   modules is this error check needed
+            try:
+                default_module = __import__(
+                    import_str, fromlist=("", )
+                )
+                sys.modules[new_import_str] = default_module
+                setattr(openpype_modules, basename, default_module)
+                return default_module
 
             except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+                log.warning(
+                    "Failed to import host folder {}".format(basename),
+                    exc_info=True
+                )
+            return None
+
+        if item.kind == _DIR_MODULE:
+            return import_module_from_dirpath(
+                dirpath, item.filename, modules_key
+            )
+
+        module = import_filepath(fullpath)
+        setattr(openpype_modules, basename, module)
+        return module
+
+    except Exception:
+        if item.kind == _DEFAULT_MODULE:
+            msg = "Failed to import default module '{}'.".format(
+                basename
+            )
+        else:
+            msg = "Failed to import module '{}'.".format(fullpath)
+        log.error(msg, exc_info=True)
+    return None
 
 
 @six.add_metaclass(ABCMeta)
@@ -872,6 +1335,7 @@ class ModulesManager:
             return module
         return default
 
+    @profile_startup_span("modules")
     def initialize_modules(self):
         """Import and initialize modules."""
         # Make sure modules are loaded
@@ -900,7 +1364,28 @@ class ModulesManager:
         prev_start_time = time_start
 
         module_classes = []
+        lazy_addons = []
         for module in openpype_modules:
+            if isinstance(module, _LazyModule):
+                # Module without addons or with only disabled addons does
+                #   not have to be imported
+                if not module.get_addons_data():
+                    continue
+
+                if module.is_disabled(modules_settings):
+                    lazy_addons.extend(
+                        _LazyDisabledAddon(
+                            self, modules_settings, module, addon_data
+                        )
+                        for addon_data in module.get_addons_data()
+                    )
+                    continue
+
+                try:
+                    module = module.load()
+                except ImportError:
+                    continue
+
             # Go through globals in `pype.modules`
             for name in dir(module):
                 modules_item = getattr(module, name, None)
@@ -963,6 +1448,12 @@ class ModulesManager:
                     exc_info=True
                 )
 
+        for module in lazy_addons:
+            self.modules.append(module)
+            self.modules_by_id[module.id] = module
+            self.modules_by_name[module.name] = module
+            self.log.debug("[ ] {} (not imported)".format(module.class_name))
+
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
@@ -4,6 +4,7 @@ import requests
 import pyblish.api
 
 from openpype.lib import collect_frames
+from openpype.pipeline.publish import get_publish_sequence_index
 from openpype_modules.deadline.abstract_submit_deadline import requests_get
 
 
@@ -38,7 +39,9 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
             expected_files = self._get_expected_files(repre)
 
             staging_dir = repre["stagingDir"]
-            existing_files = self._get_existing_files(staging_dir)
+            sequence_index = get_publish_sequence_index(
+                instance.context, staging_dir
+            )
 
             if self.allow_user_override:
                 # We always check for user override because the user might have
@@ -80,7 +83,7 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
 
             # We don't use set.difference because we do allow other existing
             # files to be in the folder that we might not want to use.
-            missing = expected_files - existing_files
+            missing = sequence_index.get_missing_files(expected_files)
             if missing:
                 raise RuntimeError(
                     "Missing expected files: {}\n"
@@ -88,7 +91,7 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
                     "Existing files: {}".format(
                         sorted(missing),
                         sorted(expected_files),
-                        sorted(existing_files)
+                        sequence_index.filenames
                     )
                 )
 
@@ -225,13 +228,6 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
             return json_content.pop()
         return {}
 
-    def _get_existing_files(self, staging_dir):
-        """Returns set of existing file names from 'staging_dir'"""
-        existing_files = set()
-        for file_name in os.listdir(staging_dir):
-            existing_files.add(file_name)
-        return existing_files
-
     def _get_expected_files(self, repre):
         """Returns set of file names in representation['files']
 
@@ -556,6 +556,8 @@ class Delivery(BaseAction):
         format_dict = get_format_dict(anatomy, location_path)
 
         datetime_data = get_datetime_data()
+        # Source directories are listed only once for all representations
+        sequence_indexes = {}
         for repre in repres_to_deliver:
             source_path = repre.get("data", {}).get("path")
             debug_msg = "Processing representation {}".format(repre["_id"])
@@ -596,7 +598,7 @@ class Delivery(BaseAction):
             if not frame:
                 deliver_single_file(*args)
             else:
-                deliver_sequence(*args)
+                deliver_sequence(*args, sequence_indexes=sequence_indexes)
 
         return self.report(report_items)
 
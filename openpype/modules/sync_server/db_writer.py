@@ -0,0 +1,183 @@
+"""Batched writes of synchronization state to DB."""
+import time
+import threading
+import collections
+
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+
+from openpype.lib import Logger
+
+
+class SyncDBWriter(object):
+    """Coalesce updates of transferred files.
+
+    Progress of all files is collected and written to DB with single
+    'bulk_write' per project at most once per 'interval'. Only last progress
+    of a file is written.
+
+    Other updates (results of synchronization) are collected and written
+    with single 'bulk_write' per project when 'max_updates' is reached or
+    'updates_interval' elapsed from first collected update.
+
+    Args:
+        connection (AvalonMongoDB): Connection to DB.
+        interval (float): Minimum seconds between writes of progress.
+        on_updates_written (Optional[Callable[[str, set], None]]): Called
+            with project name and ids of updated representations after
+            updates of the project were written.
+    """
+
+    log = Logger.get_logger("SyncDBWriter")
+    max_updates = 200
+    updates_interval = 2.0
+
+    def __init__(self, connection, interval, on_updates_written=None):
+        self._connection = connection
+        self._interval = interval
+        self._on_updates_written = on_updates_written
+        self._progress = {}
+        self._last_flush = 0
+        self._updates = collections.defaultdict(list)
+        self._updated_ids = collections.defaultdict(set)
+        self._updates_count = 0
+        self._first_update_time = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._updates_lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(project_name, representation_id, file_id, site):
+        return (project_name, representation_id, file_id, site)
+
+    def add_progress(self, project_name, representation_id, file_id, site,
+                     progress):
+        """Store progress of file, written to DB with next flush.
+
+        Args:
+            project_name (str): Project name.
+            representation_id (Union[str, ObjectId]): Representation id.
+            file_id (Union[str, ObjectId]): File id.
+            site (str): Site name.
+            progress (float): Progress 0-1.
+        """
+        key = self._get_key(project_name, representation_id, file_id, site)
+        with self._lock:
+            self._progress[key] = progress
+            should_flush = time.time() - self._last_flush >= self._interval
+
+        if should_flush:
+            self.flush()
+
+    def discard_progress(self, project_name, representation_id, file_id,
+                         site):
+        """Drop not written progress of file.
+
+        Should be called before final state of file is stored. When method
+        returns no progress of the file is being written.
+        """
+        key = self._get_key(project_name, representation_id, file_id, site)
+        with self._flush_lock:
+            with self._lock:
+                self._progress.pop(key, None)
+
+    def flush(self):
+        """Write collected progress to DB."""
+        with self._flush_lock:
+            with self._lock:
+                progress_items, self._progress = self._progress, {}
+                self._last_flush = time.time()
+
+            operations_by_project = collections.defaultdict(list)
+            for key, progress in progress_items.items():
+                project_name, representation_id, file_id, site = key
+                array_filters = [{"s.name": site}]
+                if file_id:
+                    array_filters.append({"f._id": ObjectId(file_id)})
+                operations_by_project[project_name].append(UpdateOne(
+                    {"_id": ObjectId(representation_id)},
+                    {"$set": {"files.$[f].sites.$[s].progress": progress}},
+                    array_filters=array_filters
+                ))
+
+            self._write(operations_by_project, "progress")
+
+    def add_update(self, project_name, operation, representation_id=None):
+        """Add update operation which is written with next flush.
+
+        Args:
+            project_name (str): Project name.
+            operation (pymongo.UpdateOne): Update operation.
+            representation_id (Optional[Union[str, ObjectId]]): Id of
+                updated representation passed to 'on_updates_written'.
+        """
+        with self._updates_lock:
+            self._updates[project_name].append(operation)
+            if representation_id:
+                self._updated_ids[project_name].add(representation_id)
+            self._updates_count += 1
+            if self._first_update_time is None:
+                self._first_update_time = time.time()
+            should_flush = self._updates_count >= self.max_updates
+
+        if should_flush:
+            self.flush_updates()
+
+    def flush_updates_if_due(self):
+        """Write collected updates if 'updates_interval' elapsed."""
+        with self._updates_lock:
+            should_flush = (
+                self._first_update_time is not None
+                and (
+                    time.time() - self._first_update_time
+                    >= self.updates_interval
+                )
+            )
+        if should_flush:
+            self.flush_updates()
+
+    def flush_updates(self):
+        """Write all collected updates to DB."""
+        with self._updates_lock:
+            updates, self._updates = (
+                self._updates, collections.defaultdict(list)
+            )
+            updated_ids, self._updated_ids = (
+                self._updated_ids, collections.defaultdict(set)
+            )
+            self._updates_count = 0
+            self._first_update_time = None
+
+        written_projects = self._write(updates, "updates")
+        if self._on_updates_written is None:
+            return
+
+        for project_name in written_projects:
+            representation_ids = updated_ids.get(project_name)
+            if representation_ids:
+                self._on_updates_written(project_name, representation_ids)
+
+    def _write(self, operations_by_project, label):
+        """Write operations to DB.
+
+        Returns:
+            list[str]: Projects which were written successfully.
+        """
+        written_projects = []
+        for project_name, operations in operations_by_project.items():
+            if not operations:
+                continue
+            try:
+                self._connection.database[project_name].bulk_write(
+                    operations, ordered=False
+                )
+            except Exception:
+                self.log.warning(
+                    "Failed to store {} of files in project '{}'".format(
+                        label, project_name
+                    ),
+                    exc_info=True
+                )
+                continue
+            written_projects.append(project_name)
+        return written_projects
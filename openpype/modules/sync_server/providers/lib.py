@@ -13,7 +13,8 @@ class ProviderFactory:
     def __init__(self):
         self.providers = {}  # {'PROVIDER_LABEL: {cls, int},..}
 
-    def register_provider(self, provider, creator, batch_limit):
+    def register_provider(self, provider, creator, batch_limit,
+                          concurrency_limit=None):
         """
             Provide all necessary information for one specific remote provider
         Args:
@@ -21,10 +22,15 @@ class ProviderFactory:
             creator (class): class implementing AbstractProvider
             batch_limit (int): number of files that could be processed in
                                     one loop (based on provider API quota)
+            concurrency_limit (int): number of files that could be
+                transferred at the same time, 'batch_limit' is used if not
+                passed
         Returns:
             modifies self.providers and self.sites
         """
-        self.providers[provider] = (creator, batch_limit)
+        if concurrency_limit is None:
+            concurrency_limit = batch_limit
+        self.providers[provider] = (creator, batch_limit, concurrency_limit)
 
     def get_provider(self, provider, project_name, site_name,
                      tree=None, presets=None):
@@ -67,6 +73,19 @@ class ProviderFactory:
         info = self._get_creator_info(provider)
         return info[1]
 
+    def get_provider_concurrency_limit(self, provider):
+        """
+            Each provider has limit of files that could be transferred at
+            the same time. Limit is based on API quota of provider or on
+            reasonable count of parallel file operations.
+        Args:
+            provider (string): 'gdrive','S3'
+        Returns:
+            (int)
+        """
+        info = self._get_creator_info(provider)
+        return info[2]
+
     def get_provider_configurable_items(self, provider):
         """
             Returns dict of modifiable properties for 'provider'.
@@ -93,12 +112,14 @@ class ProviderFactory:
         Args:
             provider (string): 'gdrive' etc
         Returns:
-            (tuple): (creator, batch_limit)
+            (tuple): (creator, batch_limit, concurrency_limit)
                 creator is class of a provider (ex: GDriveHandler)
                 batch_limit denotes how many files synced at single loop
                    its provided via 'register_provider' as its needed even
                    before provider class is initialized itself
                    (setting it as a class variable didn't work)
+                concurrency_limit denotes how many files can be transferred
+                   at the same time
         """
         creator_info = self.providers.get(provider)
         if not creator_info:
@@ -112,7 +133,8 @@ factory = ProviderFactory()
 # there is implementing 'GDriveHandler' class
 # 7 denotes number of files that could be synced in single loop - learned by
 # trial and error
-factory.register_provider(GDriveHandler.CODE, GDriveHandler, 7)
-factory.register_provider(DropboxHandler.CODE, DropboxHandler, 10)
-factory.register_provider(LocalDriveHandler.CODE, LocalDriveHandler, 50)
-factory.register_provider(SFTPHandler.CODE, SFTPHandler, 20)
+# last number denotes number of files transferred at the same time
+factory.register_provider(GDriveHandler.CODE, GDriveHandler, 7, 2)
+factory.register_provider(DropboxHandler.CODE, DropboxHandler, 10, 3)
+factory.register_provider(LocalDriveHandler.CODE, LocalDriveHandler, 50, 4)
+factory.register_provider(SFTPHandler.CODE, SFTPHandler, 20, 3)
@@ -1,12 +1,11 @@
 import os
 import os.path
-import time
-import threading
 import platform
 
 from openpype.lib import Logger
 from openpype.settings import get_system_settings
 from .abstract_provider import AbstractProvider
+from .transfer import TransferProgress
 log = Logger.get_logger("SyncServer-SFTPHandler")
 
 pysftp = None
@@ -254,18 +253,16 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "upload")
+        progress = TransferProgress(server, project_name, file,
+                                    representation, site, "Upload")
+        self._upload(source_path, target_path, progress)
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
+    def _upload(self, source_path, target_path, callback=None):
         print("copying {}->{}".format(source_path, target_path))
         conn = self._get_conn()
-        conn.put(source_path, target_path)
+        conn.put(source_path, target_path, callback=callback)
 
     def download_file(self, source_path, target_path,
                       server, project_name, file, representation, site,
@@ -300,18 +297,16 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "download")
+        progress = TransferProgress(server, project_name, file,
+                                    representation, site, "Download")
+        self._download(source_path, target_path, progress)
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
+    def _download(self, source_path, target_path, callback=None):
         print("downloading {}->{}".format(source_path, target_path))
         conn = self._get_conn()
-        conn.get(source_path, target_path)
+        conn.get(source_path, target_path, callback=callback)
 
     def delete_file(self, path):
         """
@@ -425,40 +420,3 @@ class SFTPHandler(AbstractProvider):
         except (paramiko.ssh_exception.SSHException,
                 pysftp.exceptions.ConnectionException):
             self.log.warning("Couldn't connect", exc_info=True)
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                self.log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
@@ -0,0 +1,175 @@
+"""Helpers for file transfers shared by providers."""
+import os
+import sys
+import time
+import errno
+import shutil
+
+from openpype.lib import Logger
+
+log = Logger.get_logger("SyncServer")
+
+# Size of chunk copied at once
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Errors of zero-copy functions meaning that function can't be used for
+#   entered files and other method should be used
+_ZERO_COPY_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EBADF,
+    errno.ENOTSUP,
+    errno.ENOTSOCK,
+    getattr(errno, "EOPNOTSUPP", errno.ENOTSUP),
+}
+
+
+class TransferProgress:
+    """Progress callback of single file transfer.
+
+    Progress is passed to sync server at most once per 'LOG_PROGRESS_SEC'.
+    Can be used as callback for 'copy_file' or for 'pysftp' transfers.
+
+    Args:
+        server (SyncServerModule): Server to store progress.
+        project_name (str): Project name.
+        file (dict): Info about transferred file.
+        representation (dict): Representation containing 'file'.
+        site (str): Site name.
+        direction (str): Label used in log.
+    """
+
+    def __init__(self, server, project_name, file, representation, site,
+                 direction="Transfer"):
+        self._server = server
+        self._project_name = project_name
+        self._file = file
+        self._representation = representation
+        self._site = site
+        self._direction = direction
+        self._interval = server.LOG_PROGRESS_SEC
+        self._last_tick = None
+
+    def __call__(self, transferred, total):
+        current_time = time.time()
+        if (
+            self._last_tick is not None
+            and current_time - self._last_tick < self._interval
+        ):
+            return
+
+        self._last_tick = current_time
+        progress = 0.0
+        if total:
+            progress = float(transferred) / total
+        log.debug("{}ed {}%.".format(self._direction, int(progress * 100)))
+        self._server.update_db(project_name=self._project_name,
+                               new_file_id=None,
+                               file=self._file,
+                               representation=self._representation,
+                               site=self._site,
+                               progress=progress)
+
+
+def _zero_copy(src_fd, dst_fd, total, callback, chunk_size):
+    """Copy file content in kernel without reading it to python.
+
+    Returns:
+        bool: File was copied, False when zero-copy can't be used.
+
+    Raises:
+        IOError: When source file ended before all bytes were copied.
+    """
+    functions = []
+    if hasattr(os, "copy_file_range"):
+        functions.append(
+            lambda offset, count: os.copy_file_range(
+                src_fd, dst_fd, count, offset, offset
+            )
+        )
+    # 'sendfile' on macOS and BSD requires socket as destination
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        functions.append(
+            lambda offset, count: os.sendfile(dst_fd, src_fd, offset, count)
+        )
+
+    for func in functions:
+        copied = 0
+        try:
+            while copied < total:
+                size = func(copied, min(chunk_size, total - copied))
+                if size == 0:
+                    break
+                copied += size
+                if callback is not None:
+                    callback(copied, total)
+
+        except OSError as exc:
+            # Try other method only if nothing was copied yet
+            if copied or exc.errno not in _ZERO_COPY_UNSUPPORTED_ERRNOS:
+                raise
+            continue
+
+        # Some filesystems report nothing copied instead of an error
+        if not copied:
+            continue
+
+        if copied < total:
+            raise IOError(
+                "File copy was truncated. Copied {} of {} bytes.".format(
+                    copied, total
+                )
+            )
+        return True
+    return False
+
+
+def copy_file(source_path, target_path, callback=None,
+              chunk_size=COPY_CHUNK_SIZE):
+    """Copy file with permission bits and report progress.
+
+    Zero-copy 'os.copy_file_range' or 'os.sendfile' is used when available,
+    otherwise file is copied by chunks.
+
+    Args:
+        source_path (str): Path to source file.
+        target_path (str): Path to target file.
+        callback (Optional[Callable[[int, int], None]]): Called with
+            count of copied bytes and size of the file after each chunk.
+        chunk_size (int): Size of chunk copied at once.
+
+    Returns:
+        int: Count of copied bytes.
+
+    Raises:
+        shutil.SameFileError: When source and target is the same file.
+    """
+    if (
+        os.path.exists(target_path)
+        and os.path.samefile(source_path, target_path)
+    ):
+        raise shutil.SameFileError(
+            "{!r} and {!r} are the same file".format(source_path, target_path)
+        )
+
+    total = os.path.getsize(source_path)
+    if callback is not None:
+        callback(0, total)
+
+    with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+        if total and not _zero_copy(
+            src.fileno(), dst.fileno(), total, callback, chunk_size
+        ):
+            copied = 0
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                dst.write(chunk)
+                copied += len(chunk)
+                if callback is not None:
+                    callback(copied, total)
+
+    shutil.copymode(source_path, target_path)
+    return total
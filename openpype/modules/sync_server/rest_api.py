@@ -1,3 +1,5 @@
+import json
+
 from aiohttp.web_response import Response
 from openpype.lib import Logger
 
@@ -29,9 +31,22 @@ class SyncServerModuleRestApi:
             self.prefix + "/reset_timer",
             self.reset_timer,
         )
+        self.server_manager.add_route(
+            "GET",
+            self.prefix + "/metrics",
+            self.get_metrics,
+        )
 
     async def reset_timer(self, _request):
         """Force timer to run immediately."""
         self.module.reset_timer()
 
         return Response(status=200)
+
+    async def get_metrics(self, _request):
+        """Metrics of sync queue and running transfers."""
+        return Response(
+            status=200,
+            body=json.dumps(self.module.get_sync_metrics()),
+            content_type="application/json"
+        )
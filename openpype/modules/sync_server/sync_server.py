@@ -1,7 +1,11 @@
 """Python 3 only implementation."""
 import os
+import time
+import heapq
 import asyncio
+import itertools
 import threading
+import collections
 import concurrent.futures
 from time import sleep
 
@@ -285,11 +289,227 @@ def download_last_published_workfile(
     return last_published_workfile_path
 
 
+class SyncTransfer:
+    """Single file waiting for upload or download.
+
+    Args:
+        project_name (str): Project name.
+        file (dict): Info about file from representation.
+        representation (dict): Representation which 'file' belongs to.
+        status (int): 'SyncStatus.DO_UPLOAD' or 'SyncStatus.DO_DOWNLOAD'.
+        provider_name (str): Provider of remote site.
+        remote_site (str): Remote site name.
+        site (str): Site which is updated in DB after transfer.
+        tree (dict): Folder structure of remote site.
+        preset (dict): Remote site config.
+        priority (int): Priority of representation.
+    """
+
+    def __init__(self, project_name, file, representation, status,
+                 provider_name, remote_site, site, tree, preset, priority):
+        self.project_name = project_name
+        self.file = file
+        self.representation = representation
+        self.status = status
+        self.provider_name = provider_name
+        self.remote_site = remote_site
+        self.site = site
+        self.tree = tree
+        self.preset = preset
+        self.priority = priority
+
+    @property
+    def key(self):
+        # multiple representations could have same file path (textures)
+        return self.project_name, self.file.get("path", "")
+
+    def run(self, module):
+        """Create coroutine transferring the file."""
+        func = upload
+        if self.status == SyncStatus.DO_DOWNLOAD:
+            func = download
+        return func(module,
+                    self.project_name,
+                    self.file,
+                    self.representation,
+                    self.provider_name,
+                    self.remote_site,
+                    self.tree,
+                    self.preset)
+
+
+class SyncTransferQueue:
+    """Queue of transfers split by provider.
+
+    Transfers are ordered by priority of representation. Transfers with
+    same priority are interleaved across projects so single project with
+    many files does not block other projects.
+    """
+
+    def __init__(self):
+        self._heaps = collections.defaultdict(list)
+        self._keys = set()
+        self._project_counts = collections.Counter()
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def clear(self):
+        self._heaps.clear()
+        self._keys.clear()
+        self._project_counts.clear()
+
+    def put(self, transfer):
+        """Add transfer to queue.
+
+        Returns:
+            bool: Transfer was added, file is not in queue yet.
+        """
+        key = transfer.key
+        if key in self._keys:
+            return False
+
+        # order of file in its project to interleave projects
+        project_order = self._project_counts[transfer.project_name]
+        self._project_counts[transfer.project_name] += 1
+        self._keys.add(key)
+        heapq.heappush(
+            self._heaps[transfer.provider_name],
+            (-transfer.priority, project_order, next(self._counter), transfer)
+        )
+        return True
+
+    def pop(self, provider_names):
+        """Pop first transfer of entered providers.
+
+        Args:
+            provider_names (Iterable[str]): Providers which can start
+                transfer.
+
+        Returns:
+            Union[SyncTransfer, None]: Transfer or None if there is no
+                transfer for entered providers.
+        """
+        heap = None
+        for provider_name in provider_names:
+            _heap = self._heaps.get(provider_name)
+            if _heap and (heap is None or _heap[0] < heap[0]):
+                heap = _heap
+
+        if heap is None:
+            return None
+
+        transfer = heapq.heappop(heap)[-1]
+        self._keys.discard(transfer.key)
+        self._project_counts[transfer.project_name] -= 1
+        return transfer
+
+    def get_provider_names(self):
+        return [
+            provider_name
+            for provider_name, heap in self._heaps.items()
+            if heap
+        ]
+
+    def get_depth_by_provider(self):
+        return {
+            provider_name: len(heap)
+            for provider_name, heap in self._heaps.items()
+            if heap
+        }
+
+
+class SyncMetrics:
+    """Metrics of sync server transfers.
+
+    Metrics are changed from sync server thread and read from webserver
+    thread.
+    """
+
+    throughput_window = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue_depth = {}
+        self._in_flight = {}
+        self._finished = 0
+        self._failed = 0
+        self._finished_times = collections.deque()
+        self._transferred_duration = 0.0
+        self._last_loop_duration = None
+
+    def set_state(self, queue_depth, in_flight):
+        """Store current count of queued and transferred files.
+
+        Args:
+            queue_depth (dict[str, int]): Queued files by provider.
+            in_flight (dict[str, int]): Transferred files by provider.
+        """
+        with self._lock:
+            self._queue_depth = queue_depth
+            self._in_flight = in_flight
+
+    def add_finished(self, duration, failed):
+        with self._lock:
+            if failed:
+                self._failed += 1
+            else:
+                self._finished += 1
+            self._transferred_duration += duration
+            self._finished_times.append(time.time())
+
+    def set_loop_duration(self, duration):
+        with self._lock:
+            self._last_loop_duration = duration
+
+    def get_data(self):
+        """Metrics data which can be converted to json.
+
+        Returns:
+            dict[str, Any]: Metrics data.
+        """
+        with self._lock:
+            window_start = time.time() - self.throughput_window
+            while (
+                self._finished_times
+                and self._finished_times[0] < window_start
+            ):
+                self._finished_times.popleft()
+
+            return {
+                "queue_depth": sum(self._queue_depth.values()),
+                "queue_depth_by_provider": dict(self._queue_depth),
+                "in_flight": sum(self._in_flight.values()),
+                "in_flight_by_provider": dict(self._in_flight),
+                "finished": self._finished,
+                "failed": self._failed,
+                # files per minute
+                "throughput": (
+                    len(self._finished_times) * 60.0 / self.throughput_window
+                ),
+                "transferred_duration": self._transferred_duration,
+                "last_loop_duration": self._last_loop_duration,
+            }
+
+
 class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
         Stopped when tray is closed.
+
+        Each loop collects files to sync from all enabled projects into
+        a queue. Queued files are transferred continuously, limited by
+        'max_transfers' and by concurrency limit of each provider, so
+        single slow project does not block others.
     """
+
+    # maximum number of files transferred at the same time
+    max_transfers = 8
+
     def __init__(self, module):
         self.log = Logger.get_logger(self.__class__.__name__)
 
@@ -297,8 +517,19 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        # one additional worker for long running tasks
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_transfers + 1
+        )
         self.timer = None
+        self.metrics = SyncMetrics()
+
+        self._queue = SyncTransferQueue()
+        self._queue_event = None
+        self._in_flight = {}
+        self._in_flight_by_provider = collections.Counter()
+        # files finished during current loop
+        self._finished_keys = set()
 
     def run(self):
         self.is_running = True
@@ -308,8 +539,10 @@ class SyncServerThread(threading.Thread):
             self.loop = asyncio.new_event_loop()  # create new loop for thread
             asyncio.set_event_loop(self.loop)
             self.loop.set_default_executor(self.executor)
+            self._queue_event = asyncio.Event()
 
             asyncio.ensure_future(self.check_shutdown(), loop=self.loop)
+            asyncio.ensure_future(self.dispatch_loop(), loop=self.loop)
             asyncio.ensure_future(self.sync_loop(), loop=self.loop)
             self.log.info("Sync Server Started")
             self.loop.run_forever()
@@ -328,131 +561,35 @@ class SyncServerThread(threading.Thread):
                     credentials)
                 - for each project_name it looks for representations that
                   should be synced
-                - synchronize found collections
-                - update representations - fills error messages for exceptions
+                - adds found files to queue, files are synchronized
+                  by 'dispatch_loop'
                 - waits X seconds and repeat
         Returns:
 
         """
         while self.is_running and not self.module.is_paused():
             try:
-                import time
                 start_time = time.time()
                 self.module.set_sync_project_settings()  # clean cache
                 project_name = None
+                # queue is filled again with current state from DB
+                self._queue.clear()
+                self._finished_keys.clear()
                 enabled_projects = self.module.get_enabled_projects()
                 for project_name in enabled_projects:
-                    preset = self.module.sync_project_settings[project_name]
-
-                    local_site, remote_site = self._working_sites(project_name,
-                                                                  preset)
-                    if not all([local_site, remote_site]):
-                        continue
-
-                    sync_repres = self.module.get_sync_representations(
-                        project_name,
-                        local_site,
-                        remote_site
-                    )
-
-                    task_files_to_process = []
-                    files_processed_info = []
-                    # process only unique file paths in one batch
-                    # multiple representation could have same file path
-                    # (textures),
-                    # upload process can find already uploaded file and
-                    # reuse same id
-                    processed_file_path = set()
-
-                    site_preset = preset.get('sites')[remote_site]
-                    remote_provider = \
-                        self.module.get_provider_for_site(site=remote_site)
-                    handler = lib.factory.get_provider(remote_provider,
-                                                       project_name,
-                                                       remote_site,
-                                                       presets=site_preset)
-                    limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
-                    # first call to get_provider could be expensive, its
-                    # building folder tree structure in memory
-                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
-                    for sync in sync_repres:
-                        if limit <= 0:
-                            continue
-                        files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
-
+                    # scan must see results written in batches
+                    self.module.db_writer.flush_updates()
+                    self._queue_project_files(project_name)
+                    # let dispatcher start transfers of queued files
+                    self._queue_event.set()
+                    await asyncio.sleep(0)
+
+                self._update_metrics_state()
+                self.log.debug("Sync queue count {}, in progress {}".format(
+                    len(self._queue), len(self._in_flight)
+                ))
                 duration = time.time() - start_time
+                self.metrics.set_loop_duration(duration)
                 self.log.debug("One loop took {:.2f}s".format(duration))
                 delay = self.module.get_loop_delay(project_name)
                 self.log.debug(
@@ -478,6 +615,147 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    def _queue_project_files(self, project_name):
+        """Add files of project which should be synchronized to queue."""
+        preset = self.module.sync_project_settings[project_name]
+
+        local_site, remote_site = self._working_sites(project_name, preset)
+        if not all([local_site, remote_site]):
+            return
+
+        sync_repres = self.module.get_sync_representations(
+            project_name,
+            local_site,
+            remote_site
+        )
+
+        site_preset = preset.get('sites')[remote_site]
+        remote_provider = self.module.get_provider_for_site(site=remote_site)
+        handler = lib.factory.get_provider(remote_provider,
+                                           project_name,
+                                           remote_site,
+                                           presets=site_preset)
+        # first call to get_provider could be expensive, its
+        # building folder tree structure in memory
+        # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+        for sync in sync_repres:
+            files = sync.get("files") or []
+            priority = sync.get("priority", self.module.DEFAULT_PRIORITY)
+            for file in files:
+                # skip files which are already processed
+                # upload process can find already uploaded file and
+                # reuse same id
+                key = (project_name, file.get('path', ''))
+                if (
+                    key in self._queue
+                    or key in self._in_flight
+                    or key in self._finished_keys
+                ):
+                    continue
+
+                status = self.module.check_status(
+                    file,
+                    local_site,
+                    remote_site,
+                    preset.get('config'))
+                if status == SyncStatus.DO_UPLOAD:
+                    site = remote_site
+                elif status == SyncStatus.DO_DOWNLOAD:
+                    site = local_site
+                else:
+                    continue
+
+                self._queue.put(SyncTransfer(
+                    project_name,
+                    file,
+                    sync,
+                    status,
+                    remote_provider,
+                    remote_site,
+                    site,
+                    handler.get_tree(),
+                    site_preset,
+                    priority
+                ))
+
+    async def dispatch_loop(self):
+        """Start transfers of queued files when there is free slot."""
+        while self.is_running:
+            await self._queue_event.wait()
+            self._queue_event.clear()
+
+            while len(self._in_flight) < self.max_transfers:
+                provider_names = [
+                    provider_name
+                    for provider_name in self._queue.get_provider_names()
+                    if (
+                        self._in_flight_by_provider[provider_name]
+                        < lib.factory.get_provider_concurrency_limit(
+                            provider_name)
+                    )
+                ]
+                transfer = self._queue.pop(provider_names)
+                if transfer is None:
+                    break
+                self._in_flight[transfer.key] = transfer
+                self._in_flight_by_provider[transfer.provider_name] += 1
+                asyncio.create_task(self._process_transfer(transfer))
+
+            self._update_metrics_state()
+
+    async def _process_transfer(self, transfer):
+        """Transfer single file and store result to DB."""
+        start_time = time.time()
+        file_id = None
+        error = None
+        try:
+            file_id = await transfer.run(self.module)
+        except asyncio.exceptions.CancelledError:
+            raise
+        except Exception as exc:
+            error = str(exc)
+        finally:
+            self._in_flight.pop(transfer.key, None)
+            self._in_flight_by_provider[transfer.provider_name] -= 1
+            self._finished_keys.add(transfer.key)
+            self._queue_event.set()
+
+        self.metrics.add_finished(time.time() - start_time, bool(error))
+        try:
+            # results are written in batches, see 'SyncDBWriter'
+            self.module.update_db(transfer.project_name,
+                                  file_id,
+                                  transfer.file,
+                                  transfer.representation,
+                                  transfer.site,
+                                  error,
+                                  batch=True)
+        except Exception:
+            self.log.warning(
+                "Failed to store result of file sync", exc_info=True)
+
+    def _update_metrics_state(self):
+        self.metrics.set_state(
+            self._queue.get_depth_by_provider(),
+            {
+                provider_name: count
+                for provider_name, count in (
+                    self._in_flight_by_provider.items()
+                )
+                if count
+            }
+        )
+
+    def get_metrics(self):
+        """Metrics of sync queue and transfers.
+
+        Returns:
+            dict[str, Any]: Metrics data.
+        """
+        data = self.metrics.get_data()
+        data["max_transfers"] = self.max_transfers
+        return data
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -493,7 +771,9 @@ class SyncServerThread(threading.Thread):
                 await self.loop.run_in_executor(None, task["func"])
                 self.log.info("finished long running")
                 self.module.projects_processed.remove(task["project_name"])
+            self._flush_db_updates(force=False)
             await asyncio.sleep(0.5)
+        self._flush_db_updates(force=True)
         tasks = [task for task in asyncio.all_tasks() if
                  task is not asyncio.current_task()]
         list(map(lambda task: task.cancel(), tasks))  # cancel all the tasks
@@ -506,6 +786,16 @@ class SyncServerThread(threading.Thread):
         await asyncio.sleep(0.07)
         self.loop.stop()
 
+    def _flush_db_updates(self, force):
+        try:
+            if force:
+                self.module.db_writer.flush_updates()
+            else:
+                self.module.db_writer.flush_updates_if_due()
+        except Exception:
+            self.log.warning(
+                "Failed to store results of file sync", exc_info=True)
+
     async def run_timer(self, delay):
         """Wait for 'delay' seconds to start next loop"""
         await asyncio.sleep(delay)
@@ -8,6 +8,7 @@ import signal
 from collections import deque, defaultdict
 
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
@@ -38,6 +39,13 @@ from openpype.settings.constants import (
 from .providers.local_drive import LocalDriveHandler
 from .providers import lib
 
+from .db_writer import SyncDBWriter
+from .sync_state import (
+    SyncRepresentationsState,
+    SyncStateRegistry,
+    ensure_sync_indexes,
+    object_id_from_timestamp,
+)
 from .utils import (
     time_function,
     SyncStatus,
@@ -112,6 +120,13 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    # query only new and changed representations, full scan of all
+    # representations is done only once per 'FULL_SYNC_SCAN_INTERVAL'
+    INCREMENTAL_SYNC = True
+    FULL_SYNC_SCAN_INTERVAL = 1800
+    # seconds of created representations queried again before last loop
+    # - representation ids are created before they are stored to DB
+    SYNC_SCAN_OVERLAP = 900
 
     name = "sync_server"
     label = "Sync Queue"
@@ -139,6 +154,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self._anatomies = {}
 
         self._connection = None
+        self._db_writer = None
+
+        # states for incremental sync by project and sites
+        self._sync_states = {}
+        self._sync_state_registry = SyncStateRegistry()
+        self._sync_indexes_projects = set()
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
@@ -1135,6 +1156,19 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         else:
             self.sync_server_thread.reset_timer()
 
+    def get_sync_metrics(self):
+        """Metrics of sync queue and running transfers.
+
+        Metrics are available only in process where sync server is running.
+
+        Returns:
+            dict[str, Any]: Metrics data, empty if server is not running.
+        """
+
+        if not self.enabled or self.sync_server_thread is None:
+            return {}
+        return self.sync_server_thread.get_metrics()
+
     def is_representation_on_site(
         self, project_name, representation_id, site_name, max_retries=None
     ):
@@ -1503,6 +1537,16 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         return self._connection
 
+    @property
+    def db_writer(self):
+        if self._db_writer is None:
+            self._db_writer = SyncDBWriter(
+                self.connection,
+                self.LOG_PROGRESS_SEC,
+                self._on_batch_updates_written
+            )
+        return self._db_writer
+
     @property
     def sync_system_settings(self):
         if self._sync_system_settings is None:
@@ -1707,6 +1751,130 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             (list) of dictionaries
         """
         self.log.debug("Check representations for : {}".format(project_name))
+        if self.INCREMENTAL_SYNC:
+            try:
+                return self._get_sync_representations_incremental(
+                    project_name, active_site, remote_site
+                )
+            except Exception:
+                self.log.warning(
+                    "Incremental query of representations failed, using"
+                    " full scan.", exc_info=True
+                )
+                self._sync_states.pop(
+                    (project_name, active_site, remote_site), None
+                )
+
+        return list(self._query_sync_representations(
+            project_name, active_site, remote_site
+        ))
+
+    def _get_sync_state(self, project_name, active_site, remote_site):
+        key = (project_name, active_site, remote_site)
+        state = self._sync_states.get(key)
+        if state is None:
+            state = SyncRepresentationsState(
+                project_name, active_site, remote_site
+            )
+            self._sync_state_registry.load(state)
+            self._sync_states[key] = state
+        return state
+
+    def _mark_representation_changed(self, project_name, representation_id):
+        """Representation must be queried again by incremental sync."""
+        if not representation_id:
+            return
+        for key, state in tuple(self._sync_states.items()):
+            if key[0] == project_name:
+                state.mark_changed(representation_id)
+
+    def _on_batch_updates_written(self, project_name, representation_ids):
+        for representation_id in representation_ids:
+            self._mark_representation_changed(
+                project_name, representation_id
+            )
+
+    def _get_sync_representations_incremental(
+        self, project_name, active_site, remote_site
+    ):
+        """Get representations to sync using incremental state.
+
+        New representations and representations changed by this module
+        or captured by change stream are queried. Result is merged into
+        representations waiting for sync from previous loops.
+
+        Changes of sites made by other processes (e.g. loader actions in
+        DCCs) can be detected only by change stream. Full scan is used on
+        each loop if change stream is not available (standalone MongoDB).
+        """
+        collection = self.connection.database[project_name]
+        if project_name not in self._sync_indexes_projects:
+            self._sync_indexes_projects.add(project_name)
+            try:
+                ensure_sync_indexes(collection)
+            except Exception:
+                self.log.warning(
+                    "Failed to create sync indexes for project '{}'".format(
+                        project_name), exc_info=True
+                )
+
+        state = self._get_sync_state(project_name, active_site, remote_site)
+        scan_time = time.time()
+        if not state.collect_stream_changes(collection):
+            # change stream is not available or was invalidated, changes
+            #   of other processes could be missed
+            state.last_full_scan = None
+
+        if state.needs_full_scan(self.FULL_SYNC_SCAN_INTERVAL, scan_time):
+            self.log.debug("Full scan of representations to sync")
+            representations = self._query_sync_representations(
+                project_name, active_site, remote_site
+            )
+            state.set_full_scan_result(representations, scan_time)
+
+        else:
+            changed_ids = state.pop_changed_ids()
+            range_start_id = object_id_from_timestamp(
+                state.high_water_mark - self.SYNC_SCAN_OVERLAP
+            )
+            id_filters = [{"_id": {"$gt": range_start_id}}]
+            if changed_ids:
+                id_filters.append({"_id": {"$in": list(changed_ids)}})
+            self.log.debug(
+                "Incremental scan of representations to sync,"
+                " {} changed".format(len(changed_ids))
+            )
+            representations = self._query_sync_representations(
+                project_name, active_site, remote_site,
+                {"$or": id_filters}
+            )
+            state.set_incremental_result(
+                representations, changed_ids, range_start_id, scan_time
+            )
+
+        try:
+            self._sync_state_registry.save(state)
+        except Exception:
+            self.log.warning(
+                "Failed to store state of sync", exc_info=True
+            )
+        return state.get_representations(self.DEFAULT_PRIORITY)
+
+    def _query_sync_representations(
+        self, project_name, active_site, remote_site, id_filter=None
+    ):
+        """Aggregate representations which should be synced.
+
+        Args:
+            project_name (str): Project name.
+            active_site (str): Active site name.
+            remote_site (str): Remote site name.
+            id_filter (Optional[dict]): Additional filter of representation
+                ids.
+
+        Returns:
+            Iterable[dict]: Representations to sync.
+        """
         self.connection.Session["AVALON_PROJECT"] = project_name
         # retry_cnt - number of attempts to sync specific file before giving up
         retries_arr = self._get_retries_arr(project_name)
@@ -1751,6 +1919,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             ]
         }
 
+        if id_filter:
+            match = {"$and": [id_filter, match]}
+
         aggr = [
             {"$match": match},
             {'$unwind': '$files'},
@@ -1852,7 +2023,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         return SyncStatus.DO_NOTHING
 
     def update_db(self, project_name, new_file_id, file, representation,
-                  site, error=None, progress=None, priority=None):
+                  site, error=None, progress=None, priority=None,
+                  batch=False):
         """
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
@@ -1867,6 +2039,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             error (string): exception message
             progress (float): 0-0.99 of progress of upload/download
             priority (int): 0-100 set priority
+            batch (bool): write update with other updates using
+                'bulk_write', update is written with next flush of
+                'db_writer'
 
         Returns:
             None
@@ -1880,13 +2055,18 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             "_id": representation_id
         }
 
+        if progress is not None and not new_file_id:
+            # progress is written in batches with progress of other files
+            self.db_writer.add_progress(
+                project_name, representation_id, file_id, site, progress
+            )
+            return
+
         update = {}
         if new_file_id:
             update["$set"] = self._get_success_dict(new_file_id)
             # reset previous errors if any
             update["$unset"] = self._get_error_dict("", "", "")
-        elif progress is not None:
-            update["$set"] = self._get_progress_dict(progress)
         elif priority is not None:
             update["$set"] = self._get_priority_dict(priority, file_id)
         else:
@@ -1901,14 +2081,32 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
+        if priority is None:
+            # progress written later would override final state
+            self.db_writer.discard_progress(
+                project_name, representation_id, file_id, site
+            )
+
+        if batch:
+            # representation is marked as changed when update is written
+            self.db_writer.add_update(project_name, UpdateOne(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            ), representation_id)
+        else:
+            self.connection.database[project_name].update_one(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            )
+            self._mark_representation_changed(
+                project_name, representation_id
+            )
 
-        if progress is not None or priority is not None:
+        if priority is not None:
             return
 
         status = 'failed'
@@ -2059,6 +2257,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             upsert=True,
             array_filters=arr_filter
         )
+        self._mark_representation_changed(project_name, representation_id)
 
     def _reset_site_for_file(self, project_name, representation_id,
                              elem, file_id, site_name):
@@ -0,0 +1,306 @@
+"""Incremental detection of representations which should be synchronized.
+
+Full aggregation over all representations of a project is expensive on
+big projects. State of site pair keeps representations waiting for
+synchronization in memory and only representations created after high water
+mark or changed since previous loop are queried again. Full scan is still
+triggered periodically to reconcile changes which were not captured.
+
+Changes made by other processes are captured only by change stream which
+requires MongoDB running as replica set. Full scan is used on each loop
+without it.
+"""
+import time
+import datetime
+import threading
+
+from bson.objectid import ObjectId
+
+from openpype.lib import Logger
+from openpype.lib.local_settings import OpenPypeSettingsRegistry
+
+# Name of index created on representations for sync queries
+SYNC_INDEX_NAME = "sync_server_sites"
+
+
+def object_id_from_timestamp(timestamp):
+    """Lowest possible ObjectId created at 'timestamp'.
+
+    Args:
+        timestamp (float): Unix timestamp.
+
+    Returns:
+        ObjectId: Object id usable for range queries.
+    """
+    return ObjectId.from_datetime(
+        datetime.datetime(1970, 1, 1)
+        + datetime.timedelta(seconds=max(0, timestamp))
+    )
+
+
+def ensure_sync_indexes(collection):
+    """Create indexes used by queries of representations to synchronize.
+
+    Index is partial, it contains only representation documents.
+
+    Args:
+        collection (pymongo.collection.Collection): Project collection.
+    """
+    collection.create_index(
+        [
+            ("files.sites.name", 1),
+            ("files.sites.created_dt", 1),
+        ],
+        name=SYNC_INDEX_NAME,
+        partialFilterExpression={"type": "representation"},
+        background=True
+    )
+
+
+class SyncRepresentationsState(object):
+    """Representations waiting for synchronization between 2 sites.
+
+    Args:
+        project_name (str): Project name.
+        active_site (str): Active site name.
+        remote_site (str): Remote site name.
+    """
+
+    log = Logger.get_logger("SyncRepresentationsState")
+
+    def __init__(self, project_name, active_site, remote_site):
+        self.project_name = project_name
+        self.active_site = active_site
+        self.remote_site = remote_site
+
+        self.high_water_mark = None
+        self.last_full_scan = None
+        # Representations waiting for synchronization by their id
+        self.pending = {}
+        # Ids loaded from registry which were not queried yet
+        self.unresolved_ids = set()
+
+        self.change_stream = None
+        self.change_stream_available = True
+
+        self._changed_ids = set()
+        self._lock = threading.Lock()
+
+    @property
+    def key(self):
+        return "|".join(
+            (self.project_name, self.active_site, self.remote_site)
+        )
+
+    def mark_changed(self, representation_id):
+        """Representation was changed and must be queried again."""
+        with self._lock:
+            self._changed_ids.add(ObjectId(representation_id))
+
+    def pop_changed_ids(self):
+        """Ids of changed representations since last call.
+
+        Returns:
+            set[ObjectId]: Changed representation ids.
+        """
+        with self._lock:
+            changed_ids, self._changed_ids = self._changed_ids, set()
+        changed_ids |= self.unresolved_ids
+        self.unresolved_ids = set()
+        return changed_ids
+
+    def needs_full_scan(self, interval, current_time=None):
+        """Full scan should be used instead of incremental query.
+
+        Args:
+            interval (int): Seconds between full scans.
+            current_time (Optional[float]): Current time.
+
+        Returns:
+            bool: Full scan is needed.
+        """
+        if self.high_water_mark is None or self.last_full_scan is None:
+            return True
+        if current_time is None:
+            current_time = time.time()
+        return current_time - self.last_full_scan >= interval
+
+    def set_full_scan_result(self, representations, scan_time):
+        """Replace waiting representations with result of full scan.
+
+        Args:
+            representations (Iterable[dict]): Representations to sync.
+            scan_time (float): Time when scan started.
+        """
+        self.pending = {
+            repre["_id"]: repre
+            for repre in representations
+        }
+        self.unresolved_ids = set()
+        self.high_water_mark = scan_time
+        self.last_full_scan = scan_time
+
+    def set_incremental_result(
+        self, representations, queried_ids, range_start_id, scan_time
+    ):
+        """Update waiting representations with result of incremental query.
+
+        Representations which were queried, but are not in result, don't
+        need synchronization anymore.
+
+        Args:
+            representations (Iterable[dict]): Representations to sync.
+            queried_ids (set[ObjectId]): Ids of changed representations
+                used in query.
+            range_start_id (ObjectId): Representations with higher id were
+                queried.
+            scan_time (float): Time when scan started.
+        """
+        for repre_id in tuple(self.pending.keys()):
+            if repre_id in queried_ids or repre_id > range_start_id:
+                self.pending.pop(repre_id)
+
+        for repre in representations:
+            self.pending[repre["_id"]] = repre
+        self.high_water_mark = scan_time
+
+    def get_representations(self, default_priority):
+        """Representations to sync ordered by priority.
+
+        Args:
+            default_priority (int): Priority used if representation does not
+                have any.
+
+        Returns:
+            list[dict]: Representations to sync.
+        """
+        return sorted(
+            self.pending.values(),
+            key=lambda repre: (
+                -repre.get("priority", default_priority), repre["_id"]
+            )
+        )
+
+    def collect_stream_changes(self, collection, max_events=10000):
+        """Collect ids of documents changed since last call.
+
+        Change streams are available only if MongoDB is running as replica
+        set. Stream is disabled for the state if it can't be opened.
+
+        Args:
+            collection (pymongo.collection.Collection): Project collection.
+            max_events (int): Maximum events read in single call.
+
+        Returns:
+            bool: Changes were collected, False when change stream is not
+                available or was invalidated and full scan is required.
+        """
+        if not self.change_stream_available:
+            return False
+
+        if self.change_stream is None:
+            try:
+                self.change_stream = collection.watch(
+                    [{"$match": {
+                        "operationType": {
+                            "$in": ["insert", "update", "replace"]
+                        }
+                    }}],
+                    max_await_time_ms=100
+                )
+            except Exception:
+                self.log.debug((
+                    "Change stream is not available for project '{}'."
+                    " Using full scan of representations."
+                ).format(self.project_name), exc_info=True)
+                self.change_stream_available = False
+                return False
+
+        changed_ids = set()
+        try:
+            for _ in range(max_events):
+                event = self.change_stream.try_next()
+                if event is None:
+                    break
+                changed_ids.add(event["documentKey"]["_id"])
+
+        except Exception:
+            self.log.warning((
+                "Change stream of project '{}' failed."
+                " Full scan will be used."
+            ).format(self.project_name), exc_info=True)
+            self.close_change_stream()
+            return False
+
+        with self._lock:
+            self._changed_ids |= changed_ids
+        return True
+
+    def close_change_stream(self):
+        if self.change_stream is not None:
+            try:
+                self.change_stream.close()
+            except Exception:
+                pass
+        self.change_stream = None
+
+    def to_data(self):
+        """Data which can be stored to registry.
+
+        Returns:
+            dict[str, Any]: Serializable data of state.
+        """
+        return {
+            "high_water_mark": self.high_water_mark,
+            "last_full_scan": self.last_full_scan,
+            "pending_ids": [
+                str(repre_id)
+                for repre_id in self.pending.keys()
+            ]
+        }
+
+    def update_from_data(self, data):
+        """Restore state from data stored in registry.
+
+        Waiting representations are not stored, only their ids which are
+        queried again in next incremental query.
+
+        Args:
+            data (dict[str, Any]): Data created with 'to_data'.
+        """
+        self.high_water_mark = data.get("high_water_mark")
+        self.last_full_scan = data.get("last_full_scan")
+        self.unresolved_ids = {
+            ObjectId(repre_id)
+            for repre_id in data.get("pending_ids") or []
+        }
+
+
+class SyncStateRegistry(object):
+    """Persistent storage of site pair states.
+
+    States are stored to local registry so sync server does not have to
+    do full scan of all projects after restart.
+    """
+
+    registry_name = "sync_server_state"
+
+    def __init__(self):
+        self._registry = None
+
+    @property
+    def registry(self):
+        if self._registry is None:
+            self._registry = OpenPypeSettingsRegistry(self.registry_name)
+        return self._registry
+
+    def load(self, state):
+        """Fill state with stored data if there are any."""
+        try:
+            data = self.registry.get_item(state.key)
+        except ValueError:
+            return
+        state.update_from_data(data)
+
+    def save(self, state):
+        self.registry.set_item(state.key, state.to_data())
@@ -43,11 +43,13 @@ from .load import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
 
     loaders_from_representation,
     get_representation_path,
     get_representation_context,
+    get_representation_contexts_bulk,
     get_repres_contexts,
 )
 
@@ -147,11 +149,13 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
 
     "loaders_from_representation",
     "get_representation_path",
     "get_representation_context",
+    "get_representation_contexts_bulk",
     "get_repres_contexts",
 
     # --- Publish ---
@@ -145,6 +145,10 @@ class BaseAnatomy(object):
         """Wrapper for Roots `find_root_template_from_path`."""
         return self.roots_obj.find_root_template_from_path(*args, **kwargs)
 
+    def find_root_templates_from_paths(self, *args, **kwargs):
+        """Wrapper for Roots `find_root_templates_from_paths`."""
+        return self.roots_obj.find_root_templates_from_paths(*args, **kwargs)
+
     def path_remapper(self, *args, **kwargs):
         """Wrapper for Roots `path_remapper`."""
         return self.roots_obj.path_remapper(*args, **kwargs)
@@ -640,6 +644,25 @@ class AnatomyStringTemplate(StringTemplate):
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_sequence(self, data, key="frame", strict=True):
+        """Prepare formatter filling only single key and add 'root' to data.
+
+        Args:
+            data (dict[str, Any]): Formatting data for template.
+            key (str): Key which is different for each output.
+            strict (bool): Validate the formatted template.
+
+        Returns:
+            SequenceTemplateFormatter: Formatter filling only the key.
+        """
+
+        if not data.get("root"):
+            data = copy.deepcopy(data)
+            data["root"] = self.anatomy_templates.anatomy.roots
+        return super(AnatomyStringTemplate, self).format_sequence(
+            data, key, strict
+        )
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -986,7 +1009,8 @@ class AnatomyTemplates(TemplatesDict):
         return output
 
     def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+        # Formatting does not modify data so shallow copy is enough
+        copy_data = copy.copy(data)
         roots = self.roots
         if roots:
             copy_data["root"] = roots
@@ -1231,6 +1255,91 @@ class RootItem(FormatObject):
         return (result, output)
 
 
+class RootsPrefixIndex(object):
+    """Prefix tree of root values of all platforms.
+
+    Finds root which owns a path in time relative to length of the path
+    instead of comparing path with each root value of each platform.
+    Result is the same as checking roots in order with 'startswith', i.e.
+    first root (and first platform of the root) which matches wins.
+    Windows root values are matched case insensitive.
+
+    Args:
+        roots (Union[RootItem, dict[str, Any]]): Roots to index.
+    """
+
+    def __init__(self, roots):
+        self._tree = {}
+        self._lower_tree = {}
+
+        order = 0
+        for root_name, root_item in self._iter_root_items(roots):
+            replacement = "{" + root_item.full_key() + "}"
+            for root_os, root_path in root_item.cleaned_data.items():
+                # Skip empty paths
+                if not root_path:
+                    continue
+
+                tree = self._tree
+                if root_os == "windows":
+                    root_path = root_path.lower()
+                    tree = self._lower_tree
+
+                node = tree
+                for char in root_path:
+                    node = node.setdefault(char, {})
+
+                # Keep only first root with the same value
+                if None not in node:
+                    node[None] = (
+                        order, root_name, replacement, len(root_path)
+                    )
+                order += 1
+
+    @classmethod
+    def _iter_root_items(cls, roots, root_name=None):
+        if isinstance(roots, RootItem):
+            yield root_name, roots
+            return
+
+        for key, value in roots.items():
+            for item in cls._iter_root_items(value, root_name or key):
+                yield item
+
+    def find_root(self, path):
+        """Find root which owns the path.
+
+        Args:
+            path (str): Path where root should be found.
+
+        Returns:
+            Union[tuple[str, str], None]: Name of root and path with root
+                value replaced with formatting key or None if path is not
+                in any root.
+        """
+
+        mod_path = str(path).replace("\\", "/")
+        match = None
+        for tree, value in (
+            (self._tree, mod_path),
+            (self._lower_tree, mod_path.lower()),
+        ):
+            node = tree
+            for char in value:
+                node = node.get(char)
+                if node is None:
+                    break
+
+                item = node.get(None)
+                if item is not None and (match is None or item < match):
+                    match = item
+
+        if match is None:
+            return None
+        _, root_name, replacement, root_len = match
+        return root_name, replacement + mod_path[root_len:]
+
+
 class Roots:
     """Object which should be used for formatting "root" key in templates.
 
@@ -1245,6 +1354,7 @@ class Roots:
         self.anatomy = anatomy
         self.loaded_project = None
         self._roots = None
+        self._prefix_index = None
 
     def __format__(self, *args, **kwargs):
         return self.roots.__format__(*args, **kwargs)
@@ -1255,6 +1365,16 @@ class Roots:
     def reset(self):
         """Reset current roots value."""
         self._roots = None
+        self._prefix_index = None
+
+    def _get_prefix_index(self, roots):
+        """Prefix index of roots, index of project roots is cached."""
+        if roots is not self._roots:
+            return RootsPrefixIndex(roots)
+
+        if self._prefix_index is None:
+            self._prefix_index = RootsPrefixIndex(roots)
+        return self._prefix_index
 
     def path_remapper(
         self, path, dst_platform=None, src_platform=None, roots=None
@@ -1327,15 +1447,60 @@ class Roots:
         if isinstance(roots, RootItem):
             return roots.find_root_template_from_path(path)
 
-        for root_name, _root in roots.items():
-            success, result = self.find_root_template_from_path(path, _root)
-            if success:
-                log.info("Found match in root \"{}\".".format(root_name))
-                return success, result
+        match = self._get_prefix_index(roots).find_root(path)
+        if match is not None:
+            root_name, result = match
+            log.info("Found match in root \"{}\".".format(root_name))
+            return True, result
 
         log.warning("No matching root was found in current setting.")
         return (False, path)
 
+    def find_root_templates_from_paths(self, paths, roots=None):
+        """Find root values in multiple paths.
+
+        Same as 'find_root_template_from_path' for each path but without
+        logging of each path.
+
+        Args:
+            paths (Iterable[str]): Source paths where root will be searched.
+            roots (Roots/dict, optional): It is possible to use different
+                roots than instance where method was triggered has.
+
+        Returns:
+            list[tuple[bool, str]]: Success and path with or without
+                replaced root for each passed path.
+
+        Raises:
+            ValueError: When roots are not entered and can't be loaded.
+        """
+        if roots is None:
+            roots = self.roots
+
+        if roots is None:
+            raise ValueError("Roots are not set. Can't find path.")
+
+        if isinstance(roots, RootItem):
+            roots = {roots.name: roots}
+
+        prefix_index = self._get_prefix_index(roots)
+        output = []
+        for path in paths:
+            match = prefix_index.find_root(path)
+            if match is None:
+                output.append((False, path))
+            else:
+                output.append((True, match[1]))
+
+        missing = len([item for item in output if not item[0]])
+        if missing:
+            log.warning(
+                "No matching root was found for {} of {} paths.".format(
+                    missing, len(output)
+                )
+            )
+        return output
+
     def set_root_environments(self):
         """Set root environments for current project."""
         for key, value in self.root_environments().items():
@@ -1471,6 +1636,7 @@ class Roots:
 
         if self._roots is None:
             self._roots = self._discover()
+            self._prefix_index = None
             self.loaded_project = self.project_name
         return self._roots
 
@@ -1,10 +1,15 @@
 import re
 import os
 import json
+import time
+import atexit
+import hashlib
 import contextlib
 import functools
 import platform
 import tempfile
+import threading
+import subprocess
 import warnings
 from copy import deepcopy
 
@@ -13,6 +18,9 @@ from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
     Logger
 )
 from openpype.pipeline import Anatomy
@@ -21,6 +29,12 @@ from openpype.lib.transcoding import VIDEO_EXTENSIONS, IMAGE_EXTENSIONS
 
 log = Logger.get_logger(__name__)
 
+# Environment variable which can disable usage of long running ocio wrapper
+OCIO_WORKER_ENV_KEY = "OPENPYPE_OCIO_WORKER"
+# Must match 'SERVER_RESPONSE_PREFIX' in 'ocio_wrapper.py'
+OCIO_WORKER_RESPONSE_PREFIX = "OCIO_WRAPPER_RESPONSE:"
+OCIO_CACHE_DIRNAME = "ocio_cache"
+
 
 class CachedData:
     remapping = None
@@ -420,10 +434,186 @@ def get_data_subprocess(config_path, data_type):
     )
 
 
+class _OCIOWrapperWorkerError(Exception):
+    """Communication with ocio wrapper worker failed."""
+    pass
+
+
+class _OCIOWrapperWorker(object):
+    """Long running ocio wrapper process answering queries.
+
+    Process is started on first query using 'server' command of
+    'ocio_wrapper.py' and is stopped on exit of current process. Queries
+    and responses are json lines sent over stdin and stdout.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self._process = None
+        self._request_id = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            atexit.register(cls._instance.stop)
+        return cls._instance
+
+    @staticmethod
+    def is_enabled():
+        return os.environ.get(OCIO_WORKER_ENV_KEY) != "0"
+
+    def _is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self):
+        args = get_openpype_execute_args(
+            "run", get_ocio_config_script_path(), "server"
+        )
+        env = clean_envs_for_openpype_process(os.environ)
+        # Only keep OpenPype version if we are running from build.
+        if not is_running_from_build():
+            env.pop("OPENPYPE_VERSION", None)
+
+        kwargs = {
+            "stdin": subprocess.PIPE,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT,
+            "env": env,
+        }
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = (
+                subprocess.CREATE_NEW_PROCESS_GROUP
+                | getattr(subprocess, "CREATE_NO_WINDOW", 0)
+            )
+
+        log.debug("Starting ocio wrapper worker: {}".format(" ".join(args)))
+        try:
+            self._process = subprocess.Popen(args, **kwargs)
+        except (OSError, KeyError) as exc:
+            raise _OCIOWrapperWorkerError(
+                "Failed to start ocio wrapper worker: {}".format(exc)
+            )
+
+    def stop(self):
+        with self._lock:
+            self._stop()
+
+    def _stop(self):
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+
+        try:
+            # Server stops when stdin is closed
+            process.stdin.close()
+        except (IOError, OSError):
+            pass
+
+        for _ in range(20):
+            if process.poll() is not None:
+                return
+            time.sleep(0.1)
+        process.kill()
+
+    def query(self, command_group, command, **kwargs):
+        """Send query to worker and wait for response.
+
+        Args:
+            command_group (str): command group name
+            command (str): command name
+            **kwargs: command arguments
+
+        Returns:
+            Any: Output data of command.
+
+        Raises:
+            _OCIOWrapperWorkerError: When worker can't be used.
+            RuntimeError: When command failed in worker.
+        """
+        with self._lock:
+            if not self._is_running():
+                self._start()
+
+            self._request_id += 1
+            request_id = self._request_id
+            request = {
+                "id": request_id,
+                "group": command_group,
+                "command": command,
+                "kwargs": kwargs,
+            }
+            try:
+                self._process.stdin.write(
+                    (json.dumps(request) + "\n").encode("utf-8")
+                )
+                self._process.stdin.flush()
+                response = self._read_response(request_id)
+            except (IOError, OSError, ValueError) as exc:
+                self._stop()
+                raise _OCIOWrapperWorkerError(
+                    "Failed to communicate with ocio wrapper worker:"
+                    " {}".format(exc)
+                )
+
+        if "error" in response:
+            raise RuntimeError(
+                "OCIO wrapper command '{} {}' failed:\n{}".format(
+                    command_group, command, response["error"]
+                )
+            )
+        return response["result"]
+
+    def _read_response(self, request_id):
+        while True:
+            line = self._process.stdout.readline()
+            if not line:
+                raise IOError("Worker process exited")
+
+            line = line.decode("utf-8", "replace").rstrip()
+            if not line.startswith(OCIO_WORKER_RESPONSE_PREFIX):
+                # Output of OpenPype process startup
+                log.debug(line)
+                continue
+
+            response = json.loads(line[len(OCIO_WORKER_RESPONSE_PREFIX):])
+            if response.get("id") == request_id:
+                return response
+
+
 def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     """Get data via subprocess
 
-    Wrapper for Python 2 hosts.
+    Wrapper for Python 2 hosts. Long running ocio wrapper process is used
+    if possible, new process is started for the query otherwise.
+
+    Args:
+        command_group (str): command group name
+        command (str): command name
+        **kwargs: command arguments
+
+    Returns:
+        Any[dict, None]: data
+    """
+    if _OCIOWrapperWorker.is_enabled():
+        try:
+            return _OCIOWrapperWorker.get_instance().query(
+                command_group, command, **kwargs
+            )
+        except _OCIOWrapperWorkerError:
+            log.warning(
+                "OCIO wrapper worker is not available, starting process"
+                " for single query.",
+                exc_info=True
+            )
+
+    return _run_ocio_wrapper_process(command_group, command, **kwargs)
+
+
+def _run_ocio_wrapper_process(command_group, command, **kwargs):
+    """Run ocio wrapper process for single query.
 
     Args:
         command_group (str): command group name
@@ -519,6 +709,12 @@ def get_ocio_config_colorspaces(config_path):
     Returns:
         dict: colorspace and family in couple
     """
+    if not CachedData.ocio_config_colorspaces.get(config_path):
+        colorspaces_data = _read_ocio_config_colorspaces_cache(config_path)
+        if colorspaces_data is not None:
+            CachedData.ocio_config_colorspaces[config_path] = \
+                colorspaces_data
+
     if not CachedData.ocio_config_colorspaces.get(config_path):
         if not compatibility_check():
             # python environment is not compatible with PyOpenColorIO
@@ -534,9 +730,90 @@ def get_ocio_config_colorspaces(config_path):
             CachedData.ocio_config_colorspaces[config_path] = \
                 _get_colorspace_data(config_path)
 
+        _write_ocio_config_colorspaces_cache(
+            config_path, CachedData.ocio_config_colorspaces[config_path]
+        )
+
     return CachedData.ocio_config_colorspaces[config_path]
 
 
+def _get_ocio_cache_path(config_path):
+    """Path to on-disk cache of colorspaces data of OCIO config.
+
+    Cache is stored in local app data directory or in directory defined by
+    'OPENPYPE_SETTINGS_CACHE_DIR' environment variable.
+    """
+    cache_dir = os.environ.get("OPENPYPE_SETTINGS_CACHE_DIR")
+    if not cache_dir:
+        import appdirs
+
+        cache_dir = appdirs.user_data_dir("openpype", "pypeclub")
+
+    filename = hashlib.sha1(
+        os.path.normpath(config_path).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(cache_dir, OCIO_CACHE_DIRNAME, filename + ".json")
+
+
+def _get_ocio_config_stat(config_path):
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+    return [stat.st_mtime, stat.st_size]
+
+
+def _read_ocio_config_colorspaces_cache(config_path):
+    """Read colorspaces data from on-disk cache.
+
+    Returns:
+        Union[dict, None]: Colorspaces data or None if cache is not
+            available or config file changed.
+    """
+    config_stat = _get_ocio_config_stat(config_path)
+    if config_stat is None:
+        return None
+
+    cache_path = _get_ocio_cache_path(config_path)
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with open(cache_path, "r") as stream:
+            cache_data = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if (
+        cache_data.get("path") != config_path
+        or cache_data.get("stat") != config_stat
+    ):
+        return None
+    return cache_data.get("colorspaces")
+
+
+def _write_ocio_config_colorspaces_cache(config_path, colorspaces_data):
+    config_stat = _get_ocio_config_stat(config_path)
+    if config_stat is None or not colorspaces_data:
+        return
+
+    cache_path = _get_ocio_cache_path(config_path)
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        with open(cache_path, "w") as stream:
+            json.dump({
+                "path": config_path,
+                "stat": config_stat,
+                "colorspaces": colorspaces_data,
+            }, stream)
+    except (IOError, OSError):
+        log.debug(
+            "Failed to store ocio colorspaces cache.", exc_info=True
+        )
+
+
 def convert_colorspace_enumerator_item(
     colorspace_enum_item,
     config_items
@@ -1179,20 +1456,9 @@ def get_display_view_colorspace_subprocess(config_path, display, view):
         view color space name (str) e.g. "Output - sRGB"
     """
 
-    with _make_temp_json_file() as tmp_json_path:
-        # Prepare subprocess arguments
-        args = [
-            "run", get_ocio_config_script_path(),
-            "config", "get_display_view_colorspace_name",
-            "--in_path", config_path,
-            "--out_path", tmp_json_path,
-            "--display", display,
-            "--view", view
-        ]
-        log.debug("Executing: {}".format(" ".join(args)))
-
-        run_openpype_process(*args, logger=log)
-
-        # return default view colorspace name
-        with open(tmp_json_path, "r") as f:
-            return json.load(f)
+    return _get_wrapped_with_subprocess(
+        "config", "get_display_view_colorspace_name",
+        in_path=config_path,
+        display=display,
+        view=view
+    )
@@ -22,6 +22,7 @@ from openpype.client import (
     get_ayon_server_api_connection,
 )
 from openpype.lib.events import emit_event
+from openpype.lib.profiling import profile_startup_span
 from openpype.modules import load_modules, ModulesManager
 from openpype.settings import get_project_settings
 from openpype.tests.lib import is_in_tests
@@ -104,6 +105,7 @@ def registered_root():
     return _registered_root["_"]
 
 
+@profile_startup_span("host install")
 def install_host(host):
     """Install `host` into the running Python session.
 
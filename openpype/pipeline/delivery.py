@@ -2,11 +2,10 @@
 import os
 import copy
 import shutil
-import glob
 import clique
 import collections
 
-from openpype.lib import create_hard_link
+from openpype.lib import create_hard_link, get_directory_sequence_index
 
 
 def _copy_file(src_path, dst_path):
@@ -180,7 +179,8 @@ def deliver_sequence(
     report_items,
     log,
     has_renumbered_frame=False,
-    new_frame_start=0
+    new_frame_start=0,
+    sequence_indexes=None
 ):
     """ For Pype2(mainly - works in 3 too) where representation might not
         contain files.
@@ -200,19 +200,29 @@ def deliver_sequence(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        sequence_indexes (Optional[dict[str, DirectorySequenceIndex]]):
+            Cache of listed source directories which can be shared across
+            multiple calls.
 
     Returns:
         (collections.defaultdict, int)
     """
 
     src_path = os.path.normpath(src_path.replace("\\", "/"))
+    dir_path, file_name = os.path.split(str(src_path))
+    src_index = get_directory_sequence_index(dir_path, sequence_indexes)
 
     def hash_path_exist(myPath):
-        res = myPath.replace('#', '*')
-        glob_search_results = glob.glob(res)
-        if len(glob_search_results) > 0:
-            return True
-        return False
+        if "#" not in myPath:
+            return src_index.exists(file_name)
+        src_head = file_name.split("#")[0]
+        src_tail = file_name.split("#")[-1]
+        return any(
+            len(filename) >= len(src_head) + len(src_tail)
+            and filename.startswith(src_head)
+            and filename.endswith(src_tail)
+            for filename in src_index.filenames
+        )
 
     if not hash_path_exist(src_path):
         msg = "{} doesn't exist for {}".format(
@@ -241,8 +251,6 @@ def deliver_sequence(
         report_items[""].append(msg)
         return report_items, 0
 
-    dir_path, file_name = os.path.split(str(src_path))
-
     context = repre["context"]
     ext = context.get("ext", context.get("representation"))
 
@@ -256,14 +264,28 @@ def deliver_sequence(
     # context.representation could be .psd
     ext = ext.replace("..", ".")
 
-    src_collections, remainder = clique.assemble(os.listdir(dir_path))
-    src_collection = None
-    for col in src_collections:
-        if col.tail != ext:
-            continue
+    def find_src_collection(collections):
+        # Prefer collection matching source file name before frame
+        src_file_head = file_name.split("#")[0]
+        output = None
+        for col in collections:
+            if not col.tail.endswith(ext):
+                continue
+
+            if col.head == src_file_head:
+                return col
 
-        src_collection = col
-        break
+            if output is None:
+                output = col
+        return output
+
+    src_collection = find_src_collection(src_index.get_collections())
+    if src_collection is None:
+        # Frame of files with digits in extension (e.g. '.jp2') is not
+        #   recognized by index
+        src_collection = find_src_collection(
+            clique.assemble(src_index.remainder)[0]
+        )
 
     if src_collection is None:
         msg = "Source collection of files was not found"
@@ -271,15 +293,24 @@ def deliver_sequence(
         log.warning("{} <{}>".format(msg, src_path))
         return report_items, 0
 
-    frame_indicator = "@####@"
-
     anatomy_data = copy.deepcopy(anatomy_data)
-    anatomy_data["frame"] = frame_indicator
+    anatomy_data["frame"] = min(src_collection.indexes)
     if format_dict:
         anatomy_data["root"] = format_dict["root"]
     template_obj = anatomy.templates_obj["delivery"][template_name]
-    delivery_path = template_obj.format_strict(anatomy_data)
+    # Format template only once and use head and tail around frame
+    formatter = template_obj.format_sequence(anatomy_data, "frame")
+    if formatter.head is None:
+        msg = (
+            "Delivery template \"{}\" in anatomy of project \"{}\""
+            " must contain '{{frame}}' key exactly once."
+            " Delivery of sequence can't be processed."
+        ).format(template_name, anatomy.project_name)
+        report_items[""].append(msg)
+        return report_items, 0
 
+    frame_indicator = "@####@"
+    delivery_path = formatter.head + frame_indicator + formatter.tail
     delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
     delivery_folder = os.path.dirname(delivery_path)
     dst_head, dst_tail = delivery_path.split(frame_indicator)
@@ -329,6 +329,8 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
     # create representation for every collected sequence
     for collection in collections:
         ext = collection.tail.lstrip(".")
+        # Collection is iterated multiple times, prepare file paths once
+        collection_files = list(collection)
         preview = False
         # TODO 'useSequenceForReview' is temporary solution which does
         #   not work for 100% of cases. We must be able to tell what
@@ -343,14 +345,14 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
                 )
                 preview = True
             else:
-                render_file_name = list(collection)[0]
+                render_file_name = collection_files[0]
                 # if filtered aov name is found in filename, toggle it for
                 # preview video rendering
                 preview = match_aov_pattern(
                     host_name, aov_filter, render_file_name
                 )
 
-        staging = os.path.dirname(list(collection)[0])
+        staging = os.path.dirname(collection_files[0])
         success, rootless_staging_dir = (
             anatomy.find_root_template_from_path(staging)
         )
@@ -371,7 +373,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
         rep = {
             "name": ext,
             "ext": ext,
-            "files": [os.path.basename(f) for f in list(collection)],
+            "files": [os.path.basename(f) for f in collection_files],
             "frameStart": frame_start,
             "frameEnd": int(skeleton_data.get("frameEndHandle")),
             # If expectedFile are absolute, we need only filenames
@@ -11,6 +11,7 @@ from .utils import (
     get_contexts_for_repre_docs,
     get_subset_contexts,
     get_representation_context,
+    get_representation_contexts_bulk,
 
     load_with_repre_context,
     load_with_subset_context,
@@ -19,6 +20,7 @@ from .utils import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
 
     get_loader_identifier,
@@ -65,6 +67,7 @@ __all__ = (
     "get_contexts_for_repre_docs",
     "get_subset_contexts",
     "get_representation_context",
+    "get_representation_contexts_bulk",
 
     "load_with_repre_context",
     "load_with_subset_context",
@@ -73,6 +76,7 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
 
     "get_loader_identifier",
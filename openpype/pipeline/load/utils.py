@@ -13,15 +13,12 @@ from openpype.client import (
     get_assets,
     get_subsets,
     get_versions,
-    get_version_by_id,
-    get_last_version_by_subset_id,
-    get_hero_version_by_subset_id,
-    get_version_by_name,
+    get_hero_versions,
     get_last_versions,
     get_representations,
     get_representation_by_id,
-    get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    use_entity_cache,
 )
 from openpype.lib import (
     StringTemplate,
@@ -39,6 +36,11 @@ ContainersFilterResult = collections.namedtuple(
     ["latest", "outdated", "not_found", "invalid"]
 )
 
+ContainerUpdateResult = collections.namedtuple(
+    "ContainerUpdateResult",
+    ["container", "result", "error"]
+)
+
 
 class HeroVersionType(object):
     def __init__(self, version):
@@ -286,6 +288,63 @@ def get_representation_context(representation):
     return context
 
 
+def get_representation_contexts_bulk(representations, project_name=None):
+    """Return parenthood contexts for multiple representations.
+
+    Batched variant of 'get_representation_context'. Parents of all
+    representations are queried at once, with one query per entity type.
+
+    Args:
+        representations (Iterable[Union[str, ObjectId, dict]]): The
+            representation ids or full representations as returned by
+            the database.
+        project_name (Optional[str]): Project name. Current project is used
+            if not passed.
+
+    Returns:
+        list[dict]: The full representation contexts in order of passed
+            representations.
+    """
+
+    if project_name is None:
+        project_name = legacy_io.active_project()
+
+    representations = list(representations)
+    repre_ids = {
+        representation
+        for representation in representations
+        if not isinstance(representation, dict)
+    }
+    repre_docs_by_id = {}
+    for repre_doc in representations:
+        if isinstance(repre_doc, dict):
+            repre_docs_by_id[repre_doc["_id"]] = repre_doc
+
+    if repre_ids:
+        for repre_doc in get_representations(project_name, repre_ids):
+            repre_docs_by_id[repre_doc["_id"]] = repre_doc
+
+    contexts_by_id = get_contexts_for_repre_docs(
+        project_name, list(repre_docs_by_id.values())
+    )
+    contexts_by_str_id = {
+        str(repre_id): context
+        for repre_id, context in contexts_by_id.items()
+    }
+
+    output = []
+    for representation in representations:
+        if isinstance(representation, dict):
+            repre_id = representation["_id"]
+        else:
+            repre_id = representation
+        context = contexts_by_str_id.get(str(repre_id))
+        if context is None:
+            raise AssertionError("Representation was not found in database")
+        output.append(context)
+    return output
+
+
 def load_with_repre_context(
     Loader, repre_context, namespace=None, name=None, options=None, **kwargs
 ):
@@ -372,6 +431,7 @@ def load_with_subset_contexts(
     return Loader().load(subset_contexts, name, namespace, options)
 
 
+@use_entity_cache
 def load_container(
     Loader, representation, namespace=None, name=None, options=None, **kwargs
 ):
@@ -454,56 +514,233 @@ def remove_container(container):
     return Loader().remove(container)
 
 
+@use_entity_cache
 def update_container(container, version=-1):
     """Update a container"""
 
-    # Compute the different version from 'representation'
-    project_name = legacy_io.active_project()
-    current_representation = get_representation_by_id(
-        project_name, container["representation"]
-    )
+    result = update_containers([container], version)[0]
+    if result.error is not None:
+        raise result.error
+    return result.result
 
-    assert current_representation is not None, "This is a bug"
 
-    current_version = get_version_by_id(
-        project_name, current_representation["parent"], fields=["parent"]
-    )
-    if version == -1:
-        new_version = get_last_version_by_subset_id(
-            project_name, current_version["parent"], fields=["_id"]
-        )
+def _get_new_versions_by_key(project_name, subset_ids_by_version):
+    """Query versions to which containers should be updated.
+
+    Args:
+        project_name (str): Project name.
+        subset_ids_by_version (dict[Any, set[ObjectId]]): Subset ids by
+            requested version (-1, HeroVersionType or version number).
+
+    Returns:
+        dict[tuple[Any, ObjectId], dict]: Version documents by requested
+            version and subset id.
+    """
+
+    output = {}
+    versions_by_name = collections.defaultdict(set)
+    for version, subset_ids in subset_ids_by_version.items():
+        if version == -1:
+            last_versions = get_last_versions(
+                project_name, subset_ids, fields=["_id"]
+            )
+            for subset_id, version_doc in last_versions.items():
+                output[(version, subset_id)] = version_doc
+
+        elif isinstance(version, HeroVersionType):
+            version_docs = get_hero_versions(
+                project_name, subset_ids, fields=["_id", "parent"]
+            )
+            for version_doc in version_docs:
+                output[(version, version_doc["parent"])] = version_doc
 
-    elif isinstance(version, HeroVersionType):
-        new_version = get_hero_version_by_subset_id(
-            project_name, current_version["parent"], fields=["_id"]
+        else:
+            versions_by_name[version] |= subset_ids
+
+    if versions_by_name:
+        subset_ids = set()
+        for _subset_ids in versions_by_name.values():
+            subset_ids |= _subset_ids
+        version_docs = get_versions(
+            project_name,
+            subset_ids=subset_ids,
+            versions=list(versions_by_name.keys()),
+            fields=["_id", "parent", "name"]
         )
+        for version_doc in version_docs:
+            output[(version_doc["name"], version_doc["parent"])] = version_doc
+    return output
+
+
+@use_entity_cache
+def update_containers(containers, version=-1, project_name=None):
+    """Update multiple containers.
+
+    Batched variant of 'update_container'. Documents needed for update of
+    all containers are queried at once, with one query per entity type,
+    and loader plugins are discovered only once.
+
+    Args:
+        containers (Iterable[dict]): Containers to update.
+        version (Union[int, HeroVersionType, list]): Version to update to.
+            Value '-1' means last version. Can be a list with version
+            for each container.
+        project_name (Optional[str]): Project name. Current project is used
+            if not passed.
+
+    Returns:
+        list[ContainerUpdateResult]: Result of loader update or error
+            (AssertionError or LoaderNotFoundError) per container.
+    """
+
+    from .plugins import discover_loader_plugins
 
+    containers = list(containers)
+    if isinstance(version, (list, tuple)):
+        versions = list(version)
+        if len(versions) != len(containers):
+            raise ValueError((
+                "Number of containers mismatches number of versions:"
+                " {} containers - {} versions"
+            ).format(len(containers), len(versions)))
     else:
-        new_version = get_version_by_name(
-            project_name, version, current_version["parent"], fields=["_id"]
-        )
+        versions = [version] * len(containers)
 
-    assert new_version is not None, "This is a bug"
+    if not containers:
+        return []
+
+    if project_name is None:
+        project_name = legacy_io.active_project()
+
+    # Compute the different version from 'representation'
+    repre_ids = {
+        container["representation"]
+        for container in containers
+        if container.get("representation")
+    }
+    current_repre_docs_by_id = {}
+    if repre_ids:
+        current_repre_docs_by_id = {
+            str(repre_doc["_id"]): repre_doc
+            for repre_doc in get_representations(
+                project_name, repre_ids, fields=["_id", "name", "parent"]
+            )
+        }
 
-    new_representation = get_representation_by_name(
-        project_name, current_representation["name"], new_version["_id"]
+    current_version_docs_by_id = {}
+    version_ids = {
+        repre_doc["parent"]
+        for repre_doc in current_repre_docs_by_id.values()
+    }
+    if version_ids:
+        current_version_docs_by_id = {
+            version_doc["_id"]: version_doc
+            for version_doc in get_versions(
+                project_name, version_ids, hero=True, fields=["_id", "parent"]
+            )
+        }
+
+    subset_ids_by_version = collections.defaultdict(set)
+    for container, container_version in zip(containers, versions):
+        repre_doc = current_repre_docs_by_id.get(
+            str(container.get("representation"))
+        )
+        if repre_doc is None:
+            continue
+        version_doc = current_version_docs_by_id.get(repre_doc["parent"])
+        if version_doc is not None:
+            subset_ids_by_version[container_version].add(
+                version_doc["parent"]
+            )
+
+    new_version_docs_by_key = _get_new_versions_by_key(
+        project_name, subset_ids_by_version
     )
-    assert new_representation is not None, "Representation wasn't found"
 
-    path = get_representation_path(new_representation)
-    assert os.path.exists(path), "Path {} doesn't exist".format(path)
+    # Query new representations by version id and name at once
+    repre_names_by_version_id = collections.defaultdict(set)
+    for container, container_version in zip(containers, versions):
+        repre_doc = current_repre_docs_by_id.get(
+            str(container.get("representation"))
+        )
+        if repre_doc is None:
+            continue
+        version_doc = current_version_docs_by_id.get(repre_doc["parent"])
+        if version_doc is None:
+            continue
+        new_version_doc = new_version_docs_by_key.get(
+            (container_version, version_doc["parent"])
+        )
+        if new_version_doc is not None:
+            repre_names_by_version_id[new_version_doc["_id"]].add(
+                repre_doc["name"]
+            )
 
-    # Run update on the Loader for this container
-    Loader = _get_container_loader(container)
-    if not Loader:
-        raise LoaderNotFoundError(
-            "Can't update container because loader '{}' was not found."
-            .format(container.get("loader"))
+    new_repre_docs_by_key = {}
+    if repre_names_by_version_id:
+        new_repre_docs = get_representations(
+            project_name, names_by_version_ids=repre_names_by_version_id
         )
+        for repre_doc in new_repre_docs:
+            key = (repre_doc["parent"], repre_doc["name"])
+            new_repre_docs_by_key[key] = repre_doc
+
+    anatomy = Anatomy(project_name)
+    loaders_by_identifier = {
+        get_loader_identifier(loader): loader
+        for loader in discover_loader_plugins()
+    }
+
+    output = []
+    for container, container_version in zip(containers, versions):
+        try:
+            current_representation = current_repre_docs_by_id.get(
+                str(container.get("representation"))
+            )
+            assert current_representation is not None, "This is a bug"
+
+            current_version = current_version_docs_by_id.get(
+                current_representation["parent"]
+            )
+            assert current_version is not None, "This is a bug"
+
+            new_version = new_version_docs_by_key.get(
+                (container_version, current_version["parent"])
+            )
+            assert new_version is not None, "This is a bug"
+
+            new_representation = new_repre_docs_by_key.get(
+                (new_version["_id"], current_representation["name"])
+            )
+            assert new_representation is not None, (
+                "Representation wasn't found"
+            )
+
+            path = get_representation_path(
+                new_representation, root=anatomy.roots
+            )
+            assert os.path.exists(path), "Path {} doesn't exist".format(path)
 
-    return Loader().update(container, new_representation)
+        except AssertionError as exc:
+            output.append(ContainerUpdateResult(container, None, exc))
+            continue
+
+        # Run update on the Loader for this container
+        Loader = loaders_by_identifier.get(container["loader"])
+        if not Loader:
+            exc = LoaderNotFoundError(
+                "Can't update container because loader '{}' was not found."
+                .format(container.get("loader"))
+            )
+            output.append(ContainerUpdateResult(container, None, exc))
+            continue
+
+        result = Loader().update(container, new_representation)
+        output.append(ContainerUpdateResult(container, result, None))
+    return output
 
 
+@use_entity_cache
 def switch_container(container, representation, loader_plugin=None):
     """Switch a container to representation
 
@@ -7,6 +7,7 @@ from uuid import uuid4
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.client import OpenPypeMongoConnection
+from openpype.client.mongo.entity_cache import invalidate_entity_cache
 
 from . import schema
 
@@ -61,6 +62,34 @@ def auto_reconnect(func):
     return decorated
 
 
+# Collection methods which change documents
+WRITE_METHOD_NAMES = {
+    "insert_one",
+    "insert_many",
+    "update_one",
+    "update_many",
+    "replace_one",
+    "delete_one",
+    "delete_many",
+    "bulk_write",
+    "find_one_and_update",
+    "find_one_and_replace",
+    "find_one_and_delete",
+}
+
+
+def invalidates_entity_cache(func, project_name):
+    """Invalidate cached entities of project after write to database."""
+
+    @functools.wraps(func)
+    def decorated(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            invalidate_entity_cache(project_name)
+    return decorated
+
+
 SESSION_CONTEXT_KEYS = (
     # Name of current Project
     "AVALON_PROJECT",
@@ -153,6 +182,8 @@ class AvalonMongoDB:
         # Decorate function
         if callable(attr):
             attr = auto_reconnect(attr)
+            if attr_name in WRITE_METHOD_NAMES:
+                attr = invalidates_entity_cache(attr, project_name)
         return attr
 
     @property
@@ -241,9 +272,12 @@ class AvalonMongoDB:
     def insert_one(self, item, *args, **kwargs):
         assert isinstance(item, dict), "item must be of type <dict>"
         schema.validate(item)
-        return self._database[self.active_project()].insert_one(
+        project_name = self.active_project()
+        result = self._database[project_name].insert_one(
             item, *args, **kwargs
         )
+        invalidate_entity_cache(project_name)
+        return result
 
     @auto_reconnect
     def insert_many(self, items, *args, **kwargs):
@@ -253,9 +287,12 @@ class AvalonMongoDB:
             assert isinstance(item, dict), "`item` must be of type <dict>"
             schema.validate(item)
 
-        return self._database[self.active_project()].insert_many(
+        project_name = self.active_project()
+        result = self._database[project_name].insert_many(
             items, *args, **kwargs
         )
+        invalidate_entity_cache(project_name)
+        return result
 
     def parenthood(self, document):
         assert document is not None, "This is a bug"
@@ -3,6 +3,7 @@ import inspect
 import traceback
 
 from openpype.lib import Logger
+from openpype.lib.profiling import profile_startup_span
 from openpype.lib.python_module_tools import (
     modules_from_path,
     classes_from_module,
@@ -25,6 +26,10 @@ class DiscoverResult:
         self.duplicated_plugins = []
         self.abstract_plugins = []
         self.ignored_plugins = set()
+        # Files from which were reused plugins of previous discovery
+        self.cached_file_paths = set()
+        # Time spent on discovery of each path
+        self.discover_time_by_path = {}
         # Store loaded modules to keep them in memory
         self._modules = set()
 
@@ -61,6 +66,17 @@ class DiscoverResult:
                 for cls in self.ignored_plugins:
                     lines.append("- {}".format(cls.__name__))
 
+            # Discovery timings
+            if self.discover_time_by_path or full_report:
+                lines.append((
+                    "*** Discovered {} paths ({} cached files)"
+                ).format(
+                    len(self.discover_time_by_path),
+                    len(self.cached_file_paths)
+                ))
+                for path, duration in self.discover_time_by_path.items():
+                    lines.append("- {:.3f}s {}".format(duration, path))
+
         # Abstract classes
         if self.abstract_plugins or full_report:
             lines.append("*** Discovered {} abstract plugins".format(len(
@@ -269,6 +285,7 @@ class _GlobalDiscover:
         return cls._context
 
 
+@profile_startup_span("plugin discovery")
 def discover(
     superclass,
     allow_duplicates=True,
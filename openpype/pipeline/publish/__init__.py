@@ -26,6 +26,7 @@ from .lib import (
     get_publish_template_name,
 
     publish_plugins_discover,
+    clear_publish_plugins_cache,
     load_help_content_from_plugin,
     load_help_content_from_filepath,
 
@@ -35,6 +36,7 @@ from .lib import (
     filter_instances_for_context_plugin,
     context_plugin_should_run,
     get_instance_staging_dir,
+    get_publish_sequence_index,
     get_publish_repre_path,
 
     apply_plugin_settings_automatically,
@@ -43,6 +45,19 @@ from .lib import (
     get_publish_instance_families,
 )
 
+from .instrumentation import (
+    PublishInstrumentation,
+    get_publish_spans_sink_path,
+)
+
+from .source_hashes import (
+    find_source_hash_items,
+    find_source_hash_path,
+    register_source_hashes,
+    get_file_content_hash,
+    get_files_content_hashes,
+)
+
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -74,6 +89,7 @@ __all__ = (
     "get_publish_template_name",
 
     "publish_plugins_discover",
+    "clear_publish_plugins_cache",
     "load_help_content_from_plugin",
     "load_help_content_from_filepath",
 
@@ -83,6 +99,7 @@ __all__ = (
     "filter_instances_for_context_plugin",
     "context_plugin_should_run",
     "get_instance_staging_dir",
+    "get_publish_sequence_index",
     "get_publish_repre_path",
 
     "apply_plugin_settings_automatically",
@@ -90,6 +107,15 @@ __all__ = (
     "get_publish_instance_label",
     "get_publish_instance_families",
 
+    "PublishInstrumentation",
+    "get_publish_spans_sink_path",
+
+    "find_source_hash_items",
+    "find_source_hash_path",
+    "register_source_hashes",
+    "get_file_content_hash",
+    "get_files_content_hashes",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -0,0 +1,302 @@
+"""Timing spans of publish plugins processing.
+
+Each processed plugin and instance pair creates a span with wall-clock
+time, cpu time, bytes read and written by the process, peak memory and
+time spent in subprocesses (e.g. ffmpeg or oiiotool) launched using
+'run_subprocess'.
+
+```python
+with PublishInstrumentation(sink_path) as instrumentation:
+    for result in instrumentation.iter_results(
+        pyblish.util.publish_iter()
+    ):
+        ...
+```
+
+Memory and I/O counters are available only if 'psutil' (or 'resource'
+on unix) is available, values are 'None' otherwise.
+"""
+import os
+import sys
+import json
+import time
+import threading
+import contextlib
+import collections
+
+from openpype.lib import Logger
+from openpype.lib.profiling import (
+    add_subprocess_listener,
+    remove_subprocess_listener,
+)
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Environment variable enabling json lines sink of publish spans
+PUBLISH_SPANS_ENV_KEY = "OPENPYPE_PUBLISH_SPANS"
+PUBLISH_SPANS_SUFFIX = "_publish_spans.jsonl"
+
+# 'time.clock' is used in Python 2 hosts
+_process_time = getattr(time, "process_time", None) or time.clock
+
+
+def get_publish_spans_sink_path(metadata_paths):
+    """Path to json lines file with spans next to publish metadata.
+
+    Sink is used only if 'OPENPYPE_PUBLISH_SPANS' is set to '1'.
+
+    Args:
+        metadata_paths (list[str]): Paths to metadata json files.
+
+    Returns:
+        Union[str, None]: Path to sink file or None.
+    """
+
+    if os.environ.get(PUBLISH_SPANS_ENV_KEY) != "1":
+        return None
+
+    for path in metadata_paths:
+        if path:
+            return os.path.splitext(path)[0] + PUBLISH_SPANS_SUFFIX
+    return None
+
+
+def _get_peak_rss():
+    if resource is not None:
+        value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux returns kilobytes, macOS bytes
+        if not sys.platform.startswith("darwin"):
+            value *= 1024
+        return value
+
+    if psutil is not None:
+        memory_info = psutil.Process().memory_info()
+        return getattr(memory_info, "peak_wset", memory_info.rss)
+    return None
+
+
+class PublishInstrumentation(object):
+    """Collect timing spans of publish plugins processing.
+
+    Args:
+        sink_path (Optional[str]): Path to json lines file where each span
+            is written when is finished.
+    """
+
+    log = Logger.get_logger("PublishInstrumentation")
+
+    def __init__(self, sink_path=None):
+        self.spans = []
+        self._sink_path = sink_path
+        self._sink_stream = None
+        self._process = None
+        if psutil is not None:
+            self._process = psutil.Process()
+        self._subprocess_times = collections.defaultdict(float)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+    def start(self):
+        add_subprocess_listener(self._on_subprocess)
+        if self._sink_path and self._sink_stream is None:
+            try:
+                self._sink_stream = open(self._sink_path, "a")
+            except Exception:
+                self.log.warning(
+                    "Failed to open spans sink '{}'".format(self._sink_path),
+                    exc_info=True
+                )
+
+    def stop(self):
+        remove_subprocess_listener(self._on_subprocess)
+        if self._sink_stream is not None:
+            self._sink_stream.close()
+            self._sink_stream = None
+
+    def _on_subprocess(self, name, duration):
+        with self._lock:
+            self._subprocess_times[name] += duration
+
+    def _get_io_counters(self):
+        if self._process is None:
+            return None, None
+        try:
+            counters = self._process.io_counters()
+        except Exception:
+            # Not available on macOS
+            return None, None
+        return counters.read_bytes, counters.write_bytes
+
+    def _get_counters(self):
+        read_bytes, write_bytes = self._get_io_counters()
+        return {
+            "started_at": time.time(),
+            "wall": time.time(),
+            "cpu": _process_time(),
+            "read_bytes": read_bytes,
+            "write_bytes": write_bytes,
+        }
+
+    def _start_span(self):
+        with self._lock:
+            self._subprocess_times.clear()
+        return self._get_counters()
+
+    def _finish_span(self, start_counters, result):
+        end_counters = self._get_counters()
+        with self._lock:
+            subprocesses = dict(self._subprocess_times)
+            self._subprocess_times.clear()
+
+        span = {
+            "started_at": start_counters["started_at"],
+            "duration": end_counters["wall"] - start_counters["wall"],
+            "cpu_time": end_counters["cpu"] - start_counters["cpu"],
+            "read_bytes": None,
+            "write_bytes": None,
+            "peak_rss": _get_peak_rss(),
+            "subprocess_time": sum(subprocesses.values()),
+            "subprocesses": subprocesses,
+            "host": os.environ.get("AVALON_APP"),
+        }
+        for key in ("read_bytes", "write_bytes"):
+            if end_counters[key] is not None:
+                span[key] = end_counters[key] - start_counters[key]
+
+        if result is not None:
+            span.update(self._get_result_data(result))
+
+        self.spans.append(span)
+        self._write_span(span)
+        return span
+
+    def _get_result_data(self, result):
+        plugin = result.get("plugin")
+        instance = result.get("instance")
+        output = {
+            "plugin": None,
+            "plugin_id": None,
+            "plugin_label": None,
+            "order": None,
+            "instance_id": None,
+            "instance": None,
+            "family": None,
+            "success": result.get("success"),
+        }
+        if plugin is not None:
+            output.update({
+                "plugin": plugin.__name__,
+                "plugin_id": plugin.id,
+                "plugin_label": getattr(plugin, "label", None),
+                "order": plugin.order,
+            })
+
+        if instance is not None:
+            output.update({
+                "instance_id": instance.id,
+                "instance": instance.data.get("name"),
+                "family": instance.data.get("family"),
+            })
+        return output
+
+    def _write_span(self, span):
+        if self._sink_stream is None:
+            return
+        try:
+            self._sink_stream.write(json.dumps(span) + "\n")
+            self._sink_stream.flush()
+        except Exception:
+            self.log.warning("Failed to write span.", exc_info=True)
+
+    @contextlib.contextmanager
+    def measure(self):
+        """Measure processing of single plugin.
+
+        Yields dictionary where result of processing should be stored
+        under 'result' key. Span is available under 'span' key after
+        context exits.
+        """
+
+        item = {"result": None, "span": None}
+        start_counters = self._start_span()
+        try:
+            yield item
+        finally:
+            item["span"] = self._finish_span(start_counters, item["result"])
+
+    def iter_results(self, results_iter):
+        """Measure results of pyblish publish iterator.
+
+        Each result of 'pyblish.util.publish_iter' is processing of single
+        plugin, span is measured between results.
+
+        Args:
+            results_iter (Iterator[dict[str, Any]]): Pyblish results.
+
+        Yields:
+            dict[str, Any]: Result with span stored under 'span' key.
+        """
+
+        while True:
+            start_counters = self._start_span()
+            try:
+                result = next(results_iter)
+            except StopIteration:
+                return
+            result["span"] = self._finish_span(start_counters, result)
+            yield result
+
+    def get_summary(self):
+        """Spans summed by plugins.
+
+        Returns:
+            list[dict[str, Any]]: Plugin name, count of spans, duration and
+                subprocess time ordered by duration.
+        """
+
+        summary = collections.OrderedDict()
+        for span in self.spans:
+            item = summary.get(span.get("plugin"))
+            if item is None:
+                item = {
+                    "plugin": span.get("plugin"),
+                    "count": 0,
+                    "duration": 0.0,
+                    "subprocess_time": 0.0,
+                }
+                summary[span.get("plugin")] = item
+            item["count"] += 1
+            item["duration"] += span["duration"]
+            item["subprocess_time"] += span["subprocess_time"]
+
+        return sorted(
+            summary.values(),
+            key=lambda item: item["duration"],
+            reverse=True
+        )
+
+    def log_summary(self, limit=10):
+        """Log slowest plugins."""
+        lines = ["Slowest publish plugins:"]
+        for item in self.get_summary()[:limit]:
+            lines.append(
+                "  {plugin}: {duration:.3f}s"
+                " (subprocess {subprocess_time:.3f}s, calls {count})".format(
+                    **item
+                )
+            )
+        self.log.info("\n".join(lines))
@@ -1,8 +1,11 @@
 import os
 import sys
+import time
 import inspect
 import copy
 import tempfile
+import threading
+import collections
 import xml.etree.ElementTree
 
 import pyblish.util
@@ -14,7 +17,10 @@ from openpype.lib import (
     import_filepath,
     filter_profiles,
     is_func_signature_supported,
+    get_directory_sequence_index,
 )
+from openpype.lib.profiling import profile_startup_span
+from openpype.client import EntityCache
 from openpype.settings import (
     get_project_settings,
     get_system_settings,
@@ -25,6 +31,10 @@ from openpype.pipeline import (
 )
 from openpype.pipeline.plugin_discover import DiscoverResult
 
+from .instrumentation import (
+    PublishInstrumentation,
+    get_publish_spans_sink_path,
+)
 from .constants import (
     DEFAULT_PUBLISH_TEMPLATE,
     DEFAULT_HERO_PUBLISH_TEMPLATE,
@@ -214,22 +224,141 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+class _CachedPluginFile(object):
+    """Plugins imported from a file stored for next discovery.
+
+    Class attributes of plugins are stored on import so they can be
+    restored before plugins are reused. Settings are applied to plugin
+    classes by plugin filters on each discovery.
+    """
+
+    def __init__(self, stat_key, module, plugins):
+        self.stat_key = stat_key
+        self.module = module
+        self.plugins = plugins
+        self.attributes = [
+            (plugin, dict(vars(plugin)))
+            for plugin in plugins
+        ]
+
+    def restore_plugins(self):
+        for plugin, attributes in self.attributes:
+            current = vars(plugin)
+            for key in tuple(current.keys()):
+                if key not in attributes:
+                    delattr(plugin, key)
+
+            for key, value in attributes.items():
+                if current.get(key, attributes) is not value:
+                    setattr(plugin, key, value)
+        return list(self.plugins)
+
+
+_PLUGIN_FILES_CACHE = {}
+# Maximum number of threads used to list plugin directories
+DISCOVER_SCAN_WORKERS = 8
+
+
+def clear_publish_plugins_cache():
+    """Clear cache of files imported by 'publish_plugins_discover'."""
+
+    _PLUGIN_FILES_CACHE.clear()
+
+
+def _scan_plugin_dir(path):
+    """Python files in a directory with their stat key.
+
+    Returns:
+        list[tuple[str, str, tuple[float, int]]]: Path, module name and
+            modification time with size of each file.
+    """
+
+    output = []
+    if not os.path.isdir(path):
+        return output
+
+    for fname in sorted(os.listdir(path)):
+        if fname.startswith("_"):
+            continue
+
+        mod_name, mod_ext = os.path.splitext(fname)
+        if mod_ext != ".py":
+            continue
+
+        abspath = os.path.join(path, fname)
+        try:
+            stat = os.stat(abspath)
+        except OSError:
+            continue
+
+        if not os.path.isfile(abspath):
+            continue
+        output.append((abspath, mod_name, (stat.st_mtime, stat.st_size)))
+    return output
+
+
+def _scan_plugin_dirs(paths):
+    """List plugin directories in threads.
+
+    Only listing of directories runs in parallel, files are imported in
+    main thread in order of paths.
+
+    Returns:
+        dict[str, list[tuple[str, str, tuple[float, int]]]]: Files by
+            directory path.
+    """
+
+    files_by_path = {}
+    if len(paths) < 2:
+        for path in paths:
+            files_by_path[path] = _scan_plugin_dir(path)
+        return files_by_path
+
+    queue = collections.deque(paths)
+
+    def _worker():
+        while True:
+            try:
+                path = queue.popleft()
+            except IndexError:
+                return
+            try:
+                files_by_path[path] = _scan_plugin_dir(path)
+            except Exception:
+                files_by_path[path] = []
+
+    threads = [
+        threading.Thread(target=_worker)
+        for _ in range(min(DISCOVER_SCAN_WORKERS, len(paths)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return files_by_path
+
+
+@profile_startup_span("plugin discovery")
+def publish_plugins_discover(paths=None, use_cache=True):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able to collect
         crashed files and reason of their crash.
 
+    Files which were not changed since last discovery are not imported
+        again, modules imported by previous discovery are reused.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        use_cache (bool): Reuse plugins from files which did not change.
     """
 
     # The only difference with `pyblish.api.discover`
     result = DiscoverResult(pyblish.api.Plugin)
 
     plugins = {}
-    plugin_names = []
+    plugin_names = set()
 
     allow_duplicates = pyblish.plugin.ALLOW_DUPLICATES
     log = pyblish.plugin.log
@@ -238,59 +367,76 @@ def publish_plugins_discover(paths=None):
     if not paths:
         paths = pyblish.plugin.plugin_paths()
 
-    for path in paths:
-        path = os.path.normpath(path)
-        if not os.path.isdir(path):
-            continue
-
-        for fname in os.listdir(path):
-            if fname.startswith("_"):
-                continue
-
-            abspath = os.path.join(path, fname)
+    paths = [os.path.normpath(path) for path in paths]
+    scan_start = time.time()
+    files_by_path = _scan_plugin_dirs(paths)
+    scan_time = (time.time() - scan_start) / max(len(paths), 1)
 
-            if not os.path.isfile(abspath):
-                continue
+    for path in paths:
+        path_start = time.time()
+        for abspath, mod_name, stat_key in files_by_path.get(path, []):
+            cached_file = None
+            if use_cache:
+                cached_file = _PLUGIN_FILES_CACHE.get(abspath)
+                if (
+                    cached_file is not None
+                    and cached_file.stat_key != stat_key
+                ):
+                    cached_file = None
 
-            mod_name, mod_ext = os.path.splitext(fname)
+            if cached_file is not None:
+                module = cached_file.module
+                module_plugins = cached_file.restore_plugins()
+                result.cached_file_paths.add(abspath)
 
-            if mod_ext != ".py":
-                continue
+            else:
+                try:
+                    module = import_filepath(abspath, mod_name)
 
-            try:
-                module = import_filepath(abspath, mod_name)
+                    # Store reference to original module, to avoid
+                    # garbage collection from collecting it's global
+                    # imports, such as `import os`.
+                    sys.modules[abspath] = module
 
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
+                except Exception as err:
+                    _PLUGIN_FILES_CACHE.pop(abspath, None)
+                    result.crashed_file_paths[abspath] = sys.exc_info()
 
-            except Exception as err:
-                result.crashed_file_paths[abspath] = sys.exc_info()
+                    log.debug("Skipped: \"%s\" (%s)", mod_name, err)
+                    continue
 
-                log.debug("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
+                module_plugins = []
+                for plugin in pyblish.plugin.plugins_from_module(module):
+                    # Ignore base plugin classes
+                    # NOTE 'pyblish.api.discover' does not ignore them!
+                    if (
+                        plugin is pyblish.api.Plugin
+                        or plugin is pyblish.api.ContextPlugin
+                        or plugin is pyblish.api.InstancePlugin
+                    ):
+                        continue
+                    plugin.__module__ = module.__file__
+                    module_plugins.append(plugin)
+
+                _PLUGIN_FILES_CACHE[abspath] = _CachedPluginFile(
+                    stat_key, module, module_plugins
+                )
 
-            for plugin in pyblish.plugin.plugins_from_module(module):
-                # Ignore base plugin classes
-                # NOTE 'pyblish.api.discover' does not ignore them!
-                if (
-                    plugin is pyblish.api.Plugin
-                    or plugin is pyblish.api.ContextPlugin
-                    or plugin is pyblish.api.InstancePlugin
-                ):
-                    continue
+            for plugin in module_plugins:
                 if not allow_duplicates and plugin.__name__ in plugin_names:
                     result.duplicated_plugins.append(plugin)
                     log.debug("Duplicate plug-in found: %s", plugin)
                     continue
 
-                plugin_names.append(plugin.__name__)
+                plugin_names.add(plugin.__name__)
 
-                plugin.__module__ = module.__file__
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
 
+        result.discover_time_by_path[path] = (
+            scan_time + time.time() - path_start
+        )
+
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
     for plugin in pyblish.plugin.registered_plugins():
@@ -299,7 +445,7 @@ def publish_plugins_discover(paths=None):
             log.debug("Duplicate plug-in found: %s", plugin)
             continue
 
-        plugin_names.append(plugin.__name__)
+        plugin_names.add(plugin.__name__)
 
         plugins[plugin.__name__] = plugin
 
@@ -495,14 +641,28 @@ def remote_publish(log):
     # Error exit as soon as any error occurs.
     error_format = "Failed {plugin.__name__}: {error}\n{error.traceback}"
 
-    for result in pyblish.util.publish_iter():
-        if not result["error"]:
-            continue
+    metadata_paths = os.environ.get("OPENPYPE_PUBLISH_DATA", "").split(
+        os.pathsep
+    )
+    instrumentation = PublishInstrumentation(
+        get_publish_spans_sink_path(metadata_paths)
+    )
+    with EntityCache() as cache, instrumentation:
+        for result in instrumentation.iter_results(
+            pyblish.util.publish_iter()
+        ):
+            if not result["error"]:
+                continue
+
+            error_message = error_format.format(**result)
+            log.error(error_message)
+            # 'Fatal Error: ' is because of Deadline
+            raise RuntimeError("Fatal Error: {}".format(error_message))
 
-        error_message = error_format.format(**result)
-        log.error(error_message)
-        # 'Fatal Error: ' is because of Deadline
-        raise RuntimeError("Fatal Error: {}".format(error_message))
+    log.debug("Entity cache hits: {hits}, misses: {misses}".format(
+        **cache.get_stats()
+    ))
+    instrumentation.log_summary()
 
 
 def get_errored_instances_from_context(context, plugin=None):
@@ -669,6 +829,28 @@ def get_instance_staging_dir(instance):
     return staging_dir
 
 
+def get_publish_sequence_index(context, dirpath):
+    """Index of files in directory shared during whole publishing.
+
+    Directory is listed only once per publish and files are grouped to
+    sequences so multiple plugins (or representations) can validate files
+    in the same directory without listing it again.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+        dirpath (str): Path to directory.
+
+    Returns:
+        DirectorySequenceIndex: Index of directory.
+    """
+
+    cache = context.data.get("directorySequenceIndexes")
+    if cache is None:
+        cache = {}
+        context.data["directorySequenceIndexes"] = cache
+    return get_directory_sequence_index(dirpath, cache)
+
+
 def get_publish_repre_path(instance, repre, only_published=False):
     """Get representation path that can be used for integration.
 
@@ -0,0 +1,244 @@
+"""Index of published files by hash of their source.
+
+Publish plugins which process source files (e.g. textures of look) store
+hash of the source and processing arguments with path to published file.
+Next publish of the same source can reuse published file instead of
+processing and copying it again.
+
+Hashes are stored in dedicated collection of OpenPype database (next to
+settings and logs) with index on project name and hash so lookup does not
+have to scan version documents. Collection can't be in project database
+where each collection is considered as a project.
+
+Hash is by default based on filename, modification time and size of source
+('openpype.lib.source_hash'). Content digest can be used instead to find
+the same file published from different location.
+"""
+import os
+import sys
+import hashlib
+import datetime
+import threading
+import multiprocessing
+
+import six
+from six.moves import queue
+
+from openpype import AYON_SERVER_ENABLED
+
+# Collection in OpenPype database where hashes are stored
+SOURCE_HASHES_COLLECTION = "source_hashes"
+SOURCE_HASHES_INDEX_NAME = "project_hash"
+# Index is created only once per process
+_INDEXES_ENSURED = False
+# Size of chunk read from file when content digest is calculated
+_CONTENT_HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def ensure_source_hashes_indexes(collection):
+    """Create index used by lookup of source hashes.
+
+    Args:
+        collection (pymongo.collection.Collection): Source hashes
+            collection.
+    """
+
+    collection.create_index(
+        [("project", 1), ("hash", 1)],
+        name=SOURCE_HASHES_INDEX_NAME,
+        unique=True,
+        background=True
+    )
+
+
+def get_source_hashes_collection():
+    """Collection with source hashes with ensured index.
+
+    Index is ensured only on first call in process.
+
+    Returns:
+        Union[pymongo.collection.Collection, None]: Collection or None
+            if AYON server is enabled.
+    """
+
+    if AYON_SERVER_ENABLED:
+        return None
+
+    global _INDEXES_ENSURED
+
+    from openpype.client.mongo import OpenPypeMongoConnection
+
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+    collection = mongo_client[database_name][SOURCE_HASHES_COLLECTION]
+    if not _INDEXES_ENSURED:
+        ensure_source_hashes_indexes(collection)
+        _INDEXES_ENSURED = True
+    return collection
+
+
+def find_source_hash_items(project_name, source_hashes, collection=None):
+    """Find published files by source hashes.
+
+    Args:
+        project_name (str): Project name.
+        source_hashes (Iterable[str]): Hashes to find.
+        collection (Optional[pymongo.collection.Collection]): Source hashes
+            collection.
+
+    Returns:
+        dict[str, dict[str, Any]]: Published file data by hash with keys
+            'path', 'size', 'colorspace' and 'created'.
+    """
+
+    source_hashes = list(set(source_hashes))
+    if collection is None:
+        collection = get_source_hashes_collection()
+    if collection is None or not source_hashes:
+        return {}
+
+    output = {}
+    for doc in collection.find(
+        {"project": project_name, "hash": {"$in": source_hashes}},
+        {"_id": False, "project": False}
+    ):
+        output[doc.pop("hash")] = doc
+    return output
+
+
+def find_source_hash_path(project_name, source_hash, collection=None):
+    """Find existing published file for source hash.
+
+    Args:
+        project_name (str): Project name.
+        source_hash (str): Hash of source.
+        collection (Optional[pymongo.collection.Collection]): Source hashes
+            collection.
+
+    Returns:
+        Union[dict[str, Any], None]: Published file data if file exists.
+    """
+
+    item = find_source_hash_items(
+        project_name, [source_hash], collection
+    ).get(source_hash)
+    if item and os.path.exists(item["path"]):
+        return item
+    return None
+
+
+def register_source_hashes(project_name, items, collection=None):
+    """Store published paths of source hashes.
+
+    Args:
+        project_name (str): Project name.
+        items (dict[str, Union[str, dict[str, Any]]]): Published path or
+            data with 'path' and 'colorspace' by hash.
+        collection (Optional[pymongo.collection.Collection]): Source hashes
+            collection.
+    """
+
+    if collection is None:
+        collection = get_source_hashes_collection()
+    if collection is None or not items:
+        return
+
+    from pymongo import UpdateOne
+
+    created = datetime.datetime.utcnow()
+    operations = []
+    for source_hash, item in items.items():
+        if isinstance(item, six.string_types):
+            item = {"path": item}
+        path = item["path"]
+        if not os.path.exists(path):
+            continue
+
+        operations.append(UpdateOne(
+            {"project": project_name, "hash": source_hash},
+            {"$set": {
+                "path": path,
+                "size": os.path.getsize(path),
+                "colorspace": item.get("colorspace"),
+                "created": created,
+            }},
+            upsert=True
+        ))
+
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+
+
+def get_file_content_hash(filepath):
+    """Digest of file content.
+
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        str: Hex digest of sha256 with 'sha256:' prefix.
+    """
+
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as stream:
+        while True:
+            chunk = stream.read(_CONTENT_HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return "sha256:{}".format(digest.hexdigest())
+
+
+def get_files_content_hashes(filepaths, max_workers=None):
+    """Calculate digests of multiple files in threads.
+
+    Args:
+        filepaths (Iterable[str]): Paths to files.
+        max_workers (Optional[int]): Maximum number of threads, count of
+            CPU cores is used if not passed.
+
+    Returns:
+        dict[str, str]: Content digest by filepath.
+    """
+
+    paths_queue = queue.Queue()
+    filepaths = set(filepaths)
+    for filepath in filepaths:
+        paths_queue.put(filepath)
+
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count()
+    max_workers = max(1, min(max_workers, len(filepaths)))
+
+    output = {}
+    errors = []
+    lock = threading.Lock()
+
+    def _worker():
+        while not errors:
+            try:
+                filepath = paths_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            try:
+                content_hash = get_file_content_hash(filepath)
+            except Exception:
+                errors.append(sys.exc_info())
+                return
+
+            with lock:
+                output[filepath] = content_hash
+
+    threads = [
+        threading.Thread(target=_worker)
+        for _ in range(max_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        six.reraise(*errors[0])
+    return output
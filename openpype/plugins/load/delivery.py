@@ -193,6 +193,8 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
         renumber_frame = self.renumber_frame.isChecked()
         frame_offset = self.first_frame_start.value()
+        # Source directories are listed only once for all representations
+        sequence_indexes = {}
         for repre in self._representations:
             if repre["name"] not in selected_repres:
                 continue
@@ -267,7 +269,9 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 if not frame:
                     new_report_items, uploaded = deliver_single_file(*args)
                 else:
-                    new_report_items, uploaded = deliver_sequence(*args)
+                    new_report_items, uploaded = deliver_sequence(
+                        *args, sequence_indexes=sequence_indexes
+                    )
                 report_items.update(new_report_items)
                 self._update_progress(uploaded)
 
@@ -18,7 +18,7 @@ from openpype.lib import (
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg
 )
-from openpype.lib.profiles_filtering import filter_profiles
+from openpype.lib.profiles_filtering import get_profiles_index
 from openpype.pipeline.publish.lib import add_repre_files_for_cleanup
 
 
@@ -160,8 +160,8 @@ class ExtractBurnin(publish.Extractor):
             "task_types": task_type,
             "subset": subset
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = get_profiles_index(self.profiles).filter(
+            filtering_criteria, logger=self.log)
 
         if not profile:
             self.log.debug((
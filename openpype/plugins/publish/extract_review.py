@@ -3,19 +3,23 @@ import re
 import copy
 import json
 import shutil
+import collections
+import platform
 import subprocess
+import multiprocessing
 from abc import ABCMeta, abstractmethod
 
 import six
 import clique
-import speedcopy
 import pyblish.api
 
 from openpype.lib import (
     get_ffmpeg_tool_args,
-    filter_profiles,
+    get_profiles_index,
+    create_file_link,
     path_to_subprocess_arg,
     run_subprocess,
+    run_subprocesses,
 )
 from openpype.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -76,6 +80,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Count of output definitions rendered at once
+    #   - 1 renders outputs one by one, 0 uses count of CPU cores
+    max_parallel_outputs = 1
+    # Render outputs with same input by single ffmpeg process
+    single_decode_outputs = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -109,8 +118,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self.log.debug("Host: \"{}\"".format(host_name))
         self.log.debug("Family: \"{}\"".format(family))
 
-        profile = filter_profiles(
-            self.profiles,
+        profile = get_profiles_index(self.profiles).filter(
             {
                 "hosts": host_name,
                 "families": family,
@@ -228,90 +236,121 @@ class ExtractReview(pyblish.api.InstancePlugin):
             instance, profile_outputs
         )
 
-        for repre, output_defs in outputs_per_repres:
-            # Check if input should be preconverted before processing
-            # Store original staging dir (it's value may change)
-            src_repre_staging_dir = repre["stagingDir"]
-            # Receive filepath to first file in representation
-            first_input_path = None
-            input_filepaths = []
-            if not self.input_is_sequence(repre):
-                first_input_path = os.path.join(
-                    src_repre_staging_dir, repre["files"]
-                )
-                input_filepaths.append(first_input_path)
-            else:
-                for filename in repre["files"]:
-                    filepath = os.path.join(
-                        src_repre_staging_dir, filename
-                    )
-                    input_filepaths.append(filepath)
-                    if first_input_path is None:
-                        first_input_path = filepath
+        # Output jobs of all representations are prepared first and
+        #   rendered at once so they can be processed in parallel
+        output_jobs = []
+        # Temporary directories with converted inputs
+        temp_staging_dirs = []
+        try:
+            for repre, output_defs in outputs_per_repres:
+                output_jobs.extend(self._prepare_repre_output_jobs(
+                    instance, repre, output_defs, temp_staging_dirs
+                ))
 
-            filtered_output_defs = self._single_frame_filter(
-                input_filepaths, output_defs
-            )
-            if not filtered_output_defs:
-                self.log.debug((
-                    "Repre: {} - All output definitions were filtered"
-                    " out by single frame filter. Skipping"
-                ).format(repre["name"]))
-                continue
+            self._render_output_jobs(instance, output_jobs)
 
-            # Skip if file is not set
-            if first_input_path is None:
-                self.log.warning((
-                    "Representation \"{}\" have empty files. Skipped."
-                ).format(repre["name"]))
-                continue
+        finally:
+            # Make sure temporary staging is cleaned up
+            for temp_staging_dir in temp_staging_dirs:
+                if os.path.exists(temp_staging_dir):
+                    shutil.rmtree(temp_staging_dir)
 
-            # Determine if representation requires pre conversion for ffmpeg
-            do_convert = should_convert_for_ffmpeg(first_input_path)
-            # If result is None the requirement of conversion can't be
-            #   determined
-            if do_convert is None:
-                self.log.info((
-                    "Can't determine if representation requires conversion."
-                    " Skipped."
-                ))
-                continue
+    def _prepare_repre_output_jobs(
+        self, instance, repre, output_defs, temp_staging_dirs
+    ):
+        """Prepare ffmpeg jobs of output definitions for representation.
 
-            layer_name = get_review_layer_name(first_input_path)
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            repre (dict[str, Any]): Source representation.
+            output_defs (list[dict[str, Any]]): Output definitions.
+            temp_staging_dirs (list[str]): Temporary directories which
+                should be removed after jobs are rendered.
 
-            # Do conversion if needed
-            #   - change staging dir of source representation
-            #   - must be set back after output definitions processing
-            if do_convert:
-                new_staging_dir = get_transcode_temp_directory()
-                repre["stagingDir"] = new_staging_dir
+        Returns:
+            list[dict[str, Any]]: Prepared output jobs.
+        """
 
-                convert_input_paths_for_ffmpeg(
-                    input_filepaths,
-                    new_staging_dir,
-                    self.log
+        # Check if input should be preconverted before processing
+        # Store original staging dir (it's value may change)
+        src_repre_staging_dir = repre["stagingDir"]
+        # Receive filepath to first file in representation
+        first_input_path = None
+        input_filepaths = []
+        if not self.input_is_sequence(repre):
+            first_input_path = os.path.join(
+                src_repre_staging_dir, repre["files"]
+            )
+            input_filepaths.append(first_input_path)
+        else:
+            for filename in repre["files"]:
+                filepath = os.path.join(
+                    src_repre_staging_dir, filename
                 )
+                input_filepaths.append(filepath)
+                if first_input_path is None:
+                    first_input_path = filepath
 
-            try:
-                self._render_output_definitions(
-                    instance,
-                    repre,
-                    src_repre_staging_dir,
-                    filtered_output_defs,
-                    layer_name
-                )
+        filtered_output_defs = self._single_frame_filter(
+            input_filepaths, output_defs
+        )
+        if not filtered_output_defs:
+            self.log.debug((
+                "Repre: {} - All output definitions were filtered"
+                " out by single frame filter. Skipping"
+            ).format(repre["name"]))
+            return []
+
+        # Skip if file is not set
+        if first_input_path is None:
+            self.log.warning((
+                "Representation \"{}\" have empty files. Skipped."
+            ).format(repre["name"]))
+            return []
+
+        # Determine if representation requires pre conversion for ffmpeg
+        do_convert = should_convert_for_ffmpeg(first_input_path)
+        # If result is None the requirement of conversion can't be
+        #   determined
+        if do_convert is None:
+            self.log.info((
+                "Can't determine if representation requires conversion."
+                " Skipped."
+            ))
+            return []
+
+        layer_name = get_review_layer_name(first_input_path)
 
-            finally:
-                # Make sure temporary staging is cleaned up and representation
-                #   has set origin stagingDir
-                if do_convert:
-                    # Set staging dir of source representation back to previous
-                    #   value
-                    repre["stagingDir"] = src_repre_staging_dir
-                    if os.path.exists(new_staging_dir):
-                        shutil.rmtree(new_staging_dir)
-
-    def _render_output_definitions(
+        # Do conversion if needed
+        #   - change staging dir of source representation
+        #   - must be set back after output definitions are prepared
+        if do_convert:
+            new_staging_dir = get_transcode_temp_directory()
+            temp_staging_dirs.append(new_staging_dir)
+            repre["stagingDir"] = new_staging_dir
+
+            convert_input_paths_for_ffmpeg(
+                input_filepaths,
+                new_staging_dir,
+                self.log
+            )
+
+        try:
+            return self._prepare_output_jobs(
+                instance,
+                repre,
+                src_repre_staging_dir,
+                filtered_output_defs,
+                layer_name
+            )
+
+        finally:
+            # Set staging dir of source representation back to previous
+            #   value
+            if do_convert:
+                repre["stagingDir"] = src_repre_staging_dir
+
+    def _prepare_output_jobs(
         self,
         instance,
         repre,
@@ -319,6 +358,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         output_definitions,
         layer_name
     ):
+        output_jobs = []
         fill_data = copy.deepcopy(instance.data["anatomyData"])
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
@@ -395,7 +435,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             })
 
             try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
+                ffmpeg_parts = self._ffmpeg_argument_parts(
                     output_def,
                     instance,
                     new_repre,
@@ -414,27 +454,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    self._remove_files(files_to_clean)
+                    return output_jobs
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
-            if os.getenv("SHELL") in ("/bin/bash", "/bin/sh"):
-                # Escape parentheses for bash
-                subprcs_cmd = (
-                    subprcs_cmd
-                    .replace("(", "\\(")
-                    .replace(")", "\\)")
-                )
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
-
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
-
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
+            ffmpeg_parts = self._normalize_ffmpeg_args(*ffmpeg_parts)
+            subprcs_cmd = self._ffmpeg_args_to_cmd(
+                self._build_ffmpeg_args(*ffmpeg_parts)
+            )
 
             new_repre.update({
                 "fps": temp_data["fps"],
@@ -446,18 +473,240 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 "ffmpeg_cmd": subprcs_cmd
             })
 
-            # Force to pop these key if are in new repre
-            new_repre.pop("thumbnail", None)
-            if "clean_name" in new_repre.get("tags", []):
-                new_repre.pop("outputName")
+            output_jobs.append({
+                "new_repres": [new_repre],
+                "subprcs_cmd": subprcs_cmd,
+                "ffmpeg_parts": ffmpeg_parts,
+                "files_to_clean": files_to_clean,
+            })
+
+        if self.single_decode_outputs:
+            output_jobs = self._merge_output_jobs(output_jobs)
+        return output_jobs
+
+    def _ffmpeg_args_to_cmd(self, ffmpeg_args):
+        subprcs_cmd = " ".join(ffmpeg_args)
+        if os.getenv("SHELL") in ("/bin/bash", "/bin/sh"):
+            # Escape parentheses for bash
+            subprcs_cmd = (
+                subprcs_cmd
+                .replace("(", "\\(")
+                .replace(")", "\\)")
+            )
+        return subprcs_cmd
+
+    def _can_merge_output_job(self, output_job):
+        """Output job can be rendered in one ffmpeg with other outputs.
+
+        Outputs with labeled video filters (e.g. bg color) or with own
+        complex filters and stream mapping (e.g. merge of audio inputs)
+        are rendered separately.
+        """
+        _, video_filters, _, output_args = output_job["ffmpeg_parts"]
+        if any("[" in video_filter for video_filter in video_filters):
+            return False
+
+        for arg in output_args:
+            if arg.split(" ")[0] in ("-filter_complex", "-lavfi", "-map"):
+                return False
+        return True
+
+    def _merge_output_jobs(self, output_jobs):
+        """Merge output jobs with same input to one ffmpeg process.
+
+        Source is decoded only once and split to all outputs using
+        'split' filter. Each output has own video filters and is mapped
+        to its output file.
+
+        Args:
+            output_jobs (list[dict[str, Any]]): Output jobs of single
+                representation.
+
+        Returns:
+            list[dict[str, Any]]: Output jobs, merged jobs are on position
+                of first job in the group.
+        """
+        jobs_by_input = collections.OrderedDict()
+        for output_job in output_jobs:
+            key = id(output_job)
+            if self._can_merge_output_job(output_job):
+                key = tuple(output_job["ffmpeg_parts"][0])
+            jobs_by_input.setdefault(key, []).append(output_job)
+
+        merged_jobs = []
+        for jobs in jobs_by_input.values():
+            if len(jobs) == 1:
+                merged_jobs.append(jobs[0])
+                continue
+
+            subprcs_cmd = self._ffmpeg_args_to_cmd(
+                self._build_multi_output_ffmpeg_args(
+                    [job["ffmpeg_parts"] for job in jobs]
+                )
+            )
+            new_repres = []
+            files_to_clean = []
+            for job in jobs:
+                for new_repre in job["new_repres"]:
+                    new_repre["ffmpeg_cmd"] = subprcs_cmd
+                    new_repres.append(new_repre)
+                files_to_clean.extend(job["files_to_clean"])
 
-            # adding representation
             self.log.debug(
-                "Adding new representation: {}".format(new_repre)
+                "Merged {} outputs to single ffmpeg process.".format(
+                    len(jobs)
+                )
             )
-            instance.data["representations"].append(new_repre)
+            merged_jobs.append({
+                "new_repres": new_repres,
+                "subprcs_cmd": subprcs_cmd,
+                "ffmpeg_parts": None,
+                "files_to_clean": files_to_clean,
+            })
+        return merged_jobs
+
+    def _build_multi_output_ffmpeg_args(self, ffmpeg_parts_items):
+        """Arguments of ffmpeg decoding input once for multiple outputs.
+
+        All items must have same input arguments.
+
+        Args:
+            ffmpeg_parts_items (list[tuple]): Input arguments, video filters,
+                audio filters and output arguments of each output.
+
+        Returns:
+            list[str]: Arguments ready to run in subprocess.
+        """
+        input_args = ffmpeg_parts_items[0][0]
+        # Count audio inputs, first input is always video/image input
+        audio_inputs = sum(
+            1
+            for arg in input_args
+            if arg == "-i" or arg.startswith("-i ")
+        ) - 1
+
+        split_labels = [
+            "[split{}]".format(idx)
+            for idx in range(len(ffmpeg_parts_items))
+        ]
+        graph_parts = ["[0:v]split={}{}".format(
+            len(ffmpeg_parts_items), "".join(split_labels)
+        )]
+        output_args = []
+        for idx, ffmpeg_parts in enumerate(ffmpeg_parts_items):
+            _, video_filters, audio_filters, _output_args = ffmpeg_parts
+            output_label = "[out{}]".format(idx)
+            graph_parts.append("{}{}{}".format(
+                split_labels[idx],
+                ",".join(video_filters or ["null"]),
+                output_label
+            ))
+
+            output_args.extend(["-map", "\"{}\"".format(output_label)])
+            # Explicit video map disables automatic stream selection so
+            #   audio must be mapped too, audio of video container input
+            #   is mapped if there is no separate audio input
+            if audio_inputs == 1:
+                output_args.extend(["-map", "1:a"])
+            elif audio_inputs == 0:
+                output_args.extend(["-map", "0:a?"])
+
+            if audio_filters and audio_inputs in (0, 1):
+                output_args.append("-filter:a")
+                output_args.append(
+                    "\"{}\"".format(",".join(audio_filters))
+                )
+            output_args.extend(_output_args)
+
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(graph_parts)))
+        all_args.extend(output_args)
+        return all_args
+
+    def _get_parallel_workers(self, output_jobs):
+        if len(output_jobs) < 2:
+            return 1
+
+        max_workers = self.max_parallel_outputs
+        if max_workers is None:
+            return 1
+        max_workers = int(max_workers)
+        if max_workers < 1:
+            max_workers = multiprocessing.cpu_count()
+        return min(max_workers, len(output_jobs))
+
+    def _render_output_jobs(self, instance, output_jobs):
+        """Run ffmpeg of output jobs and add new representations.
+
+        Jobs are rendered in parallel if 'max_parallel_outputs' allows it.
+        If any of jobs fails, other running jobs are terminated. New
+        representations are added in order of jobs.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            output_jobs (list[dict[str, Any]]): Prepared output jobs.
+        """
+
+        if not output_jobs:
+            return
+
+        workers = self._get_parallel_workers(output_jobs)
+        try:
+            if workers == 1:
+                for output_job in output_jobs:
+                    subprcs_cmd = output_job["subprcs_cmd"]
+                    # run subprocess
+                    self.log.debug("Executing: {}".format(subprcs_cmd))
+                    run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
+            else:
+                commands = []
+                for output_job in output_jobs:
+                    subprcs_cmd = output_job["subprcs_cmd"]
+                    self.log.debug("Executing: {}".format(subprcs_cmd))
+                    # Replace shell with ffmpeg process so it can be
+                    #   terminated when other job fails
+                    if platform.system().lower() != "windows":
+                        subprcs_cmd = "exec " + subprcs_cmd
+                    commands.append(subprcs_cmd)
+
+                self.log.debug(
+                    "Rendering {} outputs with {} workers".format(
+                        len(commands), workers
+                    )
+                )
+                run_subprocesses(
+                    commands, workers, shell=True, logger=self.log
+                )
 
-            add_repre_files_for_cleanup(instance, new_repre)
+        finally:
+            # delete files added to fill gaps
+            for output_job in output_jobs:
+                self._remove_files(output_job["files_to_clean"])
+
+        for output_job in output_jobs:
+            for new_repre in output_job["new_repres"]:
+                # Force to pop these key if are in new repre
+                new_repre.pop("thumbnail", None)
+                if "clean_name" in new_repre.get("tags", []):
+                    new_repre.pop("outputName")
+
+                # adding representation
+                self.log.debug(
+                    "Adding new representation: {}".format(new_repre)
+                )
+                instance.data["representations"].append(new_repre)
+
+                add_repre_files_for_cleanup(instance, new_repre)
+
+    def _remove_files(self, filepaths):
+        for filepath in filepaths:
+            if os.path.exists(filepath):
+                os.unlink(filepath)
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -590,6 +839,32 @@ class ExtractReview(pyblish.api.InstancePlugin):
             temp_data (dict): Base data for successful process.
         """
 
+        return self.ffmpeg_full_args(*self._ffmpeg_argument_parts(
+            output_def,
+            instance,
+            new_repre,
+            temp_data,
+            fill_data,
+            layer_name
+        ))
+
+    def _ffmpeg_argument_parts(
+        self,
+        output_def,
+        instance,
+        new_repre,
+        temp_data,
+        fill_data,
+        layer_name
+    ):
+        """Prepares ffmpeg input arguments, filters and output arguments.
+
+        Returns:
+            tuple[list[str], list[str], list[str], list[str]]: Input
+                arguments, video filters, audio filters and output
+                arguments.
+        """
+
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
 
@@ -768,7 +1043,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -816,6 +1091,20 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        return self._build_ffmpeg_args(*self._normalize_ffmpeg_args(
+            input_args, video_filters, audio_filters, output_args
+        ))
+
+    def _normalize_ffmpeg_args(
+        self, input_args, video_filters, audio_filters, output_args
+    ):
+        """Move filters from output arguments to filters.
+
+        Returns:
+            tuple[list[str], list[str], list[str], list[str]]: Input
+                arguments, video filters, audio filters and output
+                arguments.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -833,6 +1122,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
 
+        return input_args, video_filters, audio_filters, output_args
+
+    def _build_ffmpeg_args(
+        self, input_args, video_filters, audio_filters, output_args
+    ):
         all_args = [
             subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
         ]
@@ -851,11 +1145,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
-        """Fill missing files in sequence by duplicating existing ones.
+        """Fill missing files in sequence by linking existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
+        This will take nearest frame file and link it with so as to fill
         gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        hole ahead. Hardlinks or symlinks are used so frames are not
+        duplicated on disk, file is copied only if links are not supported.
 
         Args:
             files (list): List of representation files.
@@ -871,12 +1166,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
             KnownPublishError: if more than one collection is obtained.
         """
 
-        collections = clique.assemble(files)[0]
-        if len(collections) != 1:
+        cols = clique.assemble(files)[0]
+        if len(cols) != 1:
             raise KnownPublishError(
-                "Multiple collections {} found.".format(collections))
+                "Multiple collections {} found.".format(cols))
 
-        col = collections[0]
+        col = cols[0]
 
         # Prepare which hole is filled with what frame
         #   - the frame is filled only with already existing frames
@@ -891,6 +1186,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Calculate paths
         added_files = []
+        methods_count = collections.Counter()
         col_format = col.format("{head}{padding}{tail}")
         for hole_frame, src_frame in hole_frame_to_nearest.items():
             hole_fpath = os.path.join(staging_dir, col_format % hole_frame)
@@ -899,9 +1195,17 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            methods_count[create_file_link(src_fpath, hole_fpath)] += 1
             added_files.append(hole_fpath)
 
+        if methods_count:
+            self.log.debug("Filled {} missing frames ({}).".format(
+                len(added_files),
+                ", ".join(
+                    "{} {}".format(count, method)
+                    for method, count in sorted(methods_count.items())
+                )
+            ))
         return added_files
 
     def input_output_paths(self, new_repre, output_def, temp_data):
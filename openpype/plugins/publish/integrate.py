@@ -678,17 +678,20 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_sequence_representation:
                 files = [files]
 
-            repre_context = None
+            # Format template only once and fill only 'originalBasename'
+            #   for each file
+            template_data["originalBasename"], _ = os.path.splitext(
+                files[0])
+            formatter = path_template_obj.format_sequence(
+                template_data, "originalBasename"
+            )
+            repre_context = formatter.result.used_values
             transfers = []
             for src_file_name in files:
-                template_data["originalBasename"], _ = os.path.splitext(
-                    src_file_name)
-
-                dst = path_template_obj.format_strict(template_data)
+                basename, _ = os.path.splitext(src_file_name)
+                dst = formatter(basename)
                 src = os.path.join(stagingdir, src_file_name)
                 transfers.append((src, dst))
-                if repre_context is None:
-                    repre_context = dst.used_values
 
             if not is_udim and first_index_padded is not None:
                 repre_context["frame"] = first_index_padded
@@ -737,22 +740,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            #   - template is formatted only once and only frame or udim
+            #       is filled for each index
+            index_key = "udim" if is_udim else "frame"
+            template_data[index_key] = destination_indexes[0]
+            formatter = path_template_obj.format_sequence(
+                template_data, index_key
+            )
+            self.log.debug(
+                "Template filled: {}".format(str(formatter.result))
+            )
+            repre_context = formatter.result.used_values
+            dst_filepaths = formatter.format_values(destination_indexes)
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -970,12 +969,45 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         """
 
         file_infos = []
-        for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+        destinations = list(destinations)
+        rootless_paths = self.get_rootless_paths(anatomy, destinations)
+        for file_path, rootless_path in zip(destinations, rootless_paths):
+            file_info = self.prepare_file_info(
+                file_path, anatomy, sites=sites, rootless_path=rootless_path
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def get_rootless_paths(self, anatomy, paths):
+        """Rootless paths of multiple paths.
+
+        Same as 'get_rootless_path' but roots are matched in batch.
+
+        Args:
+            anatomy (Anatomy): Anatomy of project.
+            paths (list[str]): Absolute paths.
+
+        Returns:
+            list[str]: Rootless paths or unmodified paths if root was not
+                found.
+        """
+
+        output = []
+        for path, result in zip(
+            paths, anatomy.find_root_templates_from_paths(paths)
+        ):
+            success, rootless_path = result
+            if success:
+                path = rootless_path
+            else:
+                self.log.warning((
+                    "Could not find root path for remapping \"{}\"."
+                    " This may cause issues on farm."
+                ).format(path))
+            output.append(path)
+        return output
+
+    def prepare_file_info(self, path, anatomy, sites, rootless_path=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -984,14 +1016,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            rootless_path (Optional[str]): Already resolved rootless path.
 
         Returns:
             dict: file info dictionary
         """
 
+        if rootless_path is None:
+            rootless_path = self.get_rootless_path(anatomy, path)
+
         return {
             "_id": ObjectId(),
-            "path": self.get_rootless_path(anatomy, path),
+            "path": rootless_path,
             "size": os.path.getsize(path),
             "hash": source_hash(path),
             "sites": sites
@@ -0,0 +1,46 @@
+import pyblish.api
+
+from openpype import AYON_SERVER_ENABLED
+from openpype.pipeline.publish import register_source_hashes
+
+
+class IntegrateSourceHashes(pyblish.api.InstancePlugin):
+    """Store published paths of processed sources to source hashes index.
+
+    Extractors can fill 'sourceHashItems' with hash of source file and
+    published path (and optionally resulting colorspace) so next publish of
+    the same source can reuse already published file.
+
+    Example of 'sourceHashItems':
+        {
+            "texture,exr|1690000000,0|1024|maketx": {
+                "path": "/publish/.../resources/texture.tx",
+                "colorspace": "ACEScg"
+            }
+        }
+    """
+
+    label = "Integrate Source Hashes"
+    order = pyblish.api.IntegratorOrder + 0.1
+
+    def process(self, instance):
+        source_hash_items = instance.data.get("sourceHashItems")
+        if not source_hash_items:
+            return
+
+        if not instance.data.get("versionEntity"):
+            self.log.debug(
+                "Instance was not integrated. Skipping source hashes."
+            )
+            return
+
+        register_source_hashes(
+            instance.context.data["projectName"], source_hash_items
+        )
+        self.log.debug("Stored {} source hashes.".format(
+            len(source_hash_items)
+        ))
+
+
+if AYON_SERVER_ENABLED:
+    del IntegrateSourceHashes
@@ -92,11 +92,16 @@ class PypeCommands:
             get_app_environments_for_context,
             LaunchTypes,
         )
+        from openpype.client import EntityCache
         from openpype.modules import ModulesManager
         from openpype.pipeline import (
             install_openpype_plugins,
             get_global_context,
         )
+        from openpype.pipeline.publish import (
+            PublishInstrumentation,
+            get_publish_spans_sink_path,
+        )
 
         # Register target and host
         import pyblish.api
@@ -157,11 +162,21 @@ class PypeCommands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
-                if result["error"]:
-                    log.error(error_format.format(**result))
-                    # uninstall()
-                    sys.exit(1)
+            instrumentation = PublishInstrumentation(
+                get_publish_spans_sink_path(paths)
+            )
+            with EntityCache() as cache, instrumentation:
+                for result in instrumentation.iter_results(
+                    pyblish.util.publish_iter()
+                ):
+                    if result["error"]:
+                        log.error(error_format.format(**result))
+                        # uninstall()
+                        sys.exit(1)
+            log.debug("Entity cache hits: {hits}, misses: {misses}".format(
+                **cache.get_stats()
+            ))
+            instrumentation.log_summary()
 
         log.info("Publish finished.")
 
@@ -197,6 +212,90 @@ class PypeCommands:
         with open(output_json_path, "w") as file_stream:
             json.dump(env, file_stream, indent=4)
 
+    @staticmethod
+    def profile_startup(command_args, output_dir, budget_path=None):
+        """Run OpenPype command with startup profiler.
+
+        Command is launched in subprocess which stores report of imports
+        and startup phases to output directory. Process exits with error
+        when report exceeds budget.
+
+        Args:
+            command_args (list[str]): Arguments of profiled command.
+            output_dir (str): Directory where report is stored.
+            budget_path (Optional[str]): Path to json file with budget.
+        """
+
+        import subprocess
+        from openpype.lib import Logger, get_openpype_execute_args
+        from openpype.lib.profiling import (
+            STARTUP_PROFILER_ENV_KEY,
+            STARTUP_REPORT_FILENAME,
+            STARTUP_FLAMEGRAPH_FILENAME,
+            check_startup_budget,
+        )
+
+        log = Logger.get_logger("ProfileStartup")
+        output_dir = os.path.abspath(output_dir)
+        report_path = os.path.join(output_dir, STARTUP_REPORT_FILENAME)
+        if os.path.exists(report_path):
+            os.remove(report_path)
+
+        env = os.environ.copy()
+        env[STARTUP_PROFILER_ENV_KEY] = output_dir
+        args = get_openpype_execute_args(*command_args)
+        log.info("Profiling: {}".format(" ".join(args)))
+        returncode = subprocess.call(args, env=env)
+        if returncode != 0:
+            log.warning(
+                "Profiled command exited with code {}".format(returncode)
+            )
+
+        if not os.path.exists(report_path):
+            log.error("Startup report was not created.")
+            sys.exit(1)
+
+        with open(report_path, "r") as stream:
+            report_data = json.load(stream)
+
+        lines = ["Startup took {:.3f}s".format(report_data["total"])]
+        for category, duration in sorted(
+            report_data["categories"].items(),
+            key=lambda item: item[1],
+            reverse=True
+        ):
+            lines.append("  {:<30} {:>8.3f}s".format(category, duration))
+
+        lines.append("Slowest imports (self / cumulative):")
+        imports = sorted(
+            report_data["imports"].items(),
+            key=lambda item: item[1]["self"],
+            reverse=True
+        )
+        for module_name, import_data in imports[:20]:
+            lines.append("  {:<50} {:>8.3f}s {:>8.3f}s".format(
+                module_name, import_data["self"], import_data["cumulative"]
+            ))
+        lines.append("Report: {}".format(report_path))
+        lines.append("Flamegraph: {}".format(
+            os.path.join(output_dir, STARTUP_FLAMEGRAPH_FILENAME)
+        ))
+        log.info("\n".join(lines))
+
+        if not budget_path:
+            return
+
+        with open(budget_path, "r") as stream:
+            budget = json.load(stream)
+
+        messages = check_startup_budget(report_data, budget)
+        if messages:
+            log.error("Startup budget exceeded:\n{}".format(
+                "\n".join("- {}".format(message) for message in messages)
+            ))
+            sys.exit(1)
+        log.info("Startup is within budget.")
+
     @staticmethod
     def launch_project_manager():
         from openpype.tools import project_manager
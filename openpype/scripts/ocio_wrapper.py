@@ -17,12 +17,40 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- server - console command - python 2
+         - long running process answering queries sent as json lines
+           to stdin, responses are written to stdout.
 """
 import os
+import sys
 import click
 import json
+import traceback
 import PyOpenColorIO as ocio
 
+# Prefix of response lines written by server to stdout
+SERVER_RESPONSE_PREFIX = "OCIO_WRAPPER_RESPONSE:"
+
+# Parsed configs by path with modification time of config file
+_CONFIGS_CACHE = {}
+
+
+def _get_config(config_path):
+    """Parsed OCIO config cached until config file changes.
+
+    Args:
+        config_path (str): path string leading to config.ocio
+
+    Returns:
+        PyOpenColorIO.Config: Parsed config.
+    """
+    mtime = os.path.getmtime(config_path)
+    cached = _CONFIGS_CACHE.get(config_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, ocio.Config.CreateFromFile(config_path))
+        _CONFIGS_CACHE[config_path] = cached
+    return cached[1]
+
 
 @click.group()
 def main():
@@ -99,7 +127,7 @@ def _get_colorspace_data(config_path):
         raise IOError(
             "Input path `{}` should be `config.ocio` file".format(config_path))
 
-    config = ocio.Config().CreateFromFile(config_path)
+    config = _get_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -191,7 +219,7 @@ def _get_views_data(config_path):
     if not os.path.isfile(config_path):
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(config_path)
+    config = _get_config(config_path)
 
     data_ = {}
     for display in config.getDisplays():
@@ -261,7 +289,7 @@ def _get_version_data(config_path):
     if not os.path.isfile(config_path):
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(config_path)
+    config = _get_config(config_path)
 
     return {
         "major": config.getMajorVersion(),
@@ -330,7 +358,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         raise IOError(
             "Input path `{}` should be `config.ocio` file".format(config_path))
 
-    config = ocio.Config().CreateFromFile(config_path)
+    config = _get_config(config_path)
 
     # TODO: use `parseColorSpaceFromString` instead if ocio v1
     colorspace = config.getColorSpaceFromFilepath(filepath)
@@ -356,7 +384,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     if not os.path.isfile(config_path):
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config.CreateFromFile(config_path)
+    config = _get_config(config_path)
     colorspace = config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace
@@ -410,5 +438,77 @@ def get_display_view_colorspace_name(in_path, out_path,
     print("Display view colorspace saved to '{}'".format(out_path))
 
 
+def _process_server_request(request):
+    """Process request received by server.
+
+    Args:
+        request (dict): Request with 'group', 'command' and 'kwargs' keys.
+            Command names and arguments match console commands.
+
+    Returns:
+        Any: Output data of command.
+    """
+    kwargs = request.get("kwargs") or {}
+    key = (request["group"], request["command"])
+    if key == ("config", "get_colorspace"):
+        return _get_colorspace_data(kwargs["in_path"])
+
+    if key == ("config", "get_views"):
+        return _get_views_data(kwargs["in_path"])
+
+    if key == ("config", "get_version"):
+        return _get_version_data(kwargs["config_path"])
+
+    if key == ("config", "get_display_view_colorspace_name"):
+        return _get_display_view_colorspace_name(
+            kwargs["in_path"], kwargs["display"], kwargs["view"]
+        )
+
+    if key == (
+        "colorspace", "get_config_file_rules_colorspace_from_filepath"
+    ):
+        return _get_config_file_rules_colorspace_from_filepath(
+            kwargs["config_path"], kwargs["filepath"]
+        )
+
+    raise ValueError("Unknown command '{} {}'".format(*key))
+
+
+@main.command(
+    name="server",
+    help=(
+        "answer queries sent as json lines to stdin until stdin is closed"
+    )
+)
+def server():
+    """Long running process answering queries.
+
+    Each line of stdin is json request with 'id', 'group', 'command' and
+    'kwargs' keys. Response is written to stdout as json with 'id' and
+    'result' or 'error' key, prefixed with 'SERVER_RESPONSE_PREFIX'.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py server
+    """
+    for line in iter(sys.stdin.readline, ""):
+        line = line.strip()
+        if not line:
+            continue
+
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            response = {
+                "id": request_id,
+                "result": _process_server_request(request)
+            }
+        except Exception:
+            response = {"id": request_id, "error": traceback.format_exc()}
+
+        sys.stdout.write(SERVER_RESPONSE_PREFIX + json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
@@ -21,10 +21,15 @@ from .lib import (
     get_global_settings,
     get_system_settings,
     get_project_settings,
+    get_project_settings_snapshot,
     get_current_project_settings,
     get_anatomy_settings,
     get_local_settings,
 )
+from .snapshot import (
+    SettingsSnapshot,
+    SettingsSnapshotList,
+)
 from .entities import (
     SystemSettings,
     ProjectSettings,
@@ -53,10 +58,14 @@ __all__ = (
     "get_global_settings",
     "get_system_settings",
     "get_project_settings",
+    "get_project_settings_snapshot",
     "get_current_project_settings",
     "get_anatomy_settings",
     "get_local_settings",
 
+    "SettingsSnapshot",
+    "SettingsSnapshotList",
+
     "SystemSettings",
     "ProjectSettings",
     "DefaultsNotDefined"
@@ -4,6 +4,7 @@ import functools
 import logging
 import platform
 import copy
+import hashlib
 
 from openpype import AYON_SERVER_ENABLED
 
@@ -25,6 +26,7 @@ from .ayon_settings import (
     get_ayon_project_settings,
     get_ayon_system_settings
 )
+from .snapshot import SettingsSnapshot
 
 log = logging.getLogger(__name__)
 
@@ -41,12 +43,22 @@ DEFAULTS_DIR = os.path.join(
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
 
+# Version of on-disk cache of default settings
+# - increase when structure of the cache file changes
+DEFAULT_SETTINGS_CACHE_VERSION = 1
+DEFAULT_SETTINGS_CACHE_FILENAME = "default_settings_cache.json"
+
 # Handler of studio overrides
 _SETTINGS_HANDLER = None
 
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Cached snapshots of project settings
+# - key is tuple of project name, clear metadata and exclude locals
+# - value is 'CacheValues' object with snapshot as data
+_PROJECT_SETTINGS_SNAPSHOTS = {}
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -186,6 +198,7 @@ def save_studio_settings(data):
 
     _SETTINGS_HANDLER.save_change_log(None, changes, "system")
     _SETTINGS_HANDLER.save_studio_settings(data)
+    reset_project_settings_snapshots()
     if warnings:
         raise SaveWarningExc(warnings)
 
@@ -246,6 +259,7 @@ def save_project_settings(project_name, overrides):
                 warnings.extend(exc.warnings)
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "project")
     _SETTINGS_HANDLER.save_project_settings(project_name, overrides)
+    reset_project_settings_snapshots()
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -515,7 +529,9 @@ def clear_project_settings_overrides_for_version(
 
 @require_local_handler
 def save_local_settings(data):
-    return _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    result = _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    reset_project_settings_snapshots()
+    return result
 
 
 @require_local_handler
@@ -580,19 +596,227 @@ def _get_default_settings():
     return defaults
 
 
-def get_default_settings():
-    """Get default settings.
+def get_default_settings_cache_path():
+    """Path to on-disk cache of merged default settings.
 
-    Todo:
-        Cache loaded defaults.
+    Directory can be changed with 'OPENPYPE_SETTINGS_CACHE_DIR' environment
+    variable, otherwise is used OpenPype local app data directory.
 
     Returns:
-        dict: Loaded default settings.
+        str: Path to cache file.
+    """
+
+    cache_dir = os.environ.get("OPENPYPE_SETTINGS_CACHE_DIR")
+    if not cache_dir:
+        import appdirs
+
+        cache_dir = appdirs.user_data_dir("openpype", "pypeclub")
+    return os.path.join(cache_dir, DEFAULT_SETTINGS_CACHE_FILENAME)
+
+
+def _collect_files_stats(dirpath, extensions, output):
+    if not os.path.isdir(dirpath):
+        return
+
+    for base, dirnames, filenames in os.walk(dirpath):
+        # Skip python cache folders and hidden folders
+        dirnames[:] = sorted(
+            dirname
+            for dirname in dirnames
+            if dirname != "__pycache__" and not dirname.startswith(".")
+        )
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[-1] not in extensions:
+                continue
+            path = os.path.join(base, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            output.append((path, stat.st_mtime, stat.st_size))
+
+
+def _get_default_settings_fingerprint():
+    """Fingerprint of sources used to create default settings.
+
+    Fingerprint is based on OpenPype version and on modification time and
+    size of files from defaults directory and modules directories. Content
+    of the files is not read.
+
+    Returns:
+        str: Fingerprint of default settings sources.
+    """
+
+    from openpype.version import __version__
+    from openpype.modules.base import get_module_dirs
+
+    # Hosts directory is skipped, hosts don't define settings definitions
+    #   and their settings are part of defaults directory
+    openpype_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    module_dirs = [
+        os.path.join(openpype_dir, "modules"),
+        os.path.join(openpype_dir, "addons"),
+    ]
+    for dirpath in get_module_dirs():
+        if dirpath not in module_dirs:
+            module_dirs.append(dirpath)
+
+    files_stats = []
+    _collect_files_stats(DEFAULTS_DIR, {".json"}, files_stats)
+    for dirpath in module_dirs:
+        _collect_files_stats(dirpath, {".py", ".json"}, files_stats)
+
+    fingerprint_data = {
+        "cache_version": DEFAULT_SETTINGS_CACHE_VERSION,
+        "openpype_version": __version__,
+        "files": files_stats,
+    }
+    return hashlib.md5(
+        json.dumps(fingerprint_data).encode("utf-8")
+    ).hexdigest()
+
+
+def _read_default_settings_cache(cache_path, fingerprint):
+    """Read default settings from on-disk cache.
+
+    Cache file contains header line with fingerprint and checksum of data
+    and data line with default settings.
+
+    Args:
+        cache_path (str): Path to cache file.
+        fingerprint (str): Expected fingerprint of default settings sources.
+
+    Returns:
+        Union[dict[str, Any], None]: Default settings or None if cache is
+            not available or is outdated.
+    """
+
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with open(cache_path, "rb") as stream:
+            header = json.loads(stream.readline().decode("utf-8"))
+            if (
+                header.get("cache_version") != DEFAULT_SETTINGS_CACHE_VERSION
+                or header.get("fingerprint") != fingerprint
+            ):
+                return None
+            content = stream.read()
+
+        if hashlib.md5(content).hexdigest() != header.get("checksum"):
+            log.warning(
+                "Cache of default settings is corrupted \"{}\"".format(
+                    cache_path
+                )
+            )
+            return None
+        return json.loads(content.decode("utf-8"))
+
+    except Exception:
+        log.warning(
+            "Failed to read cache of default settings \"{}\"".format(
+                cache_path
+            ),
+            exc_info=True
+        )
+    return None
+
+
+def _write_default_settings_cache(cache_path, fingerprint, data):
+    """Store default settings to on-disk cache.
+
+    File is written to temporary file which replaces the cache file so other
+    processes never read partially written cache.
+
+    Args:
+        cache_path (str): Path to cache file.
+        fingerprint (str): Fingerprint of default settings sources.
+        data (dict[str, Any]): Merged default settings.
     """
+
+    content = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    header = json.dumps({
+        "cache_version": DEFAULT_SETTINGS_CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "checksum": hashlib.md5(content).hexdigest(),
+    })
+    tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        with open(tmp_path, "wb") as stream:
+            stream.write(header.encode("utf-8") + b"\n")
+            stream.write(content)
+
+        if hasattr(os, "replace"):
+            os.replace(tmp_path, cache_path)
+        else:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            os.rename(tmp_path, cache_path)
+
+    except Exception:
+        log.warning(
+            "Failed to write cache of default settings \"{}\"".format(
+                cache_path
+            ),
+            exc_info=True
+        )
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _load_default_settings():
+    """Load default settings using on-disk cache if is valid.
+
+    Creation of default settings requires to import all OpenPype modules to
+    find their settings definitions. Result is stored to on-disk cache
+    which is used by next processes until OpenPype version or any file
+    in defaults or modules directories changes.
+
+    Returns:
+        dict[str, Any]: Default settings.
+    """
+
+    cache_path = get_default_settings_cache_path()
+    fingerprint = _get_default_settings_fingerprint()
+    defaults = _read_default_settings_cache(cache_path, fingerprint)
+    if defaults is None:
+        defaults = _get_default_settings()
+        _write_default_settings_cache(cache_path, fingerprint, defaults)
+    return defaults
+
+
+def _get_cached_default_settings():
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
-        _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+        _DEFAULT_SETTINGS = _load_default_settings()
+    return _DEFAULT_SETTINGS
+
+
+def get_default_settings():
+    """Get default settings.
+
+    Returns:
+        dict: Loaded default settings.
+    """
+    return copy.deepcopy(_get_cached_default_settings())
+
+
+def _get_default_settings_value(key):
+    """Copy of default settings under single key.
+
+    Args:
+        key (str): Settings key e.g. 'project_settings'.
+
+    Returns:
+        dict[str, Any]: Copy of default settings.
+    """
+
+    return copy.deepcopy(_get_cached_default_settings()[key])
 
 
 def load_json_file(fpath):
@@ -924,9 +1148,12 @@ def apply_local_settings_on_project_settings(
 
 def _get_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
+    default_values = _get_default_settings_value(SYSTEM_SETTINGS_KEY)
     studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    # Default values are already a copy
+    result = default_values
+    if studio_values:
+        result = merge_overrides(default_values, studio_values)
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -947,9 +1174,12 @@ def _get_system_settings(clear_metadata=True, exclude_locals=None):
 
 def get_default_project_settings(clear_metadata=True, exclude_locals=None):
     """Project settings with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
+    default_values = _get_default_settings_value(PROJECT_SETTINGS_KEY)
     studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    # Default values are already a copy
+    result = default_values
+    if studio_values:
+        result = merge_overrides(default_values, studio_values)
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
@@ -968,10 +1198,13 @@ def get_default_project_settings(clear_metadata=True, exclude_locals=None):
 
 def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
     """Project anatomy data with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
+    default_values = _get_default_settings_value(PROJECT_ANATOMY_KEY)
     studio_values = get_studio_project_anatomy_overrides()
 
-    result = apply_overrides(default_values, studio_values)
+    # Default values are already a copy
+    result = default_values
+    if studio_values:
+        result = merge_overrides(default_values, studio_values)
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
@@ -1028,34 +1261,114 @@ def _get_project_settings(
     project_name, clear_metadata=True, exclude_locals=None
 ):
     """Project settings with applied studio and project overrides."""
-    if not project_name:
-        raise ValueError(
-            "Must enter project name."
-            " Call `get_default_project_settings` to get project defaults."
-        )
+    return _get_project_settings_snapshot(
+        project_name, clear_metadata, exclude_locals
+    ).to_mutable()
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
-    )
 
-    result = apply_overrides(studio_overrides, project_overrides)
+def _build_project_settings(
+    project_name,
+    studio_overrides,
+    project_overrides,
+    clear_metadata,
+    local_settings
+):
+    """Apply overrides and local settings on default project settings.
+
+    Passed overrides are modified during the process.
+    """
+
+    result = _get_default_settings_value(PROJECT_SETTINGS_KEY)
+    if studio_overrides:
+        result = merge_overrides(result, studio_overrides)
+
+    if project_overrides:
+        result = merge_overrides(result, project_overrides)
 
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
 
+    # Apply local settings
+    if local_settings is not None:
+        apply_local_settings_on_project_settings(
+            result, local_settings, project_name
+        )
+
+    return result
+
+
+def _hash_settings_data(*items):
+    content = json.dumps(items, sort_keys=True, default=str)
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
+def _get_project_settings_snapshot(
+    project_name, clear_metadata=True, exclude_locals=None
+):
+    """Cached read-only project settings.
+
+    Snapshot is cached by project name, version of overrides and hash of
+    overrides and local settings. Cached snapshot is reused until it is
+    outdated, then overrides are loaded again and the snapshot is
+    recalculated only if they have changed.
+    """
+
+    if not project_name:
+        raise ValueError(
+            "Must enter project name."
+            " Call `get_default_project_settings` to get project defaults."
+        )
+
+    from .handlers import CacheValues
+
     # Apply local settings
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    cache_key = (project_name, clear_metadata, exclude_locals)
+    cache = _PROJECT_SETTINGS_SNAPSHOTS.get(cache_key)
+    if cache is None:
+        cache = CacheValues()
+        _PROJECT_SETTINGS_SNAPSHOTS[cache_key] = cache
+
+    if cache.data is not None and not cache.is_outdated:
+        return cache.data
+
+    studio_overrides, studio_version = (
+        get_studio_project_settings_overrides(True)
+    )
+    project_overrides, project_version = get_project_settings_overrides(
+        project_name, True
+    )
+    local_settings = None
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, project_name
+
+    version = (
+        studio_version,
+        project_version,
+        _hash_settings_data(
+            studio_overrides, project_overrides, local_settings
         )
+    )
+    snapshot = cache.data
+    if snapshot is None or cache.version != version:
+        snapshot = SettingsSnapshot(_build_project_settings(
+            project_name,
+            studio_overrides,
+            project_overrides,
+            clear_metadata,
+            local_settings
+        ))
+    cache.update_data(snapshot, version)
+    return snapshot
 
-    return result
+
+def reset_project_settings_snapshots():
+    """Mark cached project settings snapshots as outdated."""
+    for cache in _PROJECT_SETTINGS_SNAPSHOTS.values():
+        cache.set_outdated()
 
 
 def get_current_project_settings():
@@ -1129,16 +1442,42 @@ def get_general_environments():
 
 
 def get_system_settings(*args, **kwargs):
-    if not AYON_SERVER_ENABLED:
-        return _get_system_settings(*args, **kwargs)
+    # Import is not global to avoid circular imports with 'openpype.lib'
+    from openpype.lib.profiling import startup_span
 
-    default_settings = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    return get_ayon_system_settings(default_settings)
+    with startup_span("settings", "system settings"):
+        if not AYON_SERVER_ENABLED:
+            return _get_system_settings(*args, **kwargs)
+
+        default_settings = _get_default_settings_value(SYSTEM_SETTINGS_KEY)
+        return get_ayon_system_settings(default_settings)
 
 
 def get_project_settings(project_name, *args, **kwargs):
-    if not AYON_SERVER_ENABLED:
-        return _get_project_settings(project_name, *args, **kwargs)
+    from openpype.lib.profiling import startup_span
+
+    with startup_span("settings", "project settings"):
+        if not AYON_SERVER_ENABLED:
+            return _get_project_settings(project_name, *args, **kwargs)
+
+        default_settings = _get_default_settings_value(PROJECT_SETTINGS_KEY)
+        return get_ayon_project_settings(default_settings, project_name)
 
-    default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
-    return get_ayon_project_settings(default_settings, project_name)
+
+def get_project_settings_snapshot(project_name, *args, **kwargs):
+    """Read-only project settings.
+
+    Snapshot is shared across calls and is not copied for each call as
+    output of 'get_project_settings' is. Use 'to_mutable' method of snapshot
+    to get a copy which can be modified.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        SettingsSnapshot: Read-only project settings.
+    """
+
+    if not AYON_SERVER_ENABLED:
+        return _get_project_settings_snapshot(project_name, *args, **kwargs)
+    return SettingsSnapshot(get_project_settings(project_name))
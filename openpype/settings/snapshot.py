@@ -0,0 +1,125 @@
+"""Read-only views of settings data.
+
+Settings snapshot does not copy the data it wraps so the same data can be
+shared by all callers. Values of snapshot are wrapped to snapshot objects
+too, only the subtree which is converted using 'to_mutable' is copied.
+"""
+import copy
+
+from six.moves import collections_abc
+
+
+def _wrap_value(value):
+    if isinstance(value, dict):
+        return SettingsSnapshot(value)
+    if isinstance(value, list):
+        return SettingsSnapshotList(value)
+    return value
+
+
+def _unwrap_value(value):
+    if isinstance(value, (SettingsSnapshot, SettingsSnapshotList)):
+        return value._data
+    return value
+
+
+class SettingsSnapshot(collections_abc.Mapping):
+    """Read-only mapping of settings data.
+
+    Args:
+        data (dict[str, Any]): Settings data. Data must not be modified
+            after the snapshot is created.
+    """
+
+    __slots__ = ("_data", )
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return _wrap_value(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __eq__(self, other):
+        return self._data == _unwrap_value(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "<{}> {}".format(self.__class__.__name__, repr(self._data))
+
+    def __setitem__(self, key, value):
+        raise TypeError((
+            "'{}' is read-only. Use 'to_mutable' to get modifiable copy."
+        ).format(self.__class__.__name__))
+
+    def __delitem__(self, key):
+        raise TypeError((
+            "'{}' is read-only. Use 'to_mutable' to get modifiable copy."
+        ).format(self.__class__.__name__))
+
+    def __deepcopy__(self, memo):
+        # Deep copy is expected to be modifiable
+        return copy.deepcopy(self._data, memo)
+
+    def to_mutable(self):
+        """Copy of settings data which can be modified.
+
+        Returns:
+            dict[str, Any]: Copy of settings data.
+        """
+
+        return copy.deepcopy(self._data)
+
+
+class SettingsSnapshotList(collections_abc.Sequence):
+    """Read-only list of settings data.
+
+    Args:
+        data (list[Any]): Settings data. Data must not be modified after the
+            snapshot is created.
+    """
+
+    __slots__ = ("_data", )
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SettingsSnapshotList(self._data[index])
+        return _wrap_value(self._data[index])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        return self._data == _unwrap_value(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "<{}> {}".format(self.__class__.__name__, repr(self._data))
+
+    def __deepcopy__(self, memo):
+        # Deep copy is expected to be modifiable
+        return copy.deepcopy(self._data, memo)
+
+    def to_mutable(self):
+        """Copy of settings data which can be modified.
+
+        Returns:
+            list[Any]: Copy of settings data.
+        """
+
+        return copy.deepcopy(self._data)
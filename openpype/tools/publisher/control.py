@@ -19,6 +19,7 @@ from openpype.client import (
     get_asset_by_id,
     get_subsets,
     get_asset_name_identifier,
+    EntityCache,
 )
 from openpype.lib.events import EventSystem
 from openpype.lib.attribute_definitions import (
@@ -43,7 +44,10 @@ from openpype.pipeline.create.context import (
     CreatorsOperationFailed,
     ConvertorsOperationFailed,
 )
-from openpype.pipeline.publish import get_publish_instance_label
+from openpype.pipeline.publish import (
+    get_publish_instance_label,
+    PublishInstrumentation,
+)
 
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
@@ -253,8 +257,14 @@ class PublishReportMaker:
         """Set that current plugin has been skipped."""
         self._current_plugin_data["skipped"] = True
 
-    def add_result(self, result):
-        """Handle result of one plugin and it's instance."""
+    def add_result(self, result, span=None):
+        """Handle result of one plugin and it's instance.
+
+        Args:
+            result (dict[str, Any]): Pyblish result.
+            span (Optional[dict[str, Any]]): Timing span of processing
+                created by 'PublishInstrumentation'.
+        """
 
         instance = result["instance"]
         instance_id = None
@@ -263,7 +273,8 @@ class PublishReportMaker:
         self._current_plugin_data["instances_data"].append({
             "id": instance_id,
             "logs": self._extract_instance_log_items(result),
-            "process_time": result["duration"]
+            "process_time": result["duration"],
+            "span": span,
         })
 
     def add_action_result(self, action, result):
@@ -1718,6 +1729,10 @@ class PublisherController(BasePublisherController):
         self._publish_report = PublishReportMaker(self)
         # Store exceptions of validation error
         self._publish_validation_errors = PublishValidationErrors()
+        # Cache of entities used during publishing
+        self._publish_entity_cache = EntityCache()
+        # Timing spans of processed plugins
+        self._publish_instrumentation = PublishInstrumentation()
 
         # Publishing should stop at validation stage
         self._publish_up_validation = False
@@ -2243,6 +2258,10 @@ class PublisherController(BasePublisherController):
         self._publish_comment_is_set = False
 
         self._main_thread_iter = self._publish_iterator()
+        self._publish_entity_cache = EntityCache()
+        self._publish_instrumentation.stop()
+        self._publish_instrumentation = PublishInstrumentation()
+        self._publish_instrumentation.start()
         self._publish_context = pyblish.api.Context()
         # Make sure "comment" is set on publish context
         self._publish_context.data["comment"] = ""
@@ -2509,6 +2528,13 @@ class PublisherController(BasePublisherController):
                     self._publish_report.set_plugin_skipped()
 
         # Cleanup of publishing process
+        self.log.debug(
+            "Entity cache hits: {hits}, misses: {misses}".format(
+                **self._publish_entity_cache.get_stats()
+            )
+        )
+        self._publish_instrumentation.stop()
+        self._publish_instrumentation.log_summary()
         self.publish_has_finished = True
         self.publish_progress = self.publish_max_progress
         yield MainThreadItem(self.stop_publish)
@@ -2522,9 +2548,12 @@ class PublisherController(BasePublisherController):
         )
 
     def _process_and_continue(self, plugin, instance):
-        result = pyblish.plugin.process(
-            plugin, self._publish_context, instance
-        )
+        instrumentation = self._publish_instrumentation
+        with self._publish_entity_cache, instrumentation.measure() as measured:
+            result = pyblish.plugin.process(
+                plugin, self._publish_context, instance
+            )
+            measured["result"] = result
 
         exception = result.get("error")
         if exception:
@@ -2549,7 +2578,7 @@ class PublisherController(BasePublisherController):
 
             result["is_validation_error"] = has_validation_error
 
-        self._publish_report.add_result(result)
+        self._publish_report.add_result(result, measured["span"])
 
         self._publish_next_process()
 
@@ -1,6 +1,5 @@
 import collections
 import logging
-import itertools
 from functools import partial
 
 from qtpy import QtWidgets, QtCore
@@ -17,7 +16,7 @@ from openpype import style
 from openpype.pipeline import (
     legacy_io,
     HeroVersionType,
-    update_container,
+    update_containers,
     remove_container,
     discover_inventory_actions,
 )
@@ -841,17 +840,17 @@ class SceneInventoryView(QtWidgets.QTreeView):
             )
             versions = version
         else:
-            # Repeat the same version infinitely
-            versions = itertools.repeat(version)
+            versions = [version] * len(items)
 
         # Trigger update to latest
         try:
-            for item, item_version in zip(items, versions):
-                try:
-                    update_container(item, item_version)
-                except AssertionError:
-                    self._show_version_error_dialog(item_version, [item])
-                    log.warning("Update failed", exc_info=True)
+            results = update_containers(items, versions)
+            for result, item_version in zip(results, versions):
+                if result.error is not None:
+                    self._show_version_error_dialog(
+                        item_version, [result.container]
+                    )
+                    log.warning("Update failed", exc_info=result.error)
         finally:
             # Always update the scene inventory view, even if errors occurred
             self.data_changed.emit()
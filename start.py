@@ -966,6 +966,25 @@ def _boot_handle_missing_version(local_version, message):
         igniter.show_message_dialog("Version not found", message)
 
 
+def _start_startup_profiler():
+    """Start profiler of OpenPype startup.
+
+    Profiler module is imported by path so 'openpype.lib' is not imported
+    before profiler is started.
+    """
+    import importlib.util
+
+    openpype_spec = importlib.util.find_spec("openpype")
+    profiling_path = os.path.join(
+        os.path.dirname(openpype_spec.origin), "lib", "profiling.py")
+    spec = importlib.util.spec_from_file_location(
+        "openpype.lib.profiling", profiling_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    module.start_startup_profiling()
+
+
 def boot():
     """Bootstrap OpenPype."""
     global silent_mode
@@ -1115,6 +1134,10 @@ def boot():
     except KeyError:
         pass
 
+    # Start profiler before OpenPype is imported
+    if os.getenv("OPENPYPE_PROFILE_STARTUP_OUTPUT"):
+        _start_startup_profiler()
+
     _print(">>> loading environments ...")
     # Avalon environments must be set before avalon module is imported
     _print("  - for Avalon ...")
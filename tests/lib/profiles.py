@@ -0,0 +1,70 @@
+"""Profiles from default settings used by profiles filtering tests.
+
+Shared by unit tests and 'tools/benchmark_profiles.py'.
+"""
+import os
+import json
+import itertools
+
+from openpype import PACKAGE_DIR
+
+FILTER_KEYS = (
+    "hosts",
+    "host_names",
+    "families",
+    "task_types",
+    "task_names",
+    "tasks",
+    "subsets",
+)
+
+
+def get_default_profiles():
+    """Lists of profiles from default project settings."""
+    filepath = os.path.join(
+        PACKAGE_DIR, "settings", "defaults", "project_settings", "global.json"
+    )
+    with open(filepath, "r") as stream:
+        settings = json.load(stream)
+
+    output = []
+    queue = [settings]
+    while queue:
+        item = queue.pop(0)
+        if isinstance(item, dict):
+            queue.extend(item.values())
+            continue
+
+        if not isinstance(item, list) or not item:
+            continue
+
+        if all(
+            isinstance(profile, dict)
+            and any(key in profile for key in FILTER_KEYS)
+            for profile in item
+        ):
+            output.append(item)
+        else:
+            queue.extend(item)
+    return output
+
+
+def get_key_values_combinations(profiles):
+    """All combinations of filter values used in profiles.
+
+    Empty and unknown value are added for each used filter key.
+    """
+    values_by_key = {}
+    for profile in profiles:
+        for key in FILTER_KEYS:
+            if key not in profile:
+                continue
+            values = values_by_key.setdefault(key, {"", "unknown"})
+            for value in profile[key] or []:
+                values.add(value)
+
+    keys = list(sorted(values_by_key.keys()))
+    for values in itertools.product(
+        *[sorted(values_by_key[key]) for key in keys]
+    ):
+        yield dict(zip(keys, values))
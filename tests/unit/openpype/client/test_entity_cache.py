@@ -0,0 +1,124 @@
+from openpype.client.mongo.entity_cache import (
+    EntityCache,
+    entity_cache,
+    get_active_entity_cache,
+    invalidate_entity_cache,
+)
+
+PROJECT_NAME = "test_project"
+
+
+def _asset_doc(asset_id, name):
+    return {
+        "_id": asset_id,
+        "type": "asset",
+        "name": name,
+        "data": {"frameStart": 1001, "parents": ["shots"]},
+    }
+
+
+def test_find_by_id_and_key():
+    asset_doc = _asset_doc(1, "sh010")
+    queries = []
+
+    def query_func():
+        queries.append(True)
+        return asset_doc
+
+    with EntityCache() as cache:
+        assert get_active_entity_cache() is cache
+
+        doc = cache.find_one_by_key(
+            PROJECT_NAME, ("asset", "sh010"), {"asset"}, None, query_func
+        )
+        assert doc == asset_doc
+        # Returned documents are copies
+        doc["name"] = "changed"
+
+        doc = cache.find_one_by_id(
+            PROJECT_NAME, 1, {"asset"}, ["data.frameStart"], query_func
+        )
+        assert doc == {"_id": 1, "data": {"frameStart": 1001}}
+        # Array projection returns full document
+        doc = cache.find_one_by_id(
+            PROJECT_NAME, 1, {"asset"}, ["data.parents.0"], query_func
+        )
+        assert doc == asset_doc
+        # Not matching type
+        assert cache.find_one_by_id(
+            PROJECT_NAME, 1, {"subset"}, None, query_func
+        ) is None
+
+    assert get_active_entity_cache() is None
+    assert len(queries) == 1
+    assert cache.get_stats() == {"hits": 3, "misses": 1}
+
+
+def test_missing_documents_and_invalidation():
+    queries = []
+
+    def query_func():
+        queries.append(True)
+        return None
+
+    with entity_cache() as cache:
+        with entity_cache() as nested_cache:
+            assert nested_cache is cache
+
+        for _ in range(2):
+            assert cache.find_one_by_key(
+                PROJECT_NAME, ("asset", "sh020"), {"asset"}, None, query_func
+            ) is None
+        assert len(queries) == 1
+
+        invalidate_entity_cache(PROJECT_NAME)
+        cache.find_one_by_key(
+            PROJECT_NAME, ("asset", "sh020"), {"asset"}, None, query_func
+        )
+        assert len(queries) == 2
+
+
+def test_find_by_ids():
+    docs = {
+        idx: _asset_doc(idx, "sh{:03}".format(idx))
+        for idx in range(4)
+    }
+    queried_ids = []
+
+    def query_func(missing_ids):
+        queried_ids.append(list(missing_ids))
+        return [docs[doc_id] for doc_id in missing_ids]
+
+    cache = EntityCache()
+    result = cache.find_by_ids(
+        PROJECT_NAME, [0, 1], {"asset"}, ["name"], query_func
+    )
+    assert result == [{"_id": 0, "name": "sh000"}, {"_id": 1, "name": "sh001"}]
+
+    result = cache.find_by_ids(
+        PROJECT_NAME, [1, 2, 3], {"asset"}, None, query_func
+    )
+    assert [doc["_id"] for doc in result] == [1, 2, 3]
+    assert queried_ids == [[0, 1], [2, 3]]
+
+
+def test_cache_is_thread_local():
+    import threading
+
+    results = {}
+
+    def _thread_func():
+        results["active"] = get_active_entity_cache()
+        with EntityCache() as thread_cache:
+            results["thread_cache"] = thread_cache
+
+    with EntityCache() as cache:
+        thread = threading.Thread(target=_thread_func)
+        thread.start()
+        thread.join()
+        # Exit of cache in other thread does not deactivate this cache
+        assert get_active_entity_cache() is cache
+
+    assert results["active"] is None
+    assert results["thread_cache"] is not cache
+    assert get_active_entity_cache() is None
@@ -176,3 +176,97 @@ def test_events_partial_callbacks():
     event_system.emit("test", {}, "test")
 
     assert result == ["regular", "bar", "regular"]
+
+
+def test_wildcard_topics():
+    """
+    Validate if callbacks with wildcard topics are triggered.
+    """
+
+    result = []
+
+    def function_all():
+        result.append("all")
+
+    def function_prefix():
+        result.append("prefix")
+
+    def function_middle():
+        result.append("middle")
+
+    def function_exact():
+        result.append("exact")
+
+    event_system = QueuedEventSystem()
+    event_system.add_callback("*", function_all)
+    event_system.add_callback("workfile.*", function_prefix)
+    event_system.add_callback("workfile.*.end", function_middle)
+    event_system.add_callback("workfile.save", function_exact)
+
+    event_system.emit("workfile.save", {}, "test")
+    assert result == ["all", "prefix", "exact"]
+
+    result[:] = []
+    event_system.emit("workfile.save.end", {}, "test")
+    assert result == ["all", "prefix", "middle"]
+
+    # Wildcard must match at least one character
+    result[:] = []
+    event_system.emit("workfile.", {}, "test")
+    assert result == ["all"]
+
+
+def test_order_change():
+    """
+    Validate if change of callback order is used by next emit.
+    """
+
+    result = []
+
+    def function_a():
+        result.append("A")
+
+    def function_b():
+        result.append("B")
+
+    event_system = EventSystem()
+    event_system.add_callback("test", function_a)
+    callback_b = event_system.add_callback("test.*", function_b)
+    event_system.emit("test", {}, "test")
+    event_system.emit("test.1", {}, "test")
+    assert result == ["A", "B"]
+
+    result[:] = []
+    callback_a = event_system.add_callback("test.1", function_a)
+    event_system.emit("test.1", {}, "test")
+    callback_b.order = callback_a.order - 1
+    event_system.emit("test.1", {}, "test")
+    assert result == ["B", "A", "B", "A"]
+
+
+def test_emit_many():
+    """
+    Validate if events emitted at once are processed in order.
+    """
+
+    result = []
+
+    def function(event):
+        result.append(event.topic)
+
+    def function_to_remove():
+        result.append("removed")
+
+    event_system = QueuedEventSystem()
+    event_system.add_callback("test.*", function)
+    callback = event_system.add_callback("test.1", function_to_remove)
+    callback.deregister()
+    events = event_system.emit_many([
+        ("test.1", {}, "test"),
+        ("test.2", {}, "test"),
+        ("other", {}, "test"),
+    ])
+
+    assert [event.topic for event in events] == ["test.1", "test.2", "other"]
+    assert result == ["test.1", "test.2"]
+    assert callback not in event_system._registered_callbacks
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _create_sources(tmpdir, count):
+    src_dir = tmpdir.mkdir("src")
+    paths = []
+    for idx in range(count):
+        path = src_dir.join("file.{:04}.exr".format(idx))
+        path.write(str(idx))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [0, 4])
+def test_process_transfers(tmpdir, max_workers):
+    src_paths = _create_sources(tmpdir, 100)
+    dst_dir = str(tmpdir.join("dst"))
+
+    transaction = FileTransaction(max_workers=max_workers)
+    for src_path in src_paths:
+        transaction.add(
+            src_path, os.path.join(dst_dir, os.path.basename(src_path)))
+    transaction.process()
+    transaction.finalize()
+
+    assert len(transaction.transferred) == len(src_paths)
+    for src_path in src_paths:
+        dst_path = os.path.join(dst_dir, os.path.basename(src_path))
+        with open(dst_path, "r") as stream:
+            with open(src_path, "r") as src_stream:
+                assert stream.read() == src_stream.read()
+
+
+def test_parallel_rollback(tmpdir):
+    src_paths = _create_sources(tmpdir, 100)
+    dst_dir = str(tmpdir.join("dst"))
+    # Existing file which should be restored by rollback
+    os.makedirs(dst_dir)
+    existing_path = os.path.join(dst_dir, os.path.basename(src_paths[0]))
+    with open(existing_path, "w") as stream:
+        stream.write("original")
+
+    # Missing source file makes the transfer fail
+    src_paths.append(str(tmpdir.join("src", "missing.exr")))
+
+    transaction = FileTransaction(max_workers=4)
+    for src_path in src_paths:
+        transaction.add(
+            src_path, os.path.join(dst_dir, os.path.basename(src_path)))
+
+    with pytest.raises(Exception):
+        try:
+            transaction.process()
+        except Exception:
+            transaction.rollback()
+            raise
+
+    assert os.listdir(dst_dir) == [os.path.basename(existing_path)]
+    with open(existing_path, "r") as stream:
+        assert stream.read() == "original"
@@ -0,0 +1,89 @@
+from openpype.lib.path_templates import StringTemplate
+
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/<v{version:0>3}/>{asset}.{frame:0>4}.{ext}"
+)
+DATA = {
+    "root": {"work": "/mnt/work"},
+    "project": {"name": "demo"},
+    "asset": "sh010",
+    "version": 2,
+    "frame": 1001,
+    "ext": "exr",
+}
+
+
+def test_format_sequence_matches_format():
+    template = StringTemplate(TEMPLATE)
+    formatter = template.format_sequence(DATA, "frame")
+
+    for frame in (1001, 1002, 99999):
+        data = dict(DATA, frame=frame)
+        assert formatter(frame) == template.format_strict(data)
+
+    assert formatter.result.used_values == (
+        template.format_strict(DATA).used_values
+    )
+    assert formatter.head == "/mnt/work/demo/v002/sh010."
+    assert formatter.tail == ".exr"
+    assert formatter.padding == 4
+
+
+def test_format_sequence_key_in_optional_part():
+    template = StringTemplate("{asset}<.{frame}>.{ext}")
+    formatter = template.format_sequence(DATA, "frame")
+
+    assert formatter(5) == "sh010.5.exr"
+    assert formatter.head is None
+
+
+def test_parsed_template_parts_are_shared():
+    first = StringTemplate(TEMPLATE)
+    second = StringTemplate(TEMPLATE)
+
+    assert first.get_template_parts(TEMPLATE) is second._parts
+
+
+def test_cached_format_results_are_independent():
+    template = StringTemplate(TEMPLATE)
+    first = template.format(DATA)
+    first.used_values["frame"] = "changed"
+    second = template.format(DATA)
+
+    assert second == first
+    assert second.used_values["frame"] == "1001"
+
+    data = dict(DATA, project="invalid")
+    result = template.format(data)
+    assert not result.solved
+    assert result.invalid_types == {"project": str}
+
+
+def test_cached_format_missing_keys_are_independent():
+    template = StringTemplate(TEMPLATE)
+    data = dict(DATA)
+    data.pop("asset")
+    first = template.format(data)
+    assert first.missing_keys == ["asset"]
+    first.missing_keys.append("changed")
+
+    assert template.format(data).missing_keys == ["asset"]
+
+
+def test_format_results_cache_is_lru():
+    template = StringTemplate(TEMPLATE)
+    template.results_cache_size = 2
+    datas = [dict(DATA, frame=frame) for frame in (1001, 1002, 1003)]
+
+    template.format(datas[0])
+    template.format(datas[1])
+    # Use first result so second is the least recently used
+    template.format(datas[0])
+    template.format(datas[2])
+
+    cache_keys = list(template._results_cache.keys())
+    assert cache_keys == [
+        template._get_results_cache_key(datas[0]),
+        template._get_results_cache_key(datas[2]),
+    ]
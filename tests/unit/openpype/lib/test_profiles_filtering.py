@@ -0,0 +1,22 @@
+"""Tests of profiles filtering on default settings profiles."""
+from openpype.lib.profiles_filtering import (
+    filter_profiles,
+    ProfilesIndex,
+)
+from tests.lib.profiles import (
+    get_default_profiles,
+    get_key_values_combinations,
+)
+
+
+def test_profiles_index_matches_filter_profiles():
+    profiles_lists = get_default_profiles()
+    assert profiles_lists
+
+    for profiles in profiles_lists:
+        index = ProfilesIndex(profiles)
+        for key_values in get_key_values_combinations(profiles):
+            expected = filter_profiles(profiles, key_values)
+            # Second call is using cached result
+            for _ in range(2):
+                assert index.filter(key_values) is expected
@@ -0,0 +1,36 @@
+import os
+import json
+
+from openpype.lib import profiling
+
+
+def test_startup_profiler(tmpdir):
+    with profiling.StartupProfiler() as profiler:
+        assert profiling.get_active_startup_profiler() is profiler
+        with profiling.startup_span("settings", "system settings"):
+            import xml.dom.minidom  # noqa: F401
+    assert profiling.get_active_startup_profiler() is None
+
+    report_data = profiler.get_report_data()
+    assert "settings" in report_data["categories"]
+    assert report_data["tree"]["children"][0]["name"] == "system settings"
+
+    report_path, folded_path = profiler.save(str(tmpdir))
+    with open(report_path, "r") as stream:
+        assert json.load(stream)["total"] == report_data["total"]
+    assert os.path.exists(folded_path)
+
+
+def test_startup_budget():
+    report_data = {
+        "total": 2.0,
+        "categories": {"modules": 1.0},
+        "imports": {"openpype.lib": {"self": 0.1, "cumulative": 0.5}},
+    }
+    assert not profiling.check_startup_budget(report_data, {"total": 3.0})
+    messages = profiling.check_startup_budget(report_data, {
+        "total": 1.0,
+        "categories": {"modules": 0.5, "settings": 0.5},
+        "imports": {"openpype.lib": 0.2},
+    })
+    assert len(messages) == 3
@@ -0,0 +1,78 @@
+import os
+
+from openpype.lib.sequence_index import (
+    DirectorySequenceIndex,
+    parse_sequence_filename,
+    get_directory_sequence_index,
+)
+
+
+def _create_files(dirpath, filenames):
+    for filename in filenames:
+        with open(os.path.join(dirpath, filename), "w") as stream:
+            stream.write(filename)
+
+
+def test_parse_sequence_filename():
+    assert parse_sequence_filename("beauty.1001.exr") == (
+        "beauty.", 1001, 0, ".exr"
+    )
+    assert parse_sequence_filename("beauty_v001.0010.exr") == (
+        "beauty_v001.", 10, 4, ".exr"
+    )
+    assert parse_sequence_filename("cache.1001.bgeo.sc") == (
+        "cache.", 1001, 0, ".bgeo.sc"
+    )
+    assert parse_sequence_filename("render_1001_beauty.exr") == (
+        "render_", 1001, 0, "_beauty.exr"
+    )
+    assert parse_sequence_filename("clip.mp4") is None
+    assert parse_sequence_filename("notes") is None
+
+
+def test_directory_sequence_index(tmpdir):
+    dirpath = str(tmpdir)
+    _create_files(dirpath, [
+        "beauty.0998.exr",
+        "beauty.0999.exr",
+        "beauty.1000.exr",
+        "beauty.1002.exr",
+        "review.mov",
+        "single.0001.png",
+    ])
+    os.makedirs(os.path.join(dirpath, "subdir.0001.exr"))
+
+    index = DirectorySequenceIndex(dirpath)
+    assert "subdir.0001.exr" not in index.filenames
+    assert index.remainder == ["review.mov", "single.0001.png"]
+
+    collections = index.get_collections()
+    assert len(collections) == 1
+    assert collections[0].head == "beauty."
+    assert collections[0].padding == 4
+    assert collections[0].indexes == {998, 999, 1000, 1002}
+
+    assert sorted(index.get_sequence_frames("beauty.", ".exr")) == [
+        998, 999, 1000, 1002
+    ]
+    assert index.get_missing_frames(
+        "beauty.", ".exr", range(998, 1004), 4
+    ) == [1001, 1003]
+    assert index.get_missing_files(
+        {"beauty.0999.exr", "beauty.1001.exr"}
+    ) == {"beauty.1001.exr"}
+    assert index.get_stat("review.mov").st_size == len("review.mov")
+    assert index.get_stat("missing.mov") is None
+
+    # Index is not updated until refreshed
+    _create_files(dirpath, ["beauty.1001.exr"])
+    assert not index.exists("beauty.1001.exr")
+    index.refresh()
+    assert index.exists("beauty.1001.exr")
+
+
+def test_directory_sequence_index_cache(tmpdir):
+    cache = {}
+    index = get_directory_sequence_index(str(tmpdir), cache)
+    assert get_directory_sequence_index(str(tmpdir), cache) is index
+    assert get_directory_sequence_index(str(tmpdir)) is not index
@@ -0,0 +1,59 @@
+import os
+
+from openpype.lib import transcoding
+
+XML_SPEC = (
+    "<ImageSpec version=\"26\">\n"
+    "<width>{}</width>\n"
+    "<height>1080</height>\n"
+    "</ImageSpec>"
+)
+
+
+def _create_files(tmpdir, count):
+    filepaths = []
+    for idx in range(count):
+        filepath = os.path.join(str(tmpdir), "render.{}.exr".format(idx))
+        with open(filepath, "w") as stream:
+            stream.write(str(idx))
+        filepaths.append(filepath)
+    return filepaths
+
+
+def test_oiio_info_cache(tmpdir, monkeypatch):
+    calls = []
+
+    def _run_subprocess(args, logger=None):
+        calls.append(args)
+        inputs = [arg for arg in args if arg.endswith(".exr")]
+        return "\n".join(
+            XML_SPEC.format(1000 + int(path.split(".")[-2]))
+            for path in inputs
+        )
+
+    monkeypatch.setattr(transcoding, "run_subprocess", _run_subprocess)
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args)
+    )
+    transcoding.clear_probe_cache()
+
+    filepaths = _create_files(tmpdir, 3)
+    info = transcoding.get_oiio_info_for_input(filepaths[0])
+    assert info["width"] == 1000
+    # Modified result does not affect cache
+    info["width"] = 1
+    assert transcoding.get_oiio_info_for_input(filepaths[0])["width"] == 1000
+    assert len(calls) == 1
+
+    # Cached input is not probed again, others are probed by one process
+    infos = transcoding.get_oiio_info_for_inputs(filepaths + filepaths[1:2])
+    assert [item["width"] for item in infos] == [1000, 1001, 1002, 1001]
+    assert len(calls) == 2
+    assert len([arg for arg in calls[1] if arg.endswith(".exr")]) == 2
+
+    # Changed file is probed again
+    with open(filepaths[0], "w") as stream:
+        stream.write("changed content")
+    transcoding.get_oiio_info_for_input(filepaths[0])
+    assert len(calls) == 3
+    transcoding.clear_probe_cache()
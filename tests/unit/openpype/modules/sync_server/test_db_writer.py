@@ -0,0 +1,41 @@
+from pymongo import UpdateOne
+
+from openpype.modules.sync_server.db_writer import SyncDBWriter
+
+
+class _Collection(object):
+    def __init__(self, fail):
+        self.fail = fail
+        self.operations = []
+
+    def bulk_write(self, operations, ordered=True):
+        if self.fail:
+            raise RuntimeError("Write failed")
+        self.operations.extend(operations)
+
+
+class _Connection(object):
+    def __init__(self, failing_projects=()):
+        self.database = {
+            project_name: _Collection(project_name in failing_projects)
+            for project_name in ("prj", "failing")
+        }
+
+
+def test_updates_written_callback():
+    written = []
+    connection = _Connection(failing_projects={"failing"})
+    writer = SyncDBWriter(
+        connection, 1, lambda *args: written.append(args)
+    )
+    writer.add_update("prj", UpdateOne({"_id": 1}, {"$set": {}}), 1)
+    writer.add_update("failing", UpdateOne({"_id": 2}, {"$set": {}}), 2)
+
+    # Representation is not reported before the update is written
+    assert written == []
+    writer.flush_updates()
+    assert written == [("prj", {1})]
+    assert len(connection.database["prj"].operations) == 1
+
+    writer.flush_updates()
+    assert written == [("prj", {1})]
@@ -0,0 +1,27 @@
+import os
+
+from openpype.modules.sync_server.providers import transfer
+
+
+def test_copy_file_zero_copy_not_supported(tmpdir, monkeypatch):
+    """Chunked copy is used when zero-copy functions copy nothing."""
+    source_path = str(tmpdir.join("source.exr"))
+    target_path = str(tmpdir.join("target.exr"))
+    content = os.urandom(1024)
+    with open(source_path, "wb") as stream:
+        stream.write(content)
+
+    zero_copy = lambda *args: 0  # noqa: E731
+    monkeypatch.setattr(os, "copy_file_range", zero_copy, raising=False)
+    monkeypatch.setattr(os, "sendfile", zero_copy, raising=False)
+
+    progress = []
+    assert transfer.copy_file(
+        source_path,
+        target_path,
+        lambda copied, total: progress.append(copied),
+        chunk_size=256
+    ) == len(content)
+    with open(target_path, "rb") as stream:
+        assert stream.read() == content
+    assert progress[-1] == len(content)
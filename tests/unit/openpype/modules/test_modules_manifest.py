@@ -0,0 +1,198 @@
+import os
+import sys
+import functools
+import importlib
+
+from openpype.modules import base
+
+
+def _create_items(tmpdir):
+    module_dir = os.path.join(str(tmpdir), "modules", "my_addon")
+    os.makedirs(module_dir)
+    with open(os.path.join(module_dir, "__init__.py"), "w") as stream:
+        stream.write("")
+    return [
+        base._ModuleItem(
+            "my_addon",
+            os.path.dirname(module_dir),
+            "my_addon",
+            base._DIR_MODULE
+        )
+    ]
+
+
+def test_modules_manifest_fingerprint(tmpdir, monkeypatch):
+    monkeypatch.setenv("OPENPYPE_SETTINGS_CACHE_DIR", str(tmpdir))
+    items = _create_items(tmpdir)
+    fingerprint = base._get_modules_fingerprint(items)
+    assert fingerprint == base._get_modules_fingerprint(list(reversed(items)))
+    assert base._read_modules_manifest(fingerprint) is None
+
+    class _Modules(object):
+        def get(self, key):
+            return object()
+
+    base._write_modules_manifest(fingerprint, items, _Modules(), None)
+    assert base._read_modules_manifest(fingerprint) == {
+        "my_addon": {"addons": []}
+    }
+    assert base._read_modules_manifest("other") is None
+
+
+def test_lazy_module_disabled():
+    lazy_module = base._LazyModule("my_addon", lambda: None, {
+        "addons": [{
+            "class": "MyModule",
+            "name": "my_module",
+            "openpype_module": True,
+            "interfaces": [],
+        }]
+    })
+    assert lazy_module.is_disabled({"my_module": {"enabled": False}})
+    assert not lazy_module.is_disabled({"my_module": {"enabled": True}})
+    assert not lazy_module.is_disabled({})
+
+
+class _Log(object):
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, msg, *args, **kwargs):
+        self.warnings.append(msg)
+
+
+def _create_lazy_module(
+    tmpdir, monkeypatch, module_name, openpype_modules=None, imports=()
+):
+    module_dir = os.path.join(str(tmpdir), "addons", module_name)
+    os.makedirs(module_dir)
+    with open(os.path.join(module_dir, "__init__.py"), "w") as stream:
+        stream.write("\n".join(tuple(imports) + (
+            "from openpype.modules import OpenPypeModule",
+            "",
+            "",
+            "class MyModule(OpenPypeModule):",
+            "    name = \"{}\"".format(module_name),
+            "",
+            "    def initialize(self, modules_settings):",
+            "        self.enabled = True",
+            "",
+        )))
+
+    if openpype_modules is None:
+        openpype_modules = base._ModuleClass("openpype_modules")
+        object.__setattr__(openpype_modules, "_log", _Log())
+        monkeypatch.setitem(
+            sys.modules, "openpype_modules", openpype_modules
+        )
+        monkeypatch.setattr(
+            sys, "meta_path", [base._LazyModulesFinder()] + sys.meta_path
+        )
+    log = openpype_modules.log
+
+    item = base._ModuleItem(
+        module_name, os.path.dirname(module_dir), module_name,
+        base._DIR_MODULE
+    )
+    lazy_module = base._LazyModule(
+        module_name,
+        functools.partial(
+            base._import_module_item,
+            item,
+            openpype_modules,
+            "openpype_modules",
+            log
+        ),
+        {"addons": [{
+            "class": "MyModule",
+            "name": module_name,
+            "openpype_module": True,
+            "interfaces": [],
+        }]}
+    )
+    setattr(openpype_modules, module_name, lazy_module)
+    return openpype_modules, lazy_module, log
+
+
+def test_lazy_module_import_through_finder(tmpdir, monkeypatch):
+    module_name = "lazy_import_addon"
+    full_name = "openpype_modules.{}".format(module_name)
+    monkeypatch.delitem(sys.modules, full_name, raising=False)
+    openpype_modules, lazy_module, log = _create_lazy_module(
+        tmpdir, monkeypatch, module_name
+    )
+    try:
+        module = importlib.import_module(full_name)
+    finally:
+        sys.modules.pop(full_name, None)
+
+    assert module is lazy_module.load()
+    assert openpype_modules.get(module_name) is module
+    assert module.MyModule.name == module_name
+    assert log.warnings == []
+
+
+def test_lazy_module_imports_other_lazy_module(tmpdir, monkeypatch):
+    import threading
+
+    full_names = [
+        "openpype_modules.lazy_main_addon",
+        "openpype_modules.lazy_dependency_addon",
+    ]
+    for full_name in full_names:
+        monkeypatch.delitem(sys.modules, full_name, raising=False)
+
+    openpype_modules, dependency, _ = _create_lazy_module(
+        tmpdir, monkeypatch, "lazy_dependency_addon"
+    )
+    _, lazy_module, log = _create_lazy_module(
+        tmpdir,
+        monkeypatch,
+        "lazy_main_addon",
+        openpype_modules,
+        imports=[
+            "from openpype_modules.lazy_dependency_addon import (",
+            "    MyModule as DependencyModule,",
+            ")",
+        ]
+    )
+
+    results = {}
+
+    def _load():
+        results["module"] = lazy_module.load()
+
+    # Load in thread so deadlock does not block tests
+    thread = threading.Thread(target=_load)
+    thread.daemon = True
+    try:
+        thread.start()
+        thread.join(20)
+    finally:
+        for full_name in full_names:
+            sys.modules.pop(full_name, None)
+
+    assert not thread.is_alive()
+    module = results["module"]
+    assert module.DependencyModule is dependency.load().MyModule
+    assert openpype_modules.get("lazy_dependency_addon") is dependency.load()
+    assert log.warnings == []
+
+
+def test_modules_manager_disabled_lazy_addon(tmpdir, monkeypatch):
+    module_name = "lazy_disabled_addon"
+    _, lazy_module, _ = _create_lazy_module(
+        tmpdir, monkeypatch, module_name
+    )
+    monkeypatch.setattr(base._LoadCache, "interfaces_loaded", True)
+    monkeypatch.setattr(base._LoadCache, "modules_loaded", True)
+
+    manager = base.ModulesManager(
+        system_settings={"modules": {module_name: {"enabled": False}}}
+    )
+    addon = manager[module_name]
+    assert isinstance(addon, base._LazyDisabledAddon)
+    assert not addon.enabled
+    assert manager.get_enabled_module(module_name) is None
+    # Python module of disabled addon was not imported
+    assert lazy_module._lazy_module is None
@@ -0,0 +1,34 @@
+import os
+import sys
+import json
+
+from openpype.lib import run_subprocess
+from openpype.pipeline.publish import instrumentation
+
+
+def test_publish_spans_sink_path(monkeypatch):
+    monkeypatch.delenv(instrumentation.PUBLISH_SPANS_ENV_KEY, raising=False)
+    path = os.path.join("farm", "metadata.json")
+    assert instrumentation.get_publish_spans_sink_path([path]) is None
+
+    monkeypatch.setenv(instrumentation.PUBLISH_SPANS_ENV_KEY, "1")
+    assert instrumentation.get_publish_spans_sink_path([path]) == (
+        os.path.join("farm", "metadata_publish_spans.jsonl")
+    )
+
+
+def test_publish_instrumentation_measure(tmpdir):
+    sink_path = os.path.join(str(tmpdir), "spans.jsonl")
+    with instrumentation.PublishInstrumentation(sink_path) as recorder:
+        with recorder.measure() as measured:
+            run_subprocess([sys.executable, "-c", "pass"])
+            measured["result"] = {"success": True}
+
+    span = measured["span"]
+    assert span["success"] is True
+    assert span["subprocess_time"] > 0
+    assert span["duration"] >= span["subprocess_time"]
+
+    with open(sink_path, "r") as stream:
+        lines = stream.read().splitlines()
+    assert json.loads(lines[0])["success"] is True
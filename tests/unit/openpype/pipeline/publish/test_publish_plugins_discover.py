@@ -0,0 +1,58 @@
+import os
+
+from openpype.pipeline.publish import (
+    publish_plugins_discover,
+    clear_publish_plugins_cache,
+)
+
+PLUGIN_CONTENT = """import pyblish.api
+
+
+class CollectDiscoverTest(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+    label = "{label}"
+
+    def process(self, context):
+        pass
+"""
+
+
+def _write_plugin(dirpath, label):
+    filepath = os.path.join(dirpath, "collect_discover_test.py")
+    with open(filepath, "w") as stream:
+        stream.write(PLUGIN_CONTENT.format(label=label))
+
+
+def _get_plugin(result):
+    for plugin in result.plugins:
+        if plugin.__name__ == "CollectDiscoverTest":
+            return plugin
+    return None
+
+
+def test_discover_cache(tmpdir):
+    dirpath = str(tmpdir)
+    _write_plugin(dirpath, "First")
+    clear_publish_plugins_cache()
+
+    result = publish_plugins_discover([dirpath])
+    plugin = _get_plugin(result)
+    assert plugin.label == "First"
+    assert os.path.normpath(dirpath) in result.discover_time_by_path
+
+    # Attributes changed by settings are restored on next discovery
+    plugin.label = "Changed"
+    plugin.custom_attribute = True
+    result = publish_plugins_discover([dirpath])
+    assert _get_plugin(result) is plugin
+    assert plugin.label == "First"
+    assert not hasattr(plugin, "custom_attribute")
+    assert len(result.cached_file_paths) == 1
+
+    # Changed file is imported again
+    _write_plugin(dirpath, "Second label")
+    result = publish_plugins_discover([dirpath])
+    new_plugin = _get_plugin(result)
+    assert new_plugin is not plugin
+    assert new_plugin.label == "Second label"
+    assert not result.cached_file_paths
@@ -0,0 +1,74 @@
+import os
+
+from openpype.pipeline.publish import source_hashes
+
+
+class _Collection(object):
+    def __init__(self):
+        self.docs = []
+        self.indexes = []
+
+    def create_index(self, keys, **kwargs):
+        self.indexes.append(keys)
+
+    def find(self, query, projection=None):
+        return [
+            dict(doc)
+            for doc in self.docs
+            if doc["project"] == query["project"]
+            and doc["hash"] in query["hash"]["$in"]
+        ]
+
+
+def test_files_content_hashes(tmpdir):
+    filepaths = []
+    for idx, content in enumerate(("a", "b", "a")):
+        filepath = os.path.join(str(tmpdir), "texture{}.exr".format(idx))
+        with open(filepath, "w") as stream:
+            stream.write(content)
+        filepaths.append(filepath)
+
+    hashes = source_hashes.get_files_content_hashes(filepaths, 2)
+    assert set(hashes) == set(filepaths)
+    # Same content in different locations has same hash
+    assert hashes[filepaths[0]] == hashes[filepaths[2]]
+    assert hashes[filepaths[0]] != hashes[filepaths[1]]
+    assert hashes[filepaths[1]] == source_hashes.get_file_content_hash(
+        filepaths[1]
+    )
+
+
+def test_find_source_hash_path(tmpdir):
+    published_path = os.path.join(str(tmpdir), "texture.tx")
+    with open(published_path, "w") as stream:
+        stream.write("tx")
+
+    collection = _Collection()
+    collection.docs.extend([
+        {"project": "prj", "hash": "a", "path": published_path},
+        {"project": "prj", "hash": "b", "path": published_path + ".missing"},
+        {"project": "other", "hash": "c", "path": published_path},
+    ])
+    item = source_hashes.find_source_hash_path("prj", "a", collection)
+    assert item["path"] == published_path
+    assert source_hashes.find_source_hash_path("prj", "b", collection) is None
+    assert source_hashes.find_source_hash_path("prj", "c", collection) is None
+
+
+def test_source_hashes_index_ensured_once(monkeypatch):
+    from openpype.client import mongo
+
+    collection = _Collection()
+    monkeypatch.setattr(source_hashes, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setattr(source_hashes, "_INDEXES_ENSURED", False)
+    monkeypatch.setenv("OPENPYPE_DATABASE_NAME", "openpype")
+    monkeypatch.setattr(
+        mongo.OpenPypeMongoConnection,
+        "get_mongo_client",
+        lambda: {
+            "openpype": {source_hashes.SOURCE_HASHES_COLLECTION: collection}
+        }
+    )
+    for _ in range(3):
+        assert source_hashes.get_source_hashes_collection() is collection
+    assert len(collection.indexes) == 1
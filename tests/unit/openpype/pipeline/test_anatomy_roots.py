@@ -0,0 +1,48 @@
+from openpype.pipeline.anatomy import Roots, RootsPrefixIndex
+
+
+def _legacy_find_root(roots, path):
+    for root_item in roots.values():
+        success, result = root_item.find_root_template_from_path(path)
+        if success:
+            return result
+    return None
+
+
+def test_roots_prefix_index():
+    roots = Roots._parse_dict({
+        "work": {
+            "windows": "P:/Projects/work",
+            "linux": "/mnt/projects/work",
+            "darwin": "/Volumes/projects/work",
+        },
+        "publish": {
+            "windows": "P:\\Projects",
+            "linux": "/mnt/projects",
+            "darwin": "",
+        },
+    })
+    prefix_index = RootsPrefixIndex(roots)
+
+    paths = [
+        "p:\\projects\\work\\shot\\file.ma",
+        "P:/Projects/publish/file.exr",
+        "/mnt/projects/work/file.ma",
+        "/mnt/projects/workshop/file.ma",
+        "/mnt/projects/publish/file.exr",
+        "/MNT/projects/publish/file.exr",
+        "/Volumes/projects/work/file.ma",
+        "/other/file.ma",
+        "",
+    ]
+    for path in paths:
+        match = prefix_index.find_root(path)
+        result = match[1] if match else None
+        assert result == _legacy_find_root(roots, path), path
+
+    assert prefix_index.find_root("/mnt/projects/work/a.ma") == (
+        "work", "{root[work]}/a.ma"
+    )
+    assert prefix_index.find_root("P:/projects/a.ma") == (
+        "publish", "{root[publish]}/a.ma"
+    )
@@ -0,0 +1,72 @@
+import os
+import sys
+
+from openpype.pipeline import colorspace
+
+FAKE_SERVER = """
+import sys
+import json
+
+print("OpenPype startup output")
+sys.stdout.flush()
+for line in iter(sys.stdin.readline, ""):
+    request = json.loads(line)
+    response = {"id": request["id"], "result": request["kwargs"]}
+    if request["command"] == "fail":
+        response = {"id": request["id"], "error": "Traceback"}
+    sys.stdout.write("OCIO_WRAPPER_RESPONSE:" + json.dumps(response) + "\\n")
+    sys.stdout.flush()
+"""
+
+
+def test_ocio_wrapper_worker(tmpdir, monkeypatch):
+    script_path = os.path.join(str(tmpdir), "server.py")
+    with open(script_path, "w") as stream:
+        stream.write(FAKE_SERVER)
+
+    monkeypatch.setattr(
+        colorspace,
+        "get_openpype_execute_args",
+        lambda *args: [sys.executable, script_path]
+    )
+    monkeypatch.setattr(
+        colorspace, "is_running_from_build", lambda: False
+    )
+
+    worker = colorspace._OCIOWrapperWorker()
+    try:
+        assert worker.query("config", "get_views", in_path="a") == {
+            "in_path": "a"
+        }
+        process = worker._process
+        assert worker.query("config", "get_views", in_path="b") == {
+            "in_path": "b"
+        }
+        # Same process answers all queries
+        assert worker._process is process
+        try:
+            worker.query("config", "fail")
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("Error response did not raise")
+    finally:
+        worker.stop()
+    assert process.poll() is not None
+
+
+def test_ocio_config_colorspaces_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv("OPENPYPE_SETTINGS_CACHE_DIR", str(tmpdir))
+    config_path = os.path.join(str(tmpdir), "config.ocio")
+    with open(config_path, "w") as stream:
+        stream.write("ocio_profile_version: 2")
+
+    assert colorspace._read_ocio_config_colorspaces_cache(config_path) is None
+    data = {"colorspaces": {"ACEScg": {"family": "ACES"}}}
+    colorspace._write_ocio_config_colorspaces_cache(config_path, data)
+    assert colorspace._read_ocio_config_colorspaces_cache(config_path) == data
+
+    # Changed config invalidates cache
+    with open(config_path, "w") as stream:
+        stream.write("ocio_profile_version: 2.1")
+    assert colorspace._read_ocio_config_colorspaces_cache(config_path) is None
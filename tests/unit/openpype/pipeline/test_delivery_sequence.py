@@ -0,0 +1,65 @@
+import os
+import logging
+import collections
+
+import pytest
+
+from openpype.lib.path_templates import StringTemplate
+from openpype.pipeline.delivery import deliver_sequence
+
+DELIVERY_TEMPLATE = "{dst_dir}/{asset}.{frame}{tail}"
+
+
+class _Anatomy(object):
+    project_name = "test_project"
+
+    def __init__(self):
+        self.templates = {"delivery": {"seq": DELIVERY_TEMPLATE}}
+        self.templates_obj = {
+            "delivery": {"seq": StringTemplate(DELIVERY_TEMPLATE)}
+        }
+
+
+@pytest.mark.parametrize("filenames,src_name,ext,tail", [
+    (
+        ["cache.1001.bgeo.sc", "cache.1002.bgeo.sc"],
+        "cache.####.bgeo.sc",
+        "bgeo.sc",
+        ".bgeo.sc",
+    ),
+    (
+        ["render_1001_beauty.exr", "render_1002_beauty.exr"],
+        "render_####_beauty.exr",
+        "exr",
+        "_beauty.exr",
+    ),
+    (
+        ["render.1001.jp2", "render.1002.jp2"],
+        "render.####.jp2",
+        "jp2",
+        ".jp2",
+    ),
+])
+def test_deliver_sequence_name_shapes(tmpdir, filenames, src_name, ext, tail):
+    src_dir = tmpdir.mkdir("src")
+    for filename in filenames:
+        src_dir.join(filename).write(filename)
+    dst_dir = str(tmpdir.join("dst"))
+
+    report_items, uploaded = deliver_sequence(
+        os.path.join(str(src_dir), src_name),
+        {"_id": "repre_id", "context": {"ext": ext}},
+        _Anatomy(),
+        "seq",
+        {"dst_dir": dst_dir, "asset": "sh010", "tail": tail},
+        None,
+        collections.defaultdict(list),
+        logging.getLogger("test_delivery"),
+    )
+
+    assert not report_items
+    assert uploaded == 2
+    assert sorted(os.listdir(dst_dir)) == [
+        "sh010.1001{}".format(tail),
+        "sh010.1002{}".format(tail),
+    ]
@@ -27,3 +27,151 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def test_render_output_jobs_parallel_order(tmpdir):
+    """New representations are added in order of output jobs."""
+    import sys
+    import pyblish.api
+
+    context = pyblish.api.Context()
+    context.data["cleanupFullPaths"] = []
+    instance = context.create_instance("review")
+    instance.data["representations"] = []
+
+    output_jobs = []
+    for idx, delay in enumerate((0.3, 0.1, 0.0)):
+        output_jobs.append({
+            "new_repres": [{
+                "name": "output{}".format(idx),
+                "files": "output{}.mov".format(idx),
+                "stagingDir": str(tmpdir),
+            }],
+            "subprcs_cmd": "\"{}\" -c \"import time; time.sleep({})\"".format(
+                sys.executable, delay
+            ),
+            "files_to_clean": [],
+        })
+
+    plugin = ExtractReview()
+    plugin.max_parallel_outputs = 3
+    assert plugin._get_parallel_workers(output_jobs) == 3
+    plugin._render_output_jobs(instance, output_jobs)
+
+    assert [
+        repre["name"]
+        for repre in instance.data["representations"]
+    ] == ["output0", "output1", "output2"]
+    assert len(context.data["cleanupFullPaths"]) == 3
+
+
+def test_merge_output_jobs_single_decode(monkeypatch):
+    """Outputs of same input are rendered by one ffmpeg process."""
+    from openpype.plugins.publish import extract_review
+
+    monkeypatch.setattr(
+        extract_review, "get_ffmpeg_tool_args", lambda *args: ["ffmpeg"]
+    )
+    input_args = ["-y", "-i", "input.%04d.exr", "-i \"audio.wav\""]
+    output_jobs = []
+    for idx, video_filters in enumerate((
+        ["scale=1920:1080"],
+        [],
+        ["scale=960:540", "[0:v]pad=1000:600[bg]"],
+    )):
+        output_jobs.append({
+            "new_repres": [{"name": "output{}".format(idx)}],
+            "subprcs_cmd": None,
+            "ffmpeg_parts": (
+                input_args,
+                video_filters,
+                ["volume=0.5"],
+                ["-codec:v h264", "output{}.mp4".format(idx)],
+            ),
+            "files_to_clean": ["file{}".format(idx)],
+        })
+
+    plugin = ExtractReview()
+    merged_jobs = plugin._merge_output_jobs(output_jobs)
+
+    # Count of ffmpeg processes (decodes of input) drops from 3 to 2
+    assert len(merged_jobs) == 2
+    merged_job, separate_job = merged_jobs
+    assert separate_job is output_jobs[2]
+    assert [repre["name"] for repre in merged_job["new_repres"]] == [
+        "output0", "output1"
+    ]
+    assert merged_job["files_to_clean"] == ["file0", "file1"]
+
+    cmd = merged_job["subprcs_cmd"]
+    assert cmd.count(" -i ") == 2
+    assert (
+        "[0:v]split=2[split0][split1];"
+        "[split0]scale=1920:1080[out0];"
+        "[split1]null[out1]"
+    ) in cmd
+    assert cmd.count("-map 1:a") == 2
+    assert cmd.index("output0.mp4") < cmd.index("-map \"[out1]\"")
+    for repre in merged_job["new_repres"]:
+        assert repre["ffmpeg_cmd"] == cmd
+
+
+def test_merge_output_jobs_keeps_input_audio(monkeypatch):
+    """Audio of video container input is mapped to merged outputs."""
+    from openpype.plugins.publish import extract_review
+
+    monkeypatch.setattr(
+        extract_review, "get_ffmpeg_tool_args", lambda *args: ["ffmpeg"]
+    )
+    input_args = ["-y", "-i \"input.mov\""]
+    output_jobs = []
+    for idx in range(2):
+        output_jobs.append({
+            "new_repres": [{"name": "output{}".format(idx)}],
+            "subprcs_cmd": None,
+            "ffmpeg_parts": (
+                input_args,
+                ["scale=1920:1080"],
+                ["volume=0.5"],
+                ["-codec:v h264", "output{}.mp4".format(idx)],
+            ),
+            "files_to_clean": [],
+        })
+
+    plugin = ExtractReview()
+    merged_jobs = plugin._merge_output_jobs(output_jobs)
+    assert len(merged_jobs) == 1
+
+    cmd = merged_jobs[0]["subprcs_cmd"]
+    assert cmd.count("-map 0:a?") == 2
+    assert cmd.count("-filter:a \"volume=0.5\"") == 2
+    assert "-map 1:a" not in cmd
+    assert cmd.index("-map 0:a?") < cmd.index("output0.mp4")
+
+
+def test_fill_sequence_gaps_links(tmpdir):
+    """Gaps are filled by links of nearest previous frame."""
+    import os
+
+    staging_dir = str(tmpdir)
+    files = ["render.1001.exr", "render.1004.exr"]
+    for filename in files:
+        with open(os.path.join(staging_dir, filename), "w") as stream:
+            stream.write(filename)
+
+    plugin = ExtractReview()
+    added_files = plugin.fill_sequence_gaps(files, staging_dir, 1001, 1005)
+
+    assert sorted(os.path.basename(path) for path in added_files) == [
+        "render.1002.exr", "render.1003.exr", "render.1005.exr"
+    ]
+    src_stat = os.stat(os.path.join(staging_dir, "render.1001.exr"))
+    added_stat = os.stat(os.path.join(staging_dir, "render.1002.exr"))
+    assert src_stat.st_ino == added_stat.st_ino
+    with open(os.path.join(staging_dir, "render.1005.exr")) as stream:
+        assert stream.read() == "render.1004.exr"
+
+    # Filling gaps again replaces existing links
+    assert len(
+        plugin.fill_sequence_gaps(files, staging_dir, 1001, 1005)
+    ) == 3
@@ -0,0 +1,37 @@
+import os
+
+from openpype.settings import lib
+
+
+def test_default_settings_cache(tmpdir, monkeypatch):
+    cache_path = os.path.join(str(tmpdir), "cache", "defaults.json")
+    data = {"system_settings": {"general": {"studio_name": "Studio"}}}
+
+    assert lib._read_default_settings_cache(cache_path, "abc") is None
+
+    lib._write_default_settings_cache(cache_path, "abc", data)
+    assert lib._read_default_settings_cache(cache_path, "abc") == data
+    assert lib._read_default_settings_cache(cache_path, "other") is None
+
+    # Corrupted data must not be used
+    with open(cache_path, "ab") as stream:
+        stream.write(b" ")
+    assert lib._read_default_settings_cache(cache_path, "abc") is None
+
+
+def test_default_settings_loaded_from_cache(tmpdir, monkeypatch):
+    calls = []
+
+    def _get_default_settings():
+        calls.append(True)
+        return {"project_settings": {"global": {}}}
+
+    monkeypatch.setenv("OPENPYPE_SETTINGS_CACHE_DIR", str(tmpdir))
+    monkeypatch.setattr(
+        lib, "_get_default_settings_fingerprint", lambda: "fingerprint")
+    monkeypatch.setattr(lib, "_get_default_settings", _get_default_settings)
+
+    first = lib._load_default_settings()
+    second = lib._load_default_settings()
+    assert first == second
+    assert len(calls) == 1
@@ -0,0 +1,66 @@
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.snapshot import SettingsSnapshot
+
+
+def test_snapshot_is_read_only():
+    data = {"global": {"profiles": [{"hosts": ["maya"]}]}}
+    snapshot = SettingsSnapshot(data)
+
+    profiles = snapshot["global"]["profiles"]
+    assert profiles[0]["hosts"][0] == "maya"
+    assert snapshot == data
+
+    with pytest.raises(TypeError):
+        snapshot["global"] = {}
+
+    mutable = snapshot["global"].to_mutable()
+    mutable["profiles"].append({})
+    assert len(data["global"]["profiles"]) == 1
+
+
+def test_project_settings_snapshot_cache(monkeypatch):
+    calls = []
+    overrides = {"global": {"value": 1}}
+
+    def _get_studio_overrides(return_version=False):
+        return {}, "1.0.0"
+
+    def _get_project_overrides(project_name, return_version=False):
+        calls.append(project_name)
+        return {"global": dict(overrides["global"])}, "1.0.0"
+
+    monkeypatch.setattr(
+        lib, "get_studio_project_settings_overrides", _get_studio_overrides)
+    monkeypatch.setattr(
+        lib, "get_project_settings_overrides", _get_project_overrides)
+    monkeypatch.setattr(
+        lib, "_DEFAULT_SETTINGS", {
+            lib.PROJECT_SETTINGS_KEY: {"global": {"value": 0, "other": 2}}
+        }
+    )
+    monkeypatch.setattr(lib, "_PROJECT_SETTINGS_SNAPSHOTS", {})
+
+    first = lib._get_project_settings_snapshot("test", exclude_locals=True)
+    second = lib._get_project_settings_snapshot("test", exclude_locals=True)
+    assert first is second
+    assert first["global"]["value"] == 1
+    assert len(calls) == 1
+
+    # Outdated snapshot with same overrides is reused
+    lib.reset_project_settings_snapshots()
+    third = lib._get_project_settings_snapshot("test", exclude_locals=True)
+    assert third is first
+    assert len(calls) == 2
+
+    # Changed overrides create new snapshot
+    overrides["global"]["value"] = 3
+    lib.reset_project_settings_snapshots()
+    fourth = lib._get_project_settings_snapshot("test", exclude_locals=True)
+    assert fourth is not first
+    assert fourth["global"]["value"] == 3
+
+    mutable = lib._get_project_settings("test", exclude_locals=True)
+    mutable["global"]["value"] = 5
+    assert fourth["global"]["value"] == 3
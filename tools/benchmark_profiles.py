@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Compare 'filter_profiles' with 'ProfilesIndex' on default settings.
+
+All profiles lists from default global project settings are filtered with
+every combination of values used in their filter keys. Index is created
+once per profiles list and queried repeatedly the same way as settings are
+used during publishing.
+
+Example:
+    python tools/benchmark_profiles.py --repeats 20
+"""
+import os
+import sys
+import time
+import argparse
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--repeats", type=int, default=10, help="Repeats of all queries."
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from openpype.lib.profiles_filtering import (
+        filter_profiles,
+        ProfilesIndex,
+    )
+    from tests.lib.profiles import (
+        get_default_profiles,
+        get_key_values_combinations,
+    )
+
+    key_values_by_profiles = [
+        (profiles, list(get_key_values_combinations(profiles)))
+        for profiles in get_default_profiles()
+    ]
+
+    start = time.time()
+    for _ in range(args.repeats):
+        for profiles, key_values_items in key_values_by_profiles:
+            for key_values in key_values_items:
+                filter_profiles(profiles, key_values)
+    filter_duration = time.time() - start
+
+    start = time.time()
+    indexes = [
+        (ProfilesIndex(profiles), key_values_items)
+        for profiles, key_values_items in key_values_by_profiles
+    ]
+    for _ in range(args.repeats):
+        for index, key_values_items in indexes:
+            for key_values in key_values_items:
+                index.filter(key_values)
+    index_duration = time.time() - start
+
+    print((
+        "filter_profiles: {:.4f}s | ProfilesIndex: {:.4f}s | {:.1f}x"
+    ).format(
+        filter_duration,
+        index_duration,
+        filter_duration / max(index_duration, 0.000001)
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Measure startup time of OpenPype console commands.
+
+Each command is launched repeatedly with lazy modules loading disabled and
+enabled ('OPENPYPE_LAZY_MODULES'). Modules manifest is created by first
+launch with lazy loading enabled, that launch is not measured.
+
+Example:
+    python tools/benchmark_startup.py --repeats 5
+    python tools/benchmark_startup.py -- module --help
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+DEFAULT_COMMANDS = [
+    ["module", "--help"],
+    ["publish", "--help"],
+]
+
+
+def _get_executable_args(executable):
+    if executable:
+        return [executable]
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return [sys.executable, os.path.join(repo_root, "start.py")]
+
+
+def _run(args, lazy):
+    env = dict(os.environ)
+    env["OPENPYPE_LAZY_MODULES"] = "1" if lazy else "0"
+    start = time.time()
+    subprocess.call(
+        args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return time.time() - start
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Launches of each command."
+    )
+    parser.add_argument(
+        "--executable",
+        help="Path to 'openpype_console', 'start.py' is used by default."
+    )
+    parser.add_argument(
+        "command", nargs="*", help="Command to measure."
+    )
+    args = parser.parse_args()
+
+    executable_args = _get_executable_args(args.executable)
+    commands = DEFAULT_COMMANDS
+    if args.command:
+        commands = [args.command]
+
+    print("{:<30} {:>12} {:>12}".format("Command", "Eager [s]", "Lazy [s]"))
+    for command in commands:
+        command_args = executable_args + command
+        # Make sure manifest is created
+        _run(command_args, True)
+        durations = {}
+        for lazy in (False, True):
+            durations[lazy] = _median([
+                _run(command_args, lazy)
+                for _ in range(args.repeats)
+            ])
+        print("{:<30} {:>12.3f} {:>12.3f}".format(
+            " ".join(command), durations[False], durations[True]
+        ))
+
+
+if __name__ == "__main__":
+    main()